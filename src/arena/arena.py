@@ -13,6 +13,7 @@ from threadsafe_alpha_beta import threadsafe_AI
 
 from checkers import *
 from heuristic import *
+from position import Position
 from util.helpers import *
 
 NET_TRIALS = 300
@@ -93,7 +94,7 @@ def PLAY_TUNE(
                 ["KB6", "KF2"], ["KD6", "KE5", "KF4"]
             )
 
-    current_player = who_moves_first
+    position = Position(WP, BP, K, who_moves_first)
     move_count = 0
     game_over = False
     local_move_lim = MAX_MOVES
@@ -102,7 +103,8 @@ def PLAY_TUNE(
         local_move_lim = 50
 
     while move_count < local_move_lim and not game_over:
-        legal_moves = generate_legal_moves(WP, BP, K, current_player)
+        current_player = position.turn
+        legal_moves = position.legal_moves()
 
         if not legal_moves:
             game_over = True
@@ -113,7 +115,7 @@ def PLAY_TUNE(
             best_move = legal_moves[0]
         else:
             best_move, depth_reached = threadsafe_AI(
-                (WP, BP, K),
+                tuple(position),
                 current_player,
                 max_depth=max_depth,
                 time_limit=TIME_LIMIT,
@@ -127,26 +129,26 @@ def PLAY_TUNE(
             game_over = True
             break
 
-        WP, BP, K = do_move(WP, BP, K, best_move, current_player)
-        current_player = switch_player(current_player)
+        position = position.play(best_move)
         move_count += 1
 
+    white_men, white_kings, black_men, black_kings = position.piece_counts
     result = {
-        "winner": None if not game_over else switch_player(current_player).name,
-        "white_men_left": count_bits(WP & ~K),
-        "white_kings_left": count_bits(WP & K),
-        "black_men_left": count_bits(BP & ~K),
-        "black_kings_left": count_bits(BP & K),
+        "winner": None if not game_over else switch_player(position.turn).name,
+        "white_men_left": white_men,
+        "white_kings_left": white_kings,
+        "black_men_left": black_men,
+        "black_kings_left": black_kings,
         "move_count": move_count,
     }
 
     if not game_over:
         result = {
             "winner": "DRAW",
-            "white_men_left": count_bits(WP & ~K),
-            "white_kings_left": count_bits(WP & K),
-            "black_men_left": count_bits(BP & ~K),
-            "black_kings_left": count_bits(BP & K),
+            "white_men_left": white_men,
+            "white_kings_left": white_kings,
+            "black_men_left": black_men,
+            "black_kings_left": black_kings,
             "move_count": move_count,
         }
 
@@ -1,35 +1,135 @@
+import math
+import multiprocessing
+import os
 import pathlib
-import signal
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 parent = pathlib.Path(__file__).parent.parent.absolute()
 sys.path.append(str(parent))
 
 from checkers import *
 from checkers import PlayerTurn, do_move, generate_legal_moves
-from heuristic import evolve_base_B, new_heuristic, old_heuristic
+from time_control import POLL_INTERVAL, TimeControl, TimeOutException
 
 global NC
 NC = 0
 
+HEURISTICS = ("new_heuristic", "old_heuristic", "evolve_base_B")
 
-class TimeOutException(Exception):
-    pass
+# Move and WHITE-relative score of the last completed iteration of threadsafe_AI.
+SEARCH_INFO = {}
+
+# Persistent pool for search="root_split": started on first use and kept warm for the whole
+# game, so the process startup cost is paid once. ROOT_BOUND is [score, root move index] of
+# the best root move so far in the current iteration, shared with every worker.
+ROOT_POOL = None
+ROOT_BOUND = None
+_root_bound = None  # ROOT_BOUND as seen inside a worker
+
+
+def _init_root_worker(shared_bound):
+    global _root_bound
+    _root_bound = shared_bound
+
+
+def get_root_pool(workers=None):
+    """
+    Returns the root-splitting pool, starting it with the given number of workers
+    (default: one per CPU core) if it is not running yet.
+    """
+    global ROOT_POOL, ROOT_BOUND
+    if ROOT_POOL is None:
+        ROOT_BOUND = multiprocessing.Array("d", 2)
+        ROOT_POOL = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_init_root_worker,
+            initargs=(ROOT_BOUND,),
+        )
+    return ROOT_POOL
+
+
+def shutdown_root_pool():
+    global ROOT_POOL, ROOT_BOUND
+    if ROOT_POOL is not None:
+        ROOT_POOL.shutdown(cancel_futures=True)
+        ROOT_POOL = ROOT_BOUND = None
+
+
+class RootWindow:
+    """
+    Worker-side view of ROOT_BOUND while one root move is searched. narrow() is called at
+    every node and tightens its window to the best root score published so far, re-read
+    every poll_interval nodes, so improvements found by other workers reach a running search.
+
+    A bound published by a later root move is nudged by one ulp, so a move scoring the same
+    as a later one still gets an exact score and wins the tie, as in the serial loop.
+    """
+
+    def __init__(self, shared_bound, move_index, maximizing, poll_interval=POLL_INTERVAL):
+        self.shared_bound = shared_bound
+        self.move_index = move_index
+        self.maximizing = maximizing
+        self.poll_interval = poll_interval
+        self.countdown = poll_interval
+        self.refresh()
+
+    def refresh(self):
+        with self.shared_bound.get_lock():
+            score, index = self.shared_bound[0], self.shared_bound[1]
+        if index > self.move_index:
+            score = math.nextafter(score, -math.inf if self.maximizing else math.inf)
+        self.bound = score
+
+    def narrow(self, alpha, beta):
+        self.countdown -= 1
+        if self.countdown <= 0:
+            self.countdown = self.poll_interval
+            self.refresh()
+        if self.maximizing:
+            return max(alpha, self.bound), beta
+        return alpha, min(beta, self.bound)
+
+    def is_exact(self, score) -> bool:
+        """
+        True if score is inside every window the search used (not a fail low or fail high).
+        """
+        return score > self.bound if self.maximizing else score < self.bound
+
+    def publish(self, score):
+        """
+        Stores an exact score in ROOT_BOUND if it beats the bound, or ties it from an
+        earlier root move.
+        """
+        with self.shared_bound.get_lock():
+            best, index = self.shared_bound[0], self.shared_bound[1]
+            better = score > best if self.maximizing else score < best
+            if better or (score == best and self.move_index < index):
+                self.shared_bound[0] = score
+                self.shared_bound[1] = self.move_index
+
+
+def get_heuristic(name):
+    """
+    Returns the heuristic function with the given name from heuristic.py, imported on first
+    use so this module loads even when one of the named heuristics is missing there.
+    """
+    if name not in HEURISTICS:
+        raise ValueError("Invalid heuristic function specified")
+    import heuristic
+
+    heuristic_function = getattr(heuristic, name, None)
+    if heuristic_function is None:
+        raise ValueError(f"heuristic.py has no {name}: pass the heuristic as a function")
+    return heuristic_function
 
 
 def sort_moves_by_heuristic(legal_moves, position, current_player, heuristic):
     if not legal_moves or legal_moves == []:
         return None
     if isinstance(heuristic, str):
-        if heuristic == "new_heuristic":
-            heuristic_function = new_heuristic
-        elif heuristic == "old_heuristic":
-            heuristic_function = old_heuristic
-        elif heuristic == "evolve_base_B":
-            heuristic_function = evolve_base_B
-        else:
-            raise ValueError("Invalid heuristic function specified")
+        heuristic_function = get_heuristic(heuristic)
 
         move_evaluations = [
             (
@@ -60,7 +160,40 @@ def sort_moves_by_heuristic(legal_moves, position, current_player, heuristic):
     return sorted_moves
 
 
-def minimax(position, depth, alpha, beta, current_player, heuristic="evolve_base_B"):
+def evaluate(position, current_player, legal_moves, heuristic):
+    """
+    Static evaluation (WHITE-relative) of a non-terminal leaf with the given heuristic.
+    """
+    if isinstance(heuristic, str):
+        # Here we reach the maximum depth, so we evaluate the position using the heuristic function
+        heuristic_function = get_heuristic(heuristic)
+        if heuristic == "evolve_base_B":
+            return heuristic_function(
+                *position,
+                turn=current_player,
+                num_moves=len(legal_moves),
+            )
+        return heuristic_function(*position, turn=current_player)
+    elif callable(heuristic):
+        # Directly use the callable heuristic function
+        return heuristic(*position, turn=current_player)
+
+
+def minimax(
+    position,
+    depth,
+    alpha,
+    beta,
+    current_player,
+    heuristic="evolve_base_B",
+    time_control=None,
+    root_window=None,
+):
+    if time_control is not None:
+        time_control.check()
+    if root_window is not None:  # root_split: narrowed to the best root score so far
+        alpha, beta = root_window.narrow(alpha, beta)
+
     legal_moves = generate_legal_moves(*position, current_player)
 
     # Check if the game has ended (either by reaching a terminal state or by reaching the maximum depth)
@@ -78,29 +211,22 @@ def minimax(position, depth, alpha, beta, current_player, heuristic="evolve_base
             else:
                 return 1_000_000 - (depth * 1_000)
         else:
-            if isinstance(heuristic, str):
-                # Here we reach the maximum depth, so we evaluate the position using the heuristic function
-                if heuristic == "new_heuristic":
-                    return new_heuristic(*position, turn=current_player)
-                elif heuristic == "old_heuristic":
-                    return old_heuristic(*position, turn=current_player)
-                elif heuristic == "evolve_base_B":
-                    return evolve_base_B(
-                        *position,
-                        turn=current_player,
-                        num_moves=len(legal_moves),
-                    )
-                else:
-                    raise ValueError("Invalid heuristic function specified")
-            elif callable(heuristic):
-                # Directly use the callable heuristic function
-                return heuristic(*position, turn=current_player)
+            return evaluate(position, current_player, legal_moves, heuristic)
 
     if current_player == PlayerTurn.WHITE:
         max_eval = float("-inf")
         for move in legal_moves:
             new_position = do_move(*position, move, current_player)
-            eval = minimax(new_position, depth - 1, alpha, beta, PlayerTurn.BLACK)
+            eval = minimax(
+                new_position,
+                depth - 1,
+                alpha,
+                beta,
+                PlayerTurn.BLACK,
+                heuristic,
+                time_control,
+                root_window,
+            )
             max_eval = max(max_eval, eval)
             alpha = max(alpha, eval)
             if beta <= alpha:
@@ -110,7 +236,16 @@ def minimax(position, depth, alpha, beta, current_player, heuristic="evolve_base
         min_eval = float("inf")
         for move in legal_moves:
             new_position = do_move(*position, move, current_player)
-            eval = minimax(new_position, depth - 1, alpha, beta, PlayerTurn.WHITE)
+            eval = minimax(
+                new_position,
+                depth - 1,
+                alpha,
+                beta,
+                PlayerTurn.WHITE,
+                heuristic,
+                time_control,
+                root_window,
+            )
             min_eval = min(min_eval, eval)
             beta = min(beta, eval)
             if beta <= alpha:
@@ -118,6 +253,113 @@ def minimax(position, depth, alpha, beta, current_player, heuristic="evolve_base
         return min_eval
 
 
+def pvs(
+    position,
+    depth,
+    alpha,
+    beta,
+    current_player,
+    heuristic="evolve_base_B",
+    time_control=None,
+):
+    """
+    Principal Variation Search in negamax form; scores are relative to the side to move.
+    Raises TimeOutException once time_control runs out.
+        Output: (score, principal variation as a list of moves)
+    """
+    if time_control is not None:
+        time_control.check()
+
+    legal_moves = generate_legal_moves(*position, current_player)
+    sign = 1 if current_player == PlayerTurn.WHITE else -1
+
+    if depth == 0 or not legal_moves:
+        global NC
+        NC += 1
+        if not legal_moves:  # the side to move has lost
+            return -1 * (1_000_000 - (depth * 1_000)), []
+        return sign * evaluate(position, current_player, legal_moves, heuristic), []
+
+    best_score = float("-inf")
+    best_pv = []
+    for move_index, move in enumerate(legal_moves):
+        new_position = do_move(*position, move, current_player)
+        opponent = switch_player(current_player)
+        if move_index == 0:
+            score, child_pv = pvs(
+                new_position,
+                depth - 1,
+                -beta,
+                -alpha,
+                opponent,
+                heuristic,
+                time_control,
+            )
+            score = -score
+        else:  # null-window scout, full re-search only on a fail high inside the window
+            score, child_pv = pvs(
+                new_position,
+                depth - 1,
+                -alpha - 1,
+                -alpha,
+                opponent,
+                heuristic,
+                time_control,
+            )
+            score = -score
+            if alpha < score < beta:
+                score, child_pv = pvs(
+                    new_position,
+                    depth - 1,
+                    -beta,
+                    -score,
+                    opponent,
+                    heuristic,
+                    time_control,
+                )
+                score = -score
+
+        if score > best_score:
+            best_score = score
+            best_pv = [move] + child_pv
+        alpha = max(alpha, score)
+        if alpha >= beta:
+            break
+
+    return best_score, best_pv
+
+
+def _search_root_move(
+    position, move_index, move, depth, current_player, heuristic, deadline
+):
+    """
+    Worker side of search="root_split": searches one root move inside the shared bound
+    (see RootWindow) and publishes the score if it is exact and beats the bound.
+        Output: (move, WHITE-relative score, exact) or (move, None, False) if time ran out
+    """
+    time_control = TimeControl(deadline - time.time())  # wall clock: shared by processes
+    root_window = RootWindow(_root_bound, move_index, current_player == PlayerTurn.WHITE)
+
+    try:
+        score = minimax(
+            do_move(*position, move, current_player),
+            depth - 1,
+            float("-inf"),
+            float("inf"),
+            switch_player(current_player),
+            heuristic,
+            time_control,
+            root_window,
+        )
+    except TimeOutException:
+        return move, None, False
+
+    exact = root_window.is_exact(score)
+    if exact:
+        root_window.publish(score)
+    return move, score, exact
+
+
 def threadsafe_AI(
     position,
     current_player,
@@ -125,11 +367,24 @@ def threadsafe_AI(
     time_limit=5,
     heuristic="evolve_base_B",
     early_stop_depth=100,  # Stop if no improvement for 'early_stop_depth' consecutive depths
+    search="minimax",  # "minimax", "pvs" or "root_split"
+    workers=None,  # root_split pool size, default: one per CPU core
 ):
+    """
+    search="root_split" hands every root move to the persistent process pool (see
+    get_root_pool). Workers keep re-reading the best root score so far from ROOT_BOUND while
+    they search and publish improvements to it, so every running root move is searched with
+    a tighter window. Only exact scores are compared, ties going to the earlier root move,
+    so the chosen move is the serial one.
+    """
+    if search not in ("minimax", "pvs", "root_split"):
+        raise ValueError("Invalid search mode specified")
+    SEARCH_INFO.clear()
+
     best_move = None
     best_score = float("-inf") if current_player == PlayerTurn.WHITE else float("inf")
     depth_reached = 0
-    start_time = time.time()
+    time_control = TimeControl(time_limit)
 
     score_at_depth = {}  # Track the best score at each depth
     depth_without_improvement = 0  # Track depth levels without score improvement
@@ -150,36 +405,89 @@ def threadsafe_AI(
                 return None, depth
 
             is_improved = False  # Flag to check if this depth provides a better score
-            for move in legal_moves:
-                if time.time() - start_time >= time_limit:
-                    raise TimeOutException()
-
-                new_position = do_move(*position, move, current_player)
-                score = minimax(
-                    new_position,
-                    depth - 1,
+            if search == "pvs":
+                score, pv = pvs(
+                    position,
+                    depth,
                     alpha,
                     beta,
-                    switch_player(current_player),
+                    current_player,
                     heuristic,
+                    time_control=time_control,
                 )
+                if current_player != PlayerTurn.WHITE:
+                    score = -score  # WHITE-relative, like minimax
+                is_improved = (
+                    current_player == PlayerTurn.WHITE and score > best_score
+                ) or (current_player != PlayerTurn.WHITE and score < best_score)
+                best_score = score
+                best_move = pv[0]
+            elif search == "root_split":
+                pool = get_root_pool(workers)
+                ROOT_BOUND[0] = (
+                    float("-inf") if current_player == PlayerTurn.WHITE else float("inf")
+                )
+                ROOT_BOUND[1] = -1  # no root move yet
+                deadline = time.time() + time_limit - time_control.elapsed()
+                futures = [
+                    pool.submit(
+                        _search_root_move,
+                        position,
+                        move_index,
+                        move,
+                        depth,
+                        current_player,
+                        heuristic,
+                        deadline,
+                    )
+                    for move_index, move in enumerate(legal_moves)
+                ]
+                try:
+                    for future in futures:  # in root move order: ties keep the earlier move
+                        move, score, exact = future.result()
+                        if score is None:
+                            raise TimeOutException()
+                        if not exact:
+                            continue  # failed low against a bound from another root move
+                        if (
+                            current_player == PlayerTurn.WHITE and score > best_score
+                        ) or (current_player != PlayerTurn.WHITE and score < best_score):
+                            best_score = score
+                            best_move = move
+                            is_improved = True
+                finally:
+                    for future in futures:
+                        future.cancel()
+            else:
+                for move in legal_moves:
+                    new_position = do_move(*position, move, current_player)
+                    score = minimax(
+                        new_position,
+                        depth - 1,
+                        alpha,
+                        beta,
+                        switch_player(current_player),
+                        heuristic,
+                        time_control,
+                    )
 
-                if (current_player == PlayerTurn.WHITE and score > best_score) or (
-                    current_player != PlayerTurn.WHITE and score < best_score
-                ):
-                    best_score = score
-                    best_move = move
-                    is_improved = True
+                    if (current_player == PlayerTurn.WHITE and score > best_score) or (
+                        current_player != PlayerTurn.WHITE and score < best_score
+                    ):
+                        best_score = score
+                        best_move = move
+                        is_improved = True
 
-                if current_player == PlayerTurn.WHITE:
-                    alpha = max(alpha, score)
-                else:
-                    beta = min(beta, score)
+                    if current_player == PlayerTurn.WHITE:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
 
-                if beta <= alpha:
-                    break
+                    if beta <= alpha:
+                        break
 
             score_at_depth[depth] = best_score
+            SEARCH_INFO.update(depth=depth, move=best_move, score=best_score)
             if is_improved:
                 depth_without_improvement = 0  # Reset counter if score improved
             else:
@@ -0,0 +1,386 @@
+import os
+import pathlib
+import random
+import sys
+import time
+import timeit
+
+parent = pathlib.Path(__file__).parent.absolute()
+sys.path.append(str(parent))
+
+import minimax_alphabeta
+from checkers import *
+from lazy_smp import lazy_smp_AI
+from minimax_alphabeta import AI
+from move_ordering import MoveOrderer
+from perft import CAPTURE_POSITIONS, KING_POSITIONS, perft
+from util.bitboard import *
+from ybwc import get_ybwc_pool, shutdown_ybwc_pool, ybwc_AI
+from util.fen_pdn_helper import setup_board_from_position_lists
+from util.helpers import *
+
+SAMPLE_BOARDS_DIR = parent.parent / "ECE-469" / "boards"
+
+
+def load_sample_positions():
+    """
+    Returns a list of (name, position, player) for the fresh board and every sample board.
+    """
+    positions = [("fresh", get_fresh_board(), PlayerTurn.BLACK)]
+    for board_file in sorted(SAMPLE_BOARDS_DIR.glob("*.txt")):
+        WP, BP, K, current_player, _ = load_game_from_sable_file(board_file)
+        player = PlayerTurn.BLACK if current_player == 1 else PlayerTurn.WHITE
+        positions.append((board_file.stem, (WP, BP, K), player))
+    return positions
+
+
+def time_to_depth(position, player, depth, seed=0, **ai_kwargs):
+    """
+    Runs iterative deepening up to a fixed depth and returns (seconds, nodes).
+    """
+    random.seed(seed)  # the evaluators add noise; keep runs comparable
+    minimax_alphabeta.NC = 0
+    start = time.time()
+    AI(
+        position,
+        player,
+        max_depth=depth,
+        time_limit=3600,
+        global_board_state=position,
+        **ai_kwargs,
+    )
+    return time.time() - start, minimax_alphabeta.NC
+
+
+def compare_transposition_table(depth=6, tt_size_mb=16):
+    """
+    Prints time-to-depth on the sample positions with and without the transposition table.
+    """
+    rows = []
+    for name, position, player in load_sample_positions():
+        plain_time, plain_nodes = time_to_depth(position, player, depth, tt_size_mb=0)
+        tt_time, tt_nodes = time_to_depth(
+            position, player, depth, tt_size_mb=tt_size_mb
+        )
+        rows.append((name, plain_time, plain_nodes, tt_time, tt_nodes))
+
+    print(f"\nTime to depth {depth} (tt_size_mb={tt_size_mb})")
+    print(f"{'board':<12}{'no TT (s)':>12}{'nodes':>10}{'TT (s)':>12}{'nodes':>10}")
+    for name, plain_time, plain_nodes, tt_time, tt_nodes in rows:
+        print(
+            f"{name:<12}{plain_time:>12.2f}{plain_nodes:>10}{tt_time:>12.2f}{tt_nodes:>10}"
+        )
+
+
+def compare_move_ordering(depth=8, eval_sort_min_depths=(0, 3, 5, 99)):
+    """
+    Prints time-to-depth and the cutoff-on-first-move rate over the sample positions for
+    different eval_sort_min_depth settings (0 sorts every interior node by static evaluation).
+    """
+    print(f"\nMove ordering, time to depth {depth} over all sample positions")
+    print(f"{'eval sort >=':<14}{'time (s)':>10}{'nodes':>10}{'1st-move cutoffs':>18}")
+    for eval_sort_min_depth in eval_sort_min_depths:
+        total_time, total_nodes, cutoff_nodes, first_move_cutoffs = 0, 0, 0, 0
+        for _, position, player in load_sample_positions():
+            move_orderer = MoveOrderer(eval_sort_min_depth=eval_sort_min_depth)
+            seconds, nodes = time_to_depth(
+                position, player, depth, move_orderer=move_orderer
+            )
+            total_time += seconds
+            total_nodes += nodes
+            cutoff_nodes += move_orderer.cutoff_nodes
+            first_move_cutoffs += move_orderer.first_move_cutoffs
+        print(
+            f"{eval_sort_min_depth:<14}{total_time:>10.2f}{total_nodes:>10}{first_move_cutoffs / max(1, cutoff_nodes):>18.1%}"
+        )
+
+
+def compare_search_modes(depth=8, modes=("minimax", "pvs")):
+    """
+    Prints nodes and time to a fixed depth on the sample positions for each search mode.
+    """
+    print(f"\nNodes to depth {depth}")
+    print(f"{'board':<12}" + "".join(f"{mode + ' nodes':>16}{'(s)':>8}" for mode in modes))
+    for name, position, player in load_sample_positions():
+        row = f"{name:<12}"
+        for mode in modes:
+            seconds, nodes = time_to_depth(position, player, depth, search=mode)
+            row += f"{nodes:>16}{seconds:>8.2f}"
+        print(row)
+
+
+def depth_in_time(position, player, time_limit, seed=0, search_function=AI, **ai_kwargs):
+    """
+    Runs AI() for the full time_limit (no time allocation) and returns
+    (depth reached, SEARCH_INFO). Pass search_function=lazy_smp_AI to time the parallel search.
+    """
+    random.seed(seed)
+    minimax_alphabeta.NC = 0
+    _, depth_reached = search_function(
+        position,
+        player,
+        time_limit=time_limit,
+        global_board_state=position,
+        manage_time=False,
+        **ai_kwargs,
+    )
+    return depth_reached, dict(minimax_alphabeta.SEARCH_INFO)
+
+
+def compare_aspiration_windows(time_limit=3, windows=(0, 25, 50, 100), growth=4):
+    """
+    Prints the depth reached in a fixed time on the sample positions for several aspiration
+    window sizes (0 = full window), with the re-search frequency for each.
+    """
+    print(f"\nDepth reached in {time_limit}s (aspiration growth x{growth})")
+    print(f"{'board':<12}" + "".join(f"{'window ' + str(w):>16}" for w in windows))
+    for name, position, player in load_sample_positions():
+        row = f"{name:<12}"
+        for window in windows:
+            depth, info = depth_in_time(
+                position,
+                player,
+                time_limit,
+                aspiration_window=window,
+                aspiration_growth=growth,
+            )
+            stats = info.get("aspiration", {})
+            row += f"{depth:>8} ({stats.get('re_searches', 0)}/{stats.get('iterations', 0)})".rjust(16)
+        print(row)
+    print("(re-searches/iterations in parentheses)")
+
+
+def compare_quiescence(depth=6, heuristic="experiment", quiescence_depths=(0, 8)):
+    """
+    Prints time-to-depth with and without capture quiescence search. With quiescence_depth=0
+    the leaves are scored with the capture-threat terms; otherwise those terms are skipped.
+    """
+    print(f"\nQuiescence search, time to depth {depth} with heuristic={heuristic}")
+    print(
+        f"{'board':<12}"
+        + "".join(f"{'q=' + str(q) + ' (s)':>12}{'nodes':>8}{'qnodes':>8}" for q in quiescence_depths)
+    )
+    for name, position, player in load_sample_positions():
+        row = f"{name:<12}"
+        for quiescence_depth in quiescence_depths:
+            minimax_alphabeta.QNC = 0
+            seconds, nodes = time_to_depth(
+                position,
+                player,
+                depth,
+                heuristic=heuristic,
+                quiescence_depth=quiescence_depth,
+            )
+            row += f"{seconds:>12.2f}{nodes:>8}{minimax_alphabeta.QNC:>8}"
+        print(row)
+
+
+def compare_lazy_smp(time_limit=3, max_workers=None):
+    """
+    Prints the depth the main Lazy SMP search reaches in a fixed time on the sample positions
+    for 1, 2, 4, ... up to max_workers processes (defaults to the number of CPU cores).
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= max_workers:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != max_workers:
+        worker_counts.append(max_workers)
+
+    print(f"\nLazy SMP, depth reached in {time_limit}s")
+    print(f"{'board':<12}" + "".join(f"{str(w) + ' workers':>12}" for w in worker_counts))
+    totals = [0] * len(worker_counts)
+    positions = load_sample_positions()
+    for name, position, player in positions:
+        row = f"{name:<12}"
+        for i, workers in enumerate(worker_counts):
+            depth, _ = depth_in_time(
+                position,
+                player,
+                time_limit,
+                search_function=lazy_smp_AI,
+                workers=workers,
+            )
+            totals[i] += depth
+            row += f"{depth:>12}"
+        print(row)
+    print(f"{'mean':<12}" + "".join(f"{total / len(positions):>12.2f}" for total in totals))
+
+
+def compare_root_split(depth=6, workers=None, heuristic="evolve_base_B"):
+    """
+    Prints time-to-depth of threadsafe_AI's serial minimax and root_split modes on the sample
+    positions, with the speedup. The pool is started before timing, as it stays warm in a game.
+    """
+    # The arena module is not on the engine's path, so it is only imported when asked for.
+    sys.path.append(str(parent / "arena"))
+    import threadsafe_alpha_beta
+
+    start = time.time()
+    threadsafe_alpha_beta.get_root_pool(workers)
+    threadsafe_alpha_beta.threadsafe_AI(
+        get_fresh_board(), PlayerTurn.BLACK, 1, heuristic=heuristic, search="root_split"
+    )
+    print(f"\nRoot splitting, time to depth {depth} (pool startup {time.time() - start:.2f}s)")
+    print(f"{'board':<12}{'serial (s)':>12}{'root split (s)':>16}{'speedup':>10}")
+    for name, position, player in load_sample_positions():
+        seconds = []
+        for search in ("minimax", "root_split"):
+            random.seed(0)
+            start = time.time()
+            threadsafe_alpha_beta.threadsafe_AI(
+                position,
+                player,
+                depth,
+                time_limit=3600,
+                heuristic=heuristic,
+                search=search,
+                workers=workers,
+            )
+            seconds.append(time.time() - start)
+        print(f"{name:<12}{seconds[0]:>12.2f}{seconds[1]:>16.2f}{seconds[0] / seconds[1]:>10.2f}")
+    threadsafe_alpha_beta.shutdown_root_pool()
+
+
+def compare_ybwc(depths=range(8, 13), workers=None):
+    """
+    Prints YBWC time-to-depth from the opening, serial (workers=0) and with the worker pool,
+    and the parallel efficiency: serial time / (workers * parallel time).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    position, player = get_fresh_board(), PlayerTurn.BLACK
+    get_ybwc_pool(workers)  # started outside the timings; it stays warm during a game
+
+    print(f"\nYBWC from the opening, {workers} workers")
+    print(f"{'depth':<8}{'serial (s)':>12}{'parallel (s)':>14}{'speedup':>10}{'efficiency':>12}")
+    for depth in depths:
+        seconds = []
+        for pool_workers in (0, workers):
+            random.seed(0)
+            start = time.time()
+            ybwc_AI(
+                position,
+                player,
+                max_depth=depth,
+                time_limit=3600,
+                global_board_state=position,
+                workers=pool_workers,
+            )
+            seconds.append(time.time() - start)
+        speedup = seconds[0] / seconds[1]
+        print(
+            f"{depth:<8}{seconds[0]:>12.2f}{seconds[1]:>14.2f}{speedup:>10.2f}{speedup / workers:>12.1%}"
+        )
+    shutdown_ybwc_pool()
+
+
+def compare_unique_captures(perft_depth=6, depth=8):
+    """
+    Prints perft leaf counts, and search plus quiescence nodes to a fixed depth, on
+    KING_POSITIONS with every capture path as its own move and with the paths that lead to
+    the same position searched once.
+    """
+    print(f"\nPerft {perft_depth} and nodes to depth {depth}, all / unique capture paths")
+    print(
+        f"{'board':<10}{'perft':>10}{'unique':>10}{'nodes':>10}{'unique':>10}{'(s)':>8}{'(s)':>8}"
+    )
+    for name, (white, black, player) in KING_POSITIONS.items():
+        position = setup_board_from_position_lists(white, black)
+        leaves = [
+            perft(*position, player, perft_depth, unique_captures=unique)
+            for unique in (False, True)
+        ]
+        nodes, seconds = [], []
+        for unique in (False, True):
+            minimax_alphabeta.UNIQUE_CAPTURES = unique
+            minimax_alphabeta.QNC = 0
+            search_seconds, search_nodes = time_to_depth(position, player, depth)
+            nodes.append(search_nodes + minimax_alphabeta.QNC)
+            seconds.append(search_seconds)
+        minimax_alphabeta.UNIQUE_CAPTURES = True
+        print(
+            f"{name:<10}{leaves[0]:>10}{leaves[1]:>10}{nodes[0]:>10}{nodes[1]:>10}{seconds[0]:>8.2f}{seconds[1]:>8.2f}"
+        )
+
+
+def compare_bit_primitives(samples=1000, repeat=5):
+    """
+    Prints ns per call of each util.bitboard primitive next to the 32-bit scan it replaced,
+    on random bitboards with about a quarter of the bits set.
+    """
+    rng = random.Random(0)
+    bitboards = [rng.getrandbits(32) & rng.getrandbits(32) for _ in range(samples)]
+
+    def scan_bits(bitboard):  # the old find_set_bits
+        return [index for index in range(32) if (bitboard & (1 << index)) != 0]
+
+    cases = [
+        ("count", lambda bitboard: len(scan_bits(bitboard)), popcount),
+        ("count (table)", lambda bitboard: len(scan_bits(bitboard)), table_popcount),
+        ("indices", scan_bits, bit_indices),
+        ("indices (iter)", scan_bits, lambda bitboard: list(iter_bits(bitboard))),
+        ("lowest", lambda bitboard: (scan_bits(bitboard) or [-1])[0], lowest_bit),
+        ("highest", lambda bitboard: (scan_bits(bitboard) or [-1])[-1], highest_bit),
+    ]
+    print(f"\nBit primitives, ns per call over {samples} random bitboards")
+    print(f"{'primitive':<16}{'scan':>10}{'new':>10}{'speedup':>10}")
+    for name, old, new in cases:
+        times = [
+            min(
+                timeit.repeat(
+                    lambda: [function(bitboard) for bitboard in bitboards],
+                    number=10,
+                    repeat=repeat,
+                )
+            )
+            / (10 * samples)
+            * 1e9
+            for function in (old, new)
+        ]
+        print(f"{name:<16}{times[0]:>10.0f}{times[1]:>10.0f}{times[0] / times[1]:>10.1f}")
+
+
+def compare_padded_layout(depth=7):
+    """
+    Prints perft nodes per second with the 32-square layout and the padded ghost-square
+    layout (tools/padded_board.py) on the fresh board, CAPTURE_POSITIONS and
+    KING_POSITIONS.
+    """
+    # The padded layout lives outside src/, so it is only imported when asked for.
+    sys.path.append(str(parent.parent / "tools"))
+    from padded_board import padded_perft, to_padded
+
+    boards = [("fresh", get_fresh_board(), PlayerTurn.BLACK)]
+    for name, (white, black, player) in CAPTURE_POSITIONS.items():
+        boards.append((name, setup_board_from_position_lists(white, black), player))
+    for name, (white, black, player) in KING_POSITIONS.items():
+        boards.append((name, setup_board_from_position_lists(white, black), player))
+
+    print(f"\nPerft {depth}, 32-square vs padded layout")
+    print(f"{'board':<14}{'nodes':>10}{'32 nps':>12}{'padded nps':>12}{'speedup':>10}")
+    for name, position, player in boards:
+        start = time.perf_counter()
+        nodes = perft(*position, player, depth)
+        seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        padded_nodes = padded_perft(*map(to_padded, position), player, depth)
+        padded_seconds = time.perf_counter() - start
+        assert padded_nodes == nodes, f"{name}: {padded_nodes} != {nodes}"
+        print(
+            f"{name:<14}{nodes:>10}{nodes / seconds:>12.0f}{nodes / padded_seconds:>12.0f}{seconds / padded_seconds:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    compare_bit_primitives()
+    compare_padded_layout()
+    compare_transposition_table()
+    compare_move_ordering()
+    compare_search_modes()
+    compare_aspiration_windows()
+    compare_quiescence()
+    compare_lazy_smp()
+    compare_ybwc()
+    compare_unique_captures()
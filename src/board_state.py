@@ -0,0 +1,127 @@
+from checkers import generate_legal_moves
+from util.bitboard import popcount
+from util.helpers import PlayerTurn
+from util.masks import S
+from util.move_encoding import (
+    CAPTURED_SHIFT,
+    KING_FLAG,
+    PROMOTION_FLAG,
+    SQUARE_BITS,
+    TO_SHIFT,
+    encode_move,
+)
+from util.zobrist import (
+    BLACK_KING_KEYS,
+    BLACK_MAN_KEYS,
+    WHITE_KING_KEYS,
+    WHITE_MAN_KEYS,
+    WHITE_TO_MOVE_KEY,
+    hash_position,
+)
+
+WHITE, BLACK = PlayerTurn.WHITE, PlayerTurn.BLACK
+
+
+class BoardState:
+    """
+    Mutable board for walking the game tree in place.
+
+    make(move) plays a move (tuple/list form or encoded, see util.move_encoding) and
+    unmake() takes back the last one. WP, BP, K, the side to move, the piece counts and the
+    Zobrist key are all updated incrementally; make pushes what unmake needs onto a stack, so
+    no position tuple is built per node. do_move stays the functional way to play a move.
+    """
+
+    def __init__(self, WP, BP, K, turn, key=None):
+        self.WP = WP
+        self.BP = BP
+        self.K = K
+        self.turn = turn
+        self.white_count = popcount(WP)
+        self.black_count = popcount(BP)
+        self.key = hash_position(WP, BP, K, turn) if key is None else key
+        self.history = []  # (encoded move, change to K, key before the move) per move
+
+    @property
+    def position(self):
+        return self.WP, self.BP, self.K
+
+    def legal_moves(self):
+        """
+        Returns the legal moves of the side to move, None if it has none.
+        """
+        return generate_legal_moves(self.WP, self.BP, self.K, self.turn)
+
+    def make(self, move):
+        """
+        Plays the move for the side to move.
+            Output: the move in encoded form
+        """
+        K = self.K
+        white = self.turn is WHITE
+        encoded = move if isinstance(move, int) else encode_move(move, K, self.turn)
+        start_pos, end_pos = encoded & SQUARE_BITS, encoded >> TO_SHIFT & SQUARE_BITS
+        captured = encoded >> CAPTURED_SHIFT
+        moved = S[start_pos] ^ S[end_pos]
+
+        if white:
+            self.WP ^= moved
+            own_man_keys, own_king_keys = WHITE_MAN_KEYS, WHITE_KING_KEYS
+        else:
+            self.BP ^= moved
+            own_man_keys, own_king_keys = BLACK_MAN_KEYS, BLACK_KING_KEYS
+
+        key = self.key
+        king_change = K & captured
+        if encoded & KING_FLAG:
+            king_change ^= moved
+            key ^= own_king_keys[start_pos] ^ own_king_keys[end_pos]
+        elif encoded & PROMOTION_FLAG:
+            king_change ^= S[end_pos]
+            key ^= own_man_keys[start_pos] ^ own_king_keys[end_pos]
+        else:
+            key ^= own_man_keys[start_pos] ^ own_man_keys[end_pos]
+        self.K = K ^ king_change
+        self.history.append((encoded, king_change, self.key))
+
+        if captured:
+            if white:
+                self.BP ^= captured
+                self.black_count -= popcount(captured)
+                opp_man_keys, opp_king_keys = BLACK_MAN_KEYS, BLACK_KING_KEYS
+            else:
+                self.WP ^= captured
+                self.white_count -= popcount(captured)
+                opp_man_keys, opp_king_keys = WHITE_MAN_KEYS, WHITE_KING_KEYS
+            while captured:
+                square = (captured & -captured).bit_length() - 1
+                key ^= opp_king_keys[square] if K & S[square] else opp_man_keys[square]
+                captured &= captured - 1
+
+        self.key = key ^ WHITE_TO_MOVE_KEY
+        self.turn = BLACK if white else WHITE
+        return encoded
+
+    def unmake(self):
+        """
+        Takes back the last move played with make.
+            Output: the move in encoded form
+        """
+        encoded, king_change, self.key = self.history.pop()
+        moved = S[encoded & SQUARE_BITS] ^ S[encoded >> TO_SHIFT & SQUARE_BITS]
+        captured = encoded >> CAPTURED_SHIFT
+        self.K ^= king_change
+
+        if self.turn is BLACK:  # white made the move
+            self.turn = WHITE
+            self.WP ^= moved
+            if captured:
+                self.BP ^= captured
+                self.black_count += popcount(captured)
+        else:
+            self.turn = BLACK
+            self.BP ^= moved
+            if captured:
+                self.WP ^= captured
+                self.white_count += popcount(captured)
+        return encoded
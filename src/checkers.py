@@ -1,71 +1,88 @@
+from util.bitboard import *
 from util.helpers import *
+from util.jump_cache import *
 from util.masks import *
+from util.move_cache import *
+from util.move_encoding import *
+from util.zobrist import *
+
+# Capture trees are looked up here before they are generated when set to a JumpTreeCache.
+# Off by default: generating from the jump tables costs about as much as building the key.
+JUMP_TREE_CACHE = None
+
+# Legal-move lists are looked up here first by cached_legal_moves when set to a
+# LegalMoveCache. Off by default: the search did not measure faster with it.
+LEGAL_MOVE_CACHE = None
 
 
 def do_move(WP, BP, K, moves, player):
     """
     Returns a tuple of the new board state after the given player makes the given move.
+    The move is either in the tuple/list form or encoded with encode_move.
     """
-    if len(moves) == 1:
-        move = [(moves)]
-    else:
-        moves = [(moves[i], moves[i + 1]) for i in range(len(moves) - 1)]
-
-    for move in moves:
-        start_pos, end_pos = move  # Move is a tuple: (start_pos, end_pos)
-
-        # Determine if this is a jump move
-        is_jump = abs(start_pos - end_pos) > 5
+    if isinstance(moves, int):
+        return apply_encoded_move(WP, BP, K, moves, player)
+    return apply_encoded_move(WP, BP, K, encode_move(moves, K, player), player)
 
-        # Create a mask for the starting and ending positions
-        start_mask = (1 << start_pos) & MASK_32
-        end_mask = (1 << end_pos) & MASK_32
 
-        # Update the board based on the player's move
-        if player == PlayerTurn.WHITE:
-            WP = remove_piece(WP, start_pos)
-            WP = insert_piece(WP, end_pos)
+def do_move_hashed(WP, BP, K, moves, player, key, debug=ZOBRIST_DEBUG):
+    """
+    Same as do_move, but also returns the Zobrist key of the resulting position (opponent to move).
+    The key is updated only for the squares the move changes: the origin, the landing square
+    (as a king if the move promotes) and every captured piece, so the cost does not depend on
+    how many pieces are on the board.
+        Input: WP, BP, K, moves, player, key of the position before the move
+        Output: WP, BP, K, key
+    """
+    start_pos, end_pos = moves[0], moves[-1]
+    was_king = K & S[start_pos]
 
-            # If a jump is made, remove the jumped piece from the opponent and UPDATE KING BITBOARD!
-            if is_jump:
-                jumped_pos = find_jumped_pos(start_pos, end_pos)
-                BP = remove_piece(BP, jumped_pos)
-                K = remove_piece(K, jumped_pos)  # UPDATE KING BITBOARD!
+    if player == PlayerTurn.WHITE:
+        own_man_keys, own_king_keys = WHITE_MAN_KEYS, WHITE_KING_KEYS
+        opp_man_keys, opp_king_keys = BLACK_MAN_KEYS, BLACK_KING_KEYS
+        promotes = S[end_pos] & KING_ROW_WHITE
+    else:
+        own_man_keys, own_king_keys = BLACK_MAN_KEYS, BLACK_KING_KEYS
+        opp_man_keys, opp_king_keys = WHITE_MAN_KEYS, WHITE_KING_KEYS
+        promotes = S[end_pos] & KING_ROW_BLACK
 
-            # Check for kinging
-            if end_mask & KING_ROW_WHITE:
-                K = insert_piece(K, end_pos)
+    key ^= own_king_keys[start_pos] if was_king else own_man_keys[start_pos]
+    key ^= own_king_keys[end_pos] if was_king or promotes else own_man_keys[end_pos]
 
-        elif player == PlayerTurn.BLACK:
-            BP = remove_piece(BP, start_pos)
-            BP = insert_piece(BP, end_pos)
+    for i in range(len(moves) - 1):
+        if abs(moves[i] - moves[i + 1]) > 5:  # jump: remove the captured piece
+            jumped_pos = find_jumped_pos(moves[i], moves[i + 1])
+            if K & S[jumped_pos]:
+                key ^= opp_king_keys[jumped_pos]
+            else:
+                key ^= opp_man_keys[jumped_pos]
 
-            if is_jump:
-                jumped_pos = find_jumped_pos(start_pos, end_pos)
-                # WP &= ~(1 << jumped_pos) & MASK_32
-                WP = remove_piece(WP, jumped_pos)
-                K = remove_piece(K, jumped_pos)  # UPDATE KING BITBOARD!
+    key ^= WHITE_TO_MOVE_KEY  # side to move flips
 
-            if end_mask & KING_ROW_BLACK:
-                K = insert_piece(K, end_pos)
+    WP, BP, K = do_move(WP, BP, K, moves, player)
 
-        # Update the kings bitboard if a king has been moved
-        if start_mask & K:
-            K = remove_piece(K, start_pos)
-            K = insert_piece(K, end_pos)
+    if debug:
+        full_key = hash_position(WP, BP, K, switch_player(player))
+        assert (
+            key == full_key
+        ), f"Incremental Zobrist key {key:016x} != recomputed {full_key:016x} after {moves}"
 
-    return WP, BP, K
+    return WP, BP, K, key
 
 
-def generate_legal_moves(WP, BP, K, turn):
+def generate_legal_moves(WP, BP, K, turn, unique_captures=False):
     """
     Returns a list of all legal moves for the given player. If no moves are available, returns None.
+    With unique_captures, capture sequences that lead to the same position are listed once
+    (see all_jump_sequences).
     """
     if turn == PlayerTurn.WHITE:  # TODO CHANGE ENUM
         # Check for jump moves first
         white_jumpers = get_jumpers_white(WP, BP, K)
         if white_jumpers:
-            return all_jump_sequences(WP, BP, K, white_jumpers, None, turn)
+            return all_jump_sequences(
+                WP, BP, K, white_jumpers, None, turn, unique_captures
+            )
 
         # If no jump moves, check for simple moves
         white_movers = get_movers_white(WP, BP, K)
@@ -78,7 +95,9 @@ def generate_legal_moves(WP, BP, K, turn):
     elif turn == PlayerTurn.BLACK:
         black_jumpers = get_jumpers_black(WP, BP, K)
         if black_jumpers:
-            return all_jump_sequences(WP, BP, K, None, black_jumpers, turn)
+            return all_jump_sequences(
+                WP, BP, K, None, black_jumpers, turn, unique_captures
+            )
 
         black_movers = get_movers_black(WP, BP, K)
         if black_movers:
@@ -87,17 +106,65 @@ def generate_legal_moves(WP, BP, K, turn):
         return None  # No moves available - game over for black.
 
 
+def cached_legal_moves(WP, BP, K, turn, key=None, unique_captures=False):
+    """
+    generate_legal_moves through LEGAL_MOVE_CACHE, keyed by the position's Zobrist key
+    (hashed here when not given) and the side to move.
+        Output: tuple of legal moves, or None
+    """
+    cache = LEGAL_MOVE_CACHE
+    if cache is None:
+        legal_moves = generate_legal_moves(WP, BP, K, turn, unique_captures)
+        return tuple(legal_moves) if legal_moves else None
+
+    if key is None:
+        key = hash_position(WP, BP, K, turn)
+    cache_key = key << 2 | (turn == PlayerTurn.WHITE) << 1 | unique_captures
+    position = (WP, BP, K)
+    legal_moves = cache.get(cache_key, position)
+    if legal_moves is False:
+        legal_moves = generate_legal_moves(WP, BP, K, turn, unique_captures)
+        legal_moves = tuple(legal_moves) if legal_moves else None
+        cache.put(cache_key, position, legal_moves)
+    return legal_moves
+
+
+def is_legal_simple_move(WP, BP, K, move, player) -> bool:
+    """
+    Is the (start, end) tuple a simple move the player's piece on start can make? Does not
+    check for captures: call it only when the player has no jumpers.
+    """
+    start_pos, end_pos = move
+    if player == PlayerTurn.WHITE:
+        own_pieces = WP
+        step_masks = WHITE_KING_STEP_MASKS if K & S[start_pos] else WHITE_MAN_STEP_MASKS
+    else:
+        own_pieces = BP
+        step_masks = BLACK_KING_STEP_MASKS if K & S[start_pos] else BLACK_MAN_STEP_MASKS
+    return bool(
+        own_pieces & S[start_pos]
+        and not (WP | BP) & S[end_pos]
+        and step_masks[start_pos] & S[end_pos]
+    )
+
+
+def generate_promotion_moves(WP, BP, K, player) -> list:
+    """
+    Returns the simple moves of men onto their king row, in the order generate_legal_moves
+    lists them. Does not check for captures: call it only when the player has no jumpers.
+    """
+    if player == PlayerTurn.WHITE:
+        men = WP & ~K & PROMOTION_ROW_WHITE
+        return generate_simple_moves_white(WP, BP, K, men) if men else []
+    men = BP & ~K & PROMOTION_ROW_BLACK
+    return generate_simple_moves_black(WP, BP, K, men) if men else []
+
+
 def find_jumped_pos(start_pos, end_pos):
     """
     Returns the position of the jumped piece given the start and end positions of a move.
     """
-
-    for direction, jump_mask in JUMP_MASKS.items():
-        if jump_mask[start_pos] == end_pos:
-            # Get the mask for the move to find the jumped square
-            move_mask = MOVE_MASKS[DIRECTION_MAP[direction]]
-            return move_mask[start_pos]
-    return None
+    return JUMPED_SQUARE[start_pos * 32 + end_pos]
 
 
 def get_movers_white(WP, BP, K):
@@ -213,80 +280,83 @@ def get_jumpers_black(WP, BP, K):
     return Jumpers
 
 
+def add_simple_moves(
+    simple_moves, forward, step5, step4, step3, back5=0, back4=0, back3=0
+):
+    """
+    Appends the simple moves of every piece to simple_moves, lowest square first, so no
+    sort is needed. stepN holds the pieces that can step N squares forward (forward is -1
+    for white, 1 for black) and backN the kings that can step N squares back; the moves
+    of a piece come in that argument order.
+    """
+    append = simple_moves.append
+    movers = step5 | step4 | step3 | back5 | back4 | back3
+    while movers:
+        lowest = movers & -movers
+        pos = lowest.bit_length() - 1
+        if step5 & lowest:
+            append((pos, pos + 5 * forward))
+        if step4 & lowest:
+            append((pos, pos + 4 * forward))
+        if step3 & lowest:
+            append((pos, pos + 3 * forward))
+        if back5 & lowest:
+            append((pos, pos - 5 * forward))
+        if back4 & lowest:
+            append((pos, pos - 4 * forward))
+        if back3 & lowest:
+            append((pos, pos - 3 * forward))
+        movers ^= lowest
+
+
 def generate_simple_moves_white(WP, BP, K, white_movers):
     """
     Returns a list of tuples representing all the simple moves (i.e. not jump moves) for white pieces.
+    Moves are read per direction from the same shifts as get_movers_white.
         Input: White movers.
         Output: List of tuples representing all the simple moves for white pieces. ex. [(20, 16), (21, 18), (22, 18), (22, 19), (23, 19)]
     """
     simple_moves = []
-    occupied = WP | BP  # Combine occupied positions for both white and black pieces
-
-    white_mover_positions = find_set_bits(white_movers)
-
-    for pos in white_mover_positions:
-        is_king = is_set(K, pos)
-
-        # Define potential moves based on whether the piece is a king
-        if is_king:
-            directions = [
-                WHITE_SOUTHWEST,
-                WHITE_SOUTHEAST,
-                BLACK_NORTHEAST,
-                BLACK_NORTHWEST,
-            ]
-        else:
-            directions = [WHITE_SOUTHWEST, WHITE_SOUTHEAST]
-
-        # Pre-filter None values and make sure the move is not occupied
-        potential_moves = [
-            direction.get(pos)
-            for direction in directions
-            if direction.get(pos) is not None
-        ]
-        valid_moves = [move for move in potential_moves if not is_set(occupied, move)]
-
-        # Append valid moves to the simple_moves list
-        simple_moves.extend([(pos, move) for move in valid_moves])
+    nOcc = ~(WP | BP) & MASK_32  # Not Occupied
+    WK = white_movers & K  # White Kings
 
+    # Per piece SW before SE before NE before NW: a -5 step is always SW, a -4 step SW or
+    # SE, a -3 step SE (and +5 NE, +4 NE or NW, +3 NW).
+    step5 = ((nOcc & MASK_L5) << 5) & white_movers
+    step4 = (nOcc << 4) & white_movers
+    step3 = ((nOcc & MASK_L3) << 3) & white_movers
+    if WK:
+        back5 = ((nOcc & MASK_R5) >> 5) & WK
+        back4 = (nOcc >> 4) & WK
+        back3 = ((nOcc & MASK_R3) >> 3) & WK
+        add_simple_moves(simple_moves, -1, step5, step4, step3, back5, back4, back3)
+    else:
+        add_simple_moves(simple_moves, -1, step5, step4, step3)
     return simple_moves
 
 
 def generate_simple_moves_black(WP, BP, K, black_movers):
     """
     Returns a list of tuples representing all the simple moves (i.e. not jump moves) for black pieces.
+    Moves are read per direction from the same shifts as get_movers_black.
         Input: Black movers.
         Output: List of tuples representing all the simple moves for Black pieces. ex. [(20, 16), (21, 18), (22, 18), (22, 19), (23, 19)]
     """
     simple_moves = []
-    occupied = WP | BP  # Combine occupied positions for both white and black pieces
-    black_mover_positions = find_set_bits(black_movers)
-
-    for pos in black_mover_positions:
-        is_king = is_set(K, pos)
-
-        # Define potential moves based on whether the piece is a king
-        if is_king:
-            directions = [
-                BLACK_NORTHEAST,
-                BLACK_NORTHWEST,
-                WHITE_SOUTHWEST,
-                WHITE_SOUTHEAST,
-            ]
-        else:
-            directions = [BLACK_NORTHEAST, BLACK_NORTHWEST]
-
-        # Pre-filter None values and make sure the move is not occupied
-        potential_moves = [
-            direction.get(pos)
-            for direction in directions
-            if direction.get(pos) is not None
-        ]
-        valid_moves = [move for move in potential_moves if not is_set(occupied, move)]
-
-        # Append valid moves to the simple_moves list
-        simple_moves.extend([(pos, move) for move in valid_moves])
+    nOcc = ~(WP | BP) & MASK_32  # Not Occupied
+    BK = black_movers & K  # Black Kings
 
+    # Per piece NE before NW before SW before SE (see generate_simple_moves_white)
+    step5 = ((nOcc & MASK_R5) >> 5) & black_movers
+    step4 = (nOcc >> 4) & black_movers
+    step3 = ((nOcc & MASK_R3) >> 3) & black_movers
+    if BK:
+        back5 = ((nOcc & MASK_L5) << 5) & BK
+        back4 = (nOcc << 4) & BK
+        back3 = ((nOcc & MASK_L3) << 3) & BK
+        add_simple_moves(simple_moves, 1, step5, step4, step3, back5, back4, back3)
+    else:
+        add_simple_moves(simple_moves, 1, step5, step4, step3)
     return simple_moves
 
 
@@ -300,153 +370,148 @@ def generate_jump_moves(WP, BP, K, jumpers, player):
     """
     jump_moves = []
 
-    # Choose the correct dictionaries based on the player and kings
-    white_jump_directions = [WHITE_JUMP_SOUTHEAST, WHITE_JUMP_SOUTHWEST]
-    black_jump_directions = [BLACK_JUMP_NORTHEAST, BLACK_JUMP_NORTHWEST]
-    white_move_directions = [WHITE_SOUTHEAST, WHITE_SOUTHWEST]
-    black_move_directions = [BLACK_NORTHEAST, BLACK_NORTHWEST]
-
-    # Assign opponent pieces and directions based on the current player
+    # Assign opponent pieces and jump tables based on the current player
     if player == PlayerTurn.WHITE:
         opponent_pieces = BP
-        own_jump_directions = white_jump_directions
-        own_move_directions = white_move_directions
-        opp_jump_directions = black_jump_directions  # for kings
-        opp_move_directions = black_move_directions  # for kings
+        man_jumps, king_jumps = WHITE_MAN_JUMPS, WHITE_KING_JUMPS
     elif player == PlayerTurn.BLACK:
         opponent_pieces = WP
-        own_jump_directions = black_jump_directions
-        own_move_directions = black_move_directions
-        opp_jump_directions = white_jump_directions  # for kings
-        opp_move_directions = white_move_directions  # for kings
+        man_jumps, king_jumps = BLACK_MAN_JUMPS, BLACK_KING_JUMPS
 
-    occupied = WP | BP  # Combine occupied positions for both white and black pieces
+    empty = ~(WP | BP)
 
     # Go through all the jumpers and generate jumps
-    for pos in find_set_bits(jumpers):
-        # Determine if the piece is a king
-        is_king = is_set(K, pos)
-
-        # Kings can jump in all directions, so we use both sets of directions
-        if is_king:
-            possible_jump_directions = own_jump_directions + opp_jump_directions
-            possible_move_directions = own_move_directions + opp_move_directions
-        else:
-            possible_jump_directions = own_jump_directions
-            possible_move_directions = own_move_directions
-
-        # Check all possible directions for valid jumps
-        for jump_dir, move_dir in zip(
-            possible_jump_directions, possible_move_directions
-        ):
-            intermediate_square = move_dir.get(pos)
-            landing_square = jump_dir.get(pos)
-            if intermediate_square is not None and landing_square is not None:
-                # Check if the intermediate square has an opponent piece and the landing square is empty
-                if is_set(opponent_pieces, intermediate_square) and not is_set(
-                    occupied, landing_square
-                ):
-                    # Add the jump move to the list
-                    jump_moves.append((pos, intermediate_square, landing_square))
+    for pos in bit_indices(jumpers):
+        # Kings can jump in all directions
+        jumps = king_jumps[pos] if K & S[pos] else man_jumps[pos]
+        for jumped, landing, jumped_mask, landing_mask in jumps:
+            # The jumped square must hold an opponent piece and the landing square be empty
+            if opponent_pieces & jumped_mask and empty & landing_mask:
+                jump_moves.append((pos, jumped, landing))
 
     return jump_moves
 
 
-def generate_all_jump_sequences(
-    WP, BP, K, pos, is_king: bool, player: str, sequence=None, sequences=None
-):
+def generate_capture_records(WP, BP, K, jumpers, player):
     """
-    Returns a list of all possible jump sequences for the given piece.
-        Input: WP, BP, K, pos, is_king, player, sequence, sequences
-        Output: List of all possible jump sequences for the given piece.
-                ex. [[20, 17, 13], [20, 25, 29], [21, 17, 12]]
-                where [20, 17, 13] means a piece at 20 jumps over a piece at 17 and lands at 13.
-
-    """
-    if sequences is None:
-        sequences = []
-    if sequence is None:
-        sequence = [pos]
-
-    # Determine if the current piece is kinged as a result of the last move
-    if not is_king and is_piece_kinged(pos, player):
-        is_king = True
-
-    # Get all possible simple jumps for the current position
-    jumpers = insert_piece(0, pos)
-    single_jumps = generate_jump_moves(WP, BP, K, jumpers, player)
-
-    for _, intermediate_square, landing_square in single_jumps:
-        # Here, instead of creating new bitboards, modify and then restore the original ones
-        original_WP, original_BP, original_K = WP, BP, K
-
-        # Make the jump and update the board state without creating new variables
-        WP = remove_piece(WP, pos)
-        BP = remove_piece(BP, pos)
-        WP = insert_piece(WP, landing_square) if player == PlayerTurn.WHITE else WP
-        BP = insert_piece(BP, landing_square) if player == PlayerTurn.BLACK else BP
-        WP = remove_piece(WP, intermediate_square) if player == PlayerTurn.BLACK else WP
-        BP = remove_piece(BP, intermediate_square) if player == PlayerTurn.WHITE else BP
-        K = (K & ~insert_piece(0, pos)) | (
-            insert_piece(0, landing_square) if is_king else 0
-        )
-
-        # Append to the current sequence instead of creating a new one
-        sequence.append(landing_square)
+    Returns a (path, captured mask, promoted) record for every complete capture sequence of
+    the given jumpers, working on bitboards only. Pieces are taken off as they are jumped,
+    so a square emptied by a capture can be landed on later in the sequence; a man that
+    reaches its king row is crowned and its move ends there.
+        Input: WP, BP, K, jumpers, player
+        Output: List of records, by jumper square and then in jump table order.
+                ex. [([1, 10, 19], 0b10000010000000, False)]
+    """
+    if player == PlayerTurn.WHITE:
+        opponent_pieces = BP
+        man_jumps, king_jumps = WHITE_MAN_JUMPS, WHITE_KING_JUMPS
+        man_reach, king_reach = WHITE_MAN_REACH, WHITE_KING_REACH
+        king_row, side_key = KING_ROW_WHITE, 1 << 6
+    else:
+        opponent_pieces = WP
+        man_jumps, king_jumps = BLACK_MAN_JUMPS, BLACK_KING_JUMPS
+        man_reach, king_reach = BLACK_MAN_REACH, BLACK_KING_REACH
+        king_row, side_key = KING_ROW_BLACK, 0
+
+    cache = JUMP_TREE_CACHE
+    empty = ~(WP | BP) & MASK_32
+    records = []
+    while jumpers:
+        pos_mask = jumpers & -jumpers
+        jumpers ^= pos_mask
+        pos = pos_mask.bit_length() - 1
+        if K & pos_mask:  # kings are never crowned again, so no king row for them
+            jumps, crown_row, reach, king_key = king_jumps, 0, king_reach[pos], 1 << 5
+        else:
+            jumps, crown_row, reach, king_key = man_jumps, king_row, man_reach[pos], 0
 
-        # Recursive call with the modified sequence
-        generate_all_jump_sequences(
-            WP, BP, K, landing_square, is_king, player, sequence, sequences
+        if cache is None:
+            extend_captures(
+                jumps, crown_row, [pos], empty | pos_mask, opponent_pieces, 0, records
+            )
+            continue
+
+        # Key: square, king, side, then the empty and opponent squares within reach
+        key = (
+            pos
+            | king_key
+            | side_key
+            | ((empty | pos_mask) & reach) << 7
+            | (opponent_pieces & reach) << 39
         )
-
-        # Restore the original board state and sequence
-        WP, BP, K = original_WP, original_BP, original_K
-        sequence.pop()  # Remove the last element to restore the original sequence
-
-    # If no further jumps are possible or the piece was just kinged, then finalize the sequence.
-    if not single_jumps or (not is_king and is_piece_kinged(pos, player)):
-        sequences.append(
-            list(sequence)  # TODO: this data structure is not ideal
-        )  # Make a copy of the sequence to store it independently
-
-    return sequences
+        tree = cache.get(key)
+        if tree is None:
+            tree = []
+            extend_captures(
+                jumps, crown_row, [pos], empty | pos_mask, opponent_pieces, 0, tree
+            )
+            cache.put(key, tree)
+        records.extend(tree)
+    return records
 
 
-def is_piece_kinged(pos, player):
-    return (player == PlayerTurn.WHITE and (S[pos] & KING_ROW_WHITE)) or (
-        player == PlayerTurn.BLACK and (S[pos] & KING_ROW_BLACK)
-    )
+def extend_captures(jumps, king_row, path, empty, opponent_pieces, captured, records):
+    """
+    Follows every continuation jump from the last square of path and appends the finished
+    sequences to records. empty includes the square the capturing piece stands on; path is
+    extended and restored in place, so only finished sequences are copied.
+    """
+    extended = False
+    for _, landing, jumped_mask, landing_mask in jumps[path[-1]]:
+        if opponent_pieces & jumped_mask and empty & landing_mask:
+            extended = True
+            path.append(landing)
+            if landing_mask & king_row:  # crowned: the move ends here
+                records.append((path[:], captured | jumped_mask, True))
+            else:
+                extend_captures(
+                    jumps,
+                    king_row,
+                    path,
+                    empty | jumped_mask,
+                    opponent_pieces ^ jumped_mask,
+                    captured | jumped_mask,
+                    records,
+                )
+            path.pop()
+
+    if not extended and captured:
+        records.append((path[:], captured, False))
 
 
 def all_jump_sequences(
-    WP, BP, K, white_jumpers=None, black_jumpers=None, player=PlayerTurn.WHITE
+    WP,
+    BP,
+    K,
+    white_jumpers=None,
+    black_jumpers=None,
+    player=PlayerTurn.WHITE,
+    unique_captures=False,
 ):
     """
     Returns a list of all possible jump sequences for the given player, sorted by length in descending order.
-        Input: WP, BP, K, white_jumpers, black_jumpers, player
+    With unique_captures, sequences of the same piece that end on the same square with the
+    same pieces captured (a king taking a ring of pieces either way round) give the same
+    position, and only the first of them is kept.
+        Input: WP, BP, K, white_jumpers, black_jumpers, player, unique_captures
         Output: List of all possible jump sequences for the given player.
                 ex. [[8, 17, 26], [0, 9, 18, 27]]
                 [0, 9, 18, 27] means a piece at 0 jumps over a piece at 4 and lands at 9, then jumps over a piece at 13 and lands at 18.
     """
-    jump_sequences = []
-
-    if player == PlayerTurn.WHITE:
-        # Generate sequences for white pieces
-        for pos in find_set_bits(white_jumpers):
-            is_king = is_set(K, pos)
-            jump_sequences.extend(
-                generate_all_jump_sequences(WP, BP, K, pos, is_king, player)
-            )
-
-    elif player == PlayerTurn.BLACK:
-        # Generate sequences for black pieces
-        for pos in find_set_bits(black_jumpers):
-            is_king = is_set(K, pos)
-            jump_sequences.extend(
-                generate_all_jump_sequences(WP, BP, K, pos, is_king, player)
-            )
+    jumpers = white_jumpers if player == PlayerTurn.WHITE else black_jumpers
+    records = generate_capture_records(WP, BP, K, jumpers, player)
+    if unique_captures:
+        seen = set()
+        jump_sequences = []
+        for path, captured, _ in records:
+            result = (path[0], path[-1], captured)
+            if result not in seen:
+                seen.add(result)
+                jump_sequences.append(path)
+    else:
+        jump_sequences = [path for path, _, _ in records]
 
     # Sort the jump sequences by the length of each sequence in descending order
-    jump_sequences.sort(key=lambda sequence: len(sequence), reverse=True)
+    jump_sequences.sort(key=len, reverse=True)
 
     return jump_sequences
@@ -5,6 +5,7 @@ import pygame
 from checkers import *
 from heuristic import *
 from minimax_alphabeta import AI
+from position import Position
 from util.helpers import *
 
 # Initialize Pygame
@@ -161,15 +162,15 @@ def main():
         circle_surface, CIRCLE_COLOR, (CIRCLE_RADIUS, CIRCLE_RADIUS), CIRCLE_RADIUS
     )
 
-    WP, BP, K = get_fresh_board()
-    # WP, BP, K = setup_board_from_position_lists(
-    #     white_positions=["KC1", "KE1"], black_positions=["F6", "F4", "D2", "F2"]
+    position = Position.fresh()
+    # position = Position(
+    #     *setup_board_from_position_lists(
+    #         white_positions=["KC1", "KE1"], black_positions=["F6", "F4", "D2", "F2"]
+    #     )
     # )
-    # WP = remove_piece_by_pdntext(WP, "F6")
-    temp_WP, temp_BP, temp_K = WP, BP, K  # Temporary board states
+    temp_WP, temp_BP, temp_K = position  # Temporary board states
 
     human_color = PlayerTurn.BLACK
-    current_player = PlayerTurn.BLACK
     selected_piece = None
     legal_moves = None
 
@@ -182,7 +183,7 @@ def main():
             if event.type == pygame.QUIT:
                 running = False
 
-            if event.type == pygame.MOUSEBUTTONDOWN and current_player == human_color:
+            if event.type == pygame.MOUSEBUTTONDOWN and position.turn == human_color:
                 pos = pygame.mouse.get_pos()
                 row, col = pos[1] // SQUARE_SIZE, pos[0] // SQUARE_SIZE
 
@@ -190,16 +191,16 @@ def main():
                     bit_index = coordinates_to_bit(row, col)
 
                     is_human_piece = (
-                        (WP & MASK_32 & (1 << bit_index))
+                        (position.WP & MASK_32 & (1 << bit_index))
                         if human_color == PlayerTurn.WHITE
-                        else (BP & MASK_32 & (1 << bit_index))
+                        else (position.BP & MASK_32 & (1 << bit_index))
                     )
 
                     if is_human_piece:  # Clicked on a human piece
                         dragging = True
                         drag_pos = pos
                         selected_piece = bit_index
-                        legal_moves = generate_legal_moves(WP, BP, K, current_player)
+                        legal_moves = position.legal_moves()
 
             elif (
                 event.type == pygame.MOUSEBUTTONUP and dragging
@@ -230,28 +231,16 @@ def main():
                             break
 
                     if valid_move:
-                        WP, BP, K = do_move(WP, BP, K, move_to_make, current_player)
-                        current_player = switch_player(current_player)
+                        position = position.play(move_to_make)
                         selected_piece = None
-                        temp_WP, temp_BP, temp_K = (
-                            WP,
-                            BP,
-                            K,
-                        )  # reset temporary board states
+                        # reset temporary board states
+                        temp_WP, temp_BP, temp_K = position
                     else:
                         print("Invalid move!")
-                        temp_WP, temp_BP, temp_K = (
-                            WP,
-                            BP,
-                            K,
-                        )
+                        temp_WP, temp_BP, temp_K = position
                 else:  # Clicked on an unplayable square
                     print("Invalid move!")
-                    temp_WP, temp_BP, temp_K = (
-                        WP,
-                        BP,
-                        K,
-                    )
+                    temp_WP, temp_BP, temp_K = position
                 dragging = False
                 drag_pos = None
                 selected_piece = None
@@ -259,14 +248,14 @@ def main():
             elif event.type == pygame.MOUSEMOTION and dragging:
                 drag_pos = pygame.mouse.get_pos()
                 temp_WP = (
-                    remove_piece(WP, bit_index)
+                    remove_piece(position.WP, bit_index)
                     if human_color == PlayerTurn.WHITE
-                    else WP
+                    else position.WP
                 )
                 temp_BP = (
-                    remove_piece(BP, bit_index)
+                    remove_piece(position.BP, bit_index)
                     if human_color == PlayerTurn.BLACK
-                    else BP
+                    else position.BP
                 )
 
         draw_board(win)
@@ -326,23 +315,22 @@ def main():
         pygame.display.update()
         clock.tick(60)
 
-        if current_player != human_color:  # AI's turn
-            legal_moves = generate_legal_moves(WP, BP, K, current_player)
+        if position.turn != human_color:  # AI's turn
+            legal_moves = position.legal_moves()
             if not legal_moves:
                 print("YOU WON!")
                 break
             if legal_moves:
                 best_move, _ = AI(
-                    position=(WP, BP, K),
-                    current_player=current_player,
+                    position=position,
+                    current_player=position.turn,
                     time_limit=2,
                     heuristic="smart",
-                    global_board_state=(WP, BP, K),
+                    global_board_state=position,
                 )
-                WP, BP, K = do_move(WP, BP, K, best_move, current_player)
-                current_player = switch_player(current_player)
+                position = position.play(best_move)
 
-            temp_WP, temp_BP, temp_K = WP, BP, K  # reset temporary board states
+            temp_WP, temp_BP, temp_K = position  # reset temporary board states
             time.sleep(1)
 
     pygame.quit()
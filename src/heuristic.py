@@ -1,6 +1,7 @@
 import random
 
 from checkers import *
+from util.bitboard import bit_indices, popcount
 from util.fen_pdn_helper import *
 from util.helpers import *
 from util.masks import *
@@ -27,24 +28,25 @@ def experiment(
     capture_weight=5,
     verge_king_weight=10,
     double_corner_king_reward=20,
+    capture_threats=True,  # False when a quiescence search already resolved pending captures
 ):
     EVAL = 0  # evaluation score
 
     # Board MiniMax is currently looking at.
-    num_white_man = count_bits(WP & ~K & MASK_32)
-    num_white_king = count_bits(WP & K & MASK_32)
-    num_black_man = count_bits(BP & ~K & MASK_32)
-    num_black_king = count_bits(BP & K & MASK_32)
+    num_white_man = popcount(WP & ~K & MASK_32)
+    num_white_king = popcount(WP & K & MASK_32)
+    num_black_man = popcount(BP & ~K & MASK_32)
+    num_black_king = popcount(BP & K & MASK_32)
     num_wps = num_white_man + num_white_king
     num_bps = num_black_king + num_black_man
     num_local_total_pcs = num_wps + num_bps
 
     # Board that Players are looking at.
     gwp, gbp, gk = global_board_state
-    num_global_white_men = count_bits(gwp & ~gk & MASK_32)
-    num_global_black_men = count_bits(gbp & ~gk & MASK_32)
-    num_global_white_king = count_bits(gwp & gk & MASK_32)
-    num_global_black_king = count_bits(gbp & gk & MASK_32)
+    num_global_white_men = popcount(gwp & ~gk & MASK_32)
+    num_global_black_men = popcount(gbp & ~gk & MASK_32)
+    num_global_white_king = popcount(gwp & gk & MASK_32)
+    num_global_black_king = popcount(gbp & gk & MASK_32)
     num_global_white_pcs = num_global_white_men + num_global_white_king
     num_global_black_pcs = num_global_black_men + num_global_black_king
     num_global_total_pcs = num_global_white_pcs + num_global_black_pcs
@@ -54,7 +56,7 @@ def experiment(
             EVAL -= 1000 + (700 - (depth * 20))  # delay loosing, expedite winning
         if turn == PlayerTurn.BLACK:
             EVAL += 1000 + (700 - (depth * 20))
-    else:
+    elif capture_threats:
         if turn == PlayerTurn.WHITE:
             EVAL += (
                 count_black_pieces_that_can_be_captured_by_white(  # white wants to capture black
@@ -98,7 +100,7 @@ def experiment(
             EVAL -= (
                 calculate_sum_distances(WP, BP, K) * distance_weight
             )  # white is penalized for being far from black
-            EVAL -= double_corner_king_reward * count_bits(
+            EVAL -= double_corner_king_reward * popcount(
                 BP & K & MASK_32 & DOUBLE_CORNER
             )  # black is rewarded for having kings on double corner
         elif (num_global_black_pcs > num_global_white_pcs) and (
@@ -108,7 +110,7 @@ def experiment(
             EVAL += (
                 calculate_sum_distances(WP, BP, K) * distance_weight
             )  # black is penalized for being far from white
-            EVAL += double_corner_king_reward * count_bits(
+            EVAL += double_corner_king_reward * popcount(
                 WP & K & MASK_32 & DOUBLE_CORNER
             )  # white is rewarded for having kings on double corner
 
@@ -123,16 +125,16 @@ def experiment(
 
     else:  # OPENING & MID GAME
         # HOME ROW
-        white_home = count_bits(WP & MASK_32 & KING_ROW_BLACK)
-        black_home = count_bits(BP & MASK_32 & KING_ROW_WHITE)
+        white_home = popcount(WP & MASK_32 & KING_ROW_BLACK)
+        black_home = popcount(BP & MASK_32 & KING_ROW_WHITE)
 
         # MID BOX
-        white_center_box = count_bits(WP & MASK_32 & CENTER_8)
-        black_center_box = count_bits(BP & MASK_32 & CENTER_8)
+        white_center_box = popcount(WP & MASK_32 & CENTER_8)
+        black_center_box = popcount(BP & MASK_32 & CENTER_8)
 
         # MID_ROW_NOT_MID_BOX
-        white_mid_row = count_bits(WP & MASK_32 & MID_ROW_NOT_MID_BOX)
-        black_mid_row = count_bits(BP & MASK_32 & MID_ROW_NOT_MID_BOX)
+        white_mid_row = popcount(WP & MASK_32 & MID_ROW_NOT_MID_BOX)
+        black_mid_row = popcount(BP & MASK_32 & MID_ROW_NOT_MID_BOX)
 
         EVAL += (
             (white_home * home_boost)
@@ -157,14 +159,15 @@ def experiment(
         )
 
         # CAPTURE SCORE
-        EVAL += capture_weight * (
-            count_black_pieces_that_can_be_captured_by_white(
-                WP, BP, K, kinged_mult=6, land_edge_mult=1, took_king_mult=3
-            )
-            - count_white_pieces_that_can_be_captured_by_black(
-                WP, BP, K, kinged_mult=6, land_edge_mult=1, took_king_mult=2
+        if capture_threats:
+            EVAL += capture_weight * (
+                count_black_pieces_that_can_be_captured_by_white(
+                    WP, BP, K, kinged_mult=6, land_edge_mult=1, took_king_mult=3
+                )
+                - count_white_pieces_that_can_be_captured_by_black(
+                    WP, BP, K, kinged_mult=6, land_edge_mult=1, took_king_mult=2
+                )
             )
-        )
 
         # VERGE KINGING
         EVAL += verge_king_weight * pieces_on_verge_of_kinging(WP, BP, K, turn=turn)
@@ -182,20 +185,20 @@ def experiment(
 
 def smart(WP, BP, K, turn, legal_moves, depth, global_board_state):
     # Board MiniMax is currently looking at.
-    num_white_man = count_bits(WP & ~K & MASK_32)
-    num_white_king = count_bits(WP & K & MASK_32)
-    num_black_man = count_bits(BP & ~K & MASK_32)
-    num_black_king = count_bits(BP & K & MASK_32)
+    num_white_man = popcount(WP & ~K & MASK_32)
+    num_white_king = popcount(WP & K & MASK_32)
+    num_black_man = popcount(BP & ~K & MASK_32)
+    num_black_king = popcount(BP & K & MASK_32)
     num_wps = num_white_man + num_white_king
     num_bps = num_black_king + num_black_man
     num_local_total_pcs = num_wps + num_bps
 
     # Board that Players are looking at.
     gwp, gbp, gk = global_board_state
-    num_global_white_men = count_bits(gwp & ~gk & MASK_32)
-    num_global_black_men = count_bits(gbp & ~gk & MASK_32)
-    num_global_white_king = count_bits(gwp & gk & MASK_32)
-    num_global_black_king = count_bits(gbp & gk & MASK_32)
+    num_global_white_men = popcount(gwp & ~gk & MASK_32)
+    num_global_black_men = popcount(gbp & ~gk & MASK_32)
+    num_global_white_king = popcount(gwp & gk & MASK_32)
+    num_global_black_king = popcount(gbp & gk & MASK_32)
     num_global_white_pcs = num_global_white_men + num_global_white_king
     num_global_black_pcs = num_global_black_men + num_global_black_king
     num_global_total_pcs = num_global_white_pcs + num_global_black_pcs
@@ -213,20 +216,20 @@ def smart(WP, BP, K, turn, legal_moves, depth, global_board_state):
             EVAL += 500 + (700 - (depth * 10))
 
     # HOME ROW
-    white_home = count_bits(
+    white_home = popcount(
         WP & MASK_32 & KING_ROW_BLACK
     )  # white men or kings on home row
-    black_home = count_bits(
+    black_home = popcount(
         BP & MASK_32 & KING_ROW_WHITE
     )  # black men or kings on home row
 
     # MID BOX
-    white_center_box = count_bits(WP & MASK_32 & CENTER_8)
-    black_center_box = count_bits(BP & MASK_32 & CENTER_8)
+    white_center_box = popcount(WP & MASK_32 & CENTER_8)
+    black_center_box = popcount(BP & MASK_32 & CENTER_8)
 
     # MID_ROW_NOT_MID_BOX
-    white_mid_row = count_bits(WP & MASK_32 & MID_ROW_NOT_MID_BOX)
-    black_mid_row = count_bits(BP & MASK_32 & MID_ROW_NOT_MID_BOX)
+    white_mid_row = popcount(WP & MASK_32 & MID_ROW_NOT_MID_BOX)
+    black_mid_row = popcount(BP & MASK_32 & MID_ROW_NOT_MID_BOX)
 
     # ENDGAME
     if (
@@ -502,8 +505,8 @@ def pieces_on_verge_of_kinging(WP, BP, K, turn=None):
     empty_squares = ~(WP | BP) & MASK_32
 
     # Get all white and black piece positions on the verge of kinging
-    black_verge_positions = find_set_bits(BP & ~K & MASK_32 & RANK7)
-    white_verge_positions = find_set_bits(WP & ~K & MASK_32 & RANK2)
+    black_verge_positions = bit_indices(BP & ~K & MASK_32 & RANK7)
+    white_verge_positions = bit_indices(WP & ~K & MASK_32 & RANK2)
 
     # Check for unblocked paths for each black and white piece
     unblocked_black_verge = [
@@ -556,9 +559,9 @@ def bit_to_coordinates(bit_index):
 def calculate_sum_distances(WP, BP, K):
     # distance between all pairs of kings
     total_distance = 0
-    for w_index in find_set_bits(WP & K):
+    for w_index in bit_indices(WP & K):
         w_coords = bit_to_coordinates(w_index)
-        for b_index in find_set_bits(BP & K):
+        for b_index in bit_indices(BP & K):
             # print(f"pair: {w_index}, {b_index}")
             b_coords = bit_to_coordinates(b_index)
             # print(f"coords: {w_coords}, {b_coords}")
@@ -615,7 +618,7 @@ def calculate_total_distance_to_promotion_white(bitboard, K):
     Calculates the sum of the distances of all pieces on the bitboard to the promotion line.
     """
     distance_sum = 0
-    for index in find_set_bits(bitboard & ~K):
+    for index in bit_indices(bitboard & ~K):
         if bitboard & (1 << index) & MASK_32:
             # Calculate the row by dividing by 4 (since 4 cells per row)
             row = index // 4
@@ -630,18 +633,12 @@ def calculate_total_distance_to_promotion_white(bitboard, K):
 
 def calculate_total_distance_to_promotion_black(bitboard, K):
     """
-    Calculates the sum of the distances of all pieces on the bitboard to the promotion line.
+    Black counterpart of calculate_total_distance_to_promotion_white, computed on the
+    flipped board (see flip_position).
     """
-    distance_sum = 0
-    for index in find_set_bits(bitboard & ~K):
-        if bitboard & (1 << index) & MASK_32:
-            # Calculate the row by dividing by 4 (since 4 cells per row)
-            row = index // 4
-            # Distance to promotion for black is the row number
-            distance = row
-            distance_sum += distance  # Distance for black is just the row number, since they move down the board
-
-    return distance_sum
+    return calculate_total_distance_to_promotion_white(
+        reverse_bits(bitboard), reverse_bits(K)
+    )
 
 
 def count_black_pieces_that_can_be_captured_by_white(
@@ -691,46 +688,16 @@ def count_black_pieces_that_can_be_captured_by_white(
 def count_white_pieces_that_can_be_captured_by_black(
     WP, BP, K, kinged_mult=1, land_edge_mult=1, took_king_mult=1
 ):
-    # Get blacks's jump sequences (potential captures)
-    black_jumpers = get_jumpers_black(WP, BP, K)
-
-    if black_jumpers == 0:
+    """
+    Black counterpart of count_black_pieces_that_can_be_captured_by_white, computed on the
+    flipped board (see flip_position). Most positions have no capture, so check first.
+    """
+    if get_jumpers_black(WP, BP, K) == 0:
         return 0
 
-    black_jump_sequences = all_jump_sequences(
-        WP, BP, K, None, black_jumpers, player=PlayerTurn.BLACK
+    return count_black_pieces_that_can_be_captured_by_white(
+        *flip_position(WP, BP, K), kinged_mult, land_edge_mult, took_king_mult
     )
-    edges = [0, 1, 2, 3, 7, 15, 23, 31, 30, 29, 28, 24, 16, 8]
-    king_row_black = [28, 29, 30, 31]
-
-    # Count the unique pieces that can be captured by white in the next turn
-    # A set is used to ensure each piece is only counted once, even if it can be captured in multiple ways.
-    capturable_pieces = set()
-    mult = 1
-    for sequence in black_jump_sequences:
-        if sequence[-1] in king_row_black and is_set(
-            BP & ~K & MASK_32, sequence[0]
-        ):  # a black man started the jump seq and ended on the back row and became a king
-            mult += kinged_mult
-        if len(sequence) == 2:  # single jump
-            jumped_pos = find_jumped_pos(sequence[0], sequence[1])
-            capturable_pieces.add(jumped_pos)
-            if sequence[-1] in edges:  # land on edge
-                mult += land_edge_mult
-            if is_set(WP & K, jumped_pos):  # took a king
-                mult += took_king_mult
-        else:  # more than one jump
-            if sequence[-1] in edges:
-                mult += land_edge_mult  # land on edge
-            pairs = [[sequence[i], sequence[i + 1]] for i in range(len(sequence) - 1)]
-            for p in pairs:
-                jumped_pos = find_jumped_pos(p[0], p[1])  # jumped position of the pair
-                capturable_pieces.add(jumped_pos)  # add to set
-                if is_set(WP & K, jumped_pos):  # took a king
-                    mult += took_king_mult
-
-    mult = max(1, mult)
-    return mult * len(capturable_pieces)
 
 
 def calculate_safe_white_pieces(WP, K):
@@ -738,7 +705,7 @@ def calculate_safe_white_pieces(WP, K):
     safe_white_pieces = 0
 
     # Get all white piece positions
-    white_positions = find_set_bits(WP)
+    white_positions = bit_indices(WP)
 
     # Iterate through each white piece
     for pos in white_positions:
@@ -761,33 +728,11 @@ def calculate_safe_white_pieces(WP, K):
 
 
 def calculate_safe_black_pieces(BP, K):
-    # Counter for safe black pieces
-    safe_black_pieces = 0
-
-    # Get all black piece positions
-    black_positions = find_set_bits(BP)
-
-    # Iterate through each black piece
-    for pos in black_positions:
-        # Check the southeast and southwest positions for black pieces
-        # For black pieces moving upwards, southeast and southwest would be behind them
-        safe_southeast = WHITE_SOUTHEAST.get(pos)
-        safe_southwest = WHITE_SOUTHWEST.get(pos)
-
-        # A piece is considered safe if it has support from behind in both southeast and southwest directions,
-        # or if it's against the wall (None in the dictionaries) indicating it's on the back row.
-        is_safe = (
-            safe_southeast is None
-            or (safe_southeast is not None and is_set(BP, safe_southeast))
-        ) and (
-            safe_southwest is None
-            or (safe_southwest is not None and is_set(BP, safe_southwest))
-        )
-
-        # Increment the counter if the piece is safe
-        safe_black_pieces += int(is_safe)
-
-    return safe_black_pieces
+    """
+    Black counterpart of calculate_safe_white_pieces, computed on the flipped board (see
+    flip_position).
+    """
+    return calculate_safe_white_pieces(reverse_bits(BP), reverse_bits(K))
 
 
 def test1():
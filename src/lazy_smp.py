@@ -0,0 +1,103 @@
+import contextlib
+import multiprocessing
+import os
+import pathlib
+import random
+import sys
+
+parent = pathlib.Path(__file__).parent.absolute()
+sys.path.append(str(parent))
+
+from minimax_alphabeta import AI, SEARCH_INFO
+from move_ordering import EVAL_SORT_MIN_DEPTH, MoveOrderer
+from time_control import TimeControl
+from transposition_table import SharedTranspositionTable
+
+
+def helper_move_orderer(index):
+    """
+    Move orderer for helper number index (1, 2, ...). Helpers sort by static evaluation
+    from different depths so they walk the tree in different orders and fill the shared
+    table with entries the main search has not reached yet.
+    """
+    offset = (index + 1) // 2
+    if index % 2:
+        return MoveOrderer(eval_sort_min_depth=max(EVAL_SORT_MIN_DEPTH - offset, 0))
+    return MoveOrderer(eval_sort_min_depth=EVAL_SORT_MIN_DEPTH + offset)
+
+
+def _helper_search(
+    index, shared_slots, tt_size_mb, stop_event, position, current_player, ai_kwargs
+):
+    random.seed(index)  # the evaluators add noise; give every helper its own
+    table = SharedTranspositionTable(tt_size_mb, shared_slots=shared_slots)
+    time_control = TimeControl(ai_kwargs.pop("time_limit"), stop_event=stop_event)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        AI(
+            position,
+            current_player,
+            transposition_table=table,
+            time_control=time_control,
+            move_orderer=helper_move_orderer(index),
+            **dict(ai_kwargs, manage_time=False),  # helpers run until the main search stops them
+        )
+
+
+def lazy_smp_AI(
+    position,
+    current_player,
+    workers=None,
+    time_limit=5,
+    tt_size_mb=64,
+    move_orderer=None,
+    **ai_kwargs,
+):
+    """
+    Lazy SMP: runs AI() on the same root in this process and in workers - 1 helper processes,
+    all sharing one SharedTranspositionTable. Helpers differ in move ordering and evaluation
+    noise; only the main search's result is returned, helpers are stopped once it finishes.
+    Extra keyword arguments go to every AI() call.
+        Output: (best move, depth reached by the main search)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    table = SharedTranspositionTable(tt_size_mb)
+    stop_event = multiprocessing.Event()
+    helpers = [
+        multiprocessing.Process(
+            target=_helper_search,
+            args=(
+                index,
+                table.shared_slots,
+                tt_size_mb,
+                stop_event,
+                position,
+                current_player,
+                dict(ai_kwargs, time_limit=time_limit),
+            ),
+            daemon=True,
+        )
+        for index in range(1, workers)
+    ]
+    for helper in helpers:
+        helper.start()
+
+    try:
+        best_move, depth_reached = AI(
+            position,
+            current_player,
+            time_limit=time_limit,
+            transposition_table=table,
+            move_orderer=move_orderer,
+            **ai_kwargs,
+        )
+    finally:
+        stop_event.set()
+        for helper in helpers:
+            helper.join(1)
+            if helper.is_alive():
+                helper.terminate()
+
+    SEARCH_INFO["workers"] = workers
+    return best_move, depth_reached
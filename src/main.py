@@ -4,18 +4,20 @@ from checkers import *
 from heuristic import *
 
 # from minimax_alphabeta import *
-from minimax_alphabeta import AI
+from minimax_alphabeta import AI, SEARCH_INFO
+from move_ordering import MoveOrderer
+from position import Position
 from util.helpers import *
 
 
 def human_vs_human():
-    WP, BP, K = get_fresh_board()
-    current_player = PlayerTurn.BLACK
+    position = Position.fresh()
     move_count = 0
-    print_board(WP, BP, K)  # Assuming print_board() function to display the board
+    print_board(*position)  # Assuming print_board() function to display the board
 
     while move_count < 100:
-        legal_moves = generate_legal_moves(WP, BP, K, current_player)
+        current_player = position.turn
+        legal_moves = position.legal_moves()
 
         if not legal_moves:
             print(f"GAME OVER. {current_player.name} LOOSES!")
@@ -25,11 +27,10 @@ def human_vs_human():
         print_legal_moves(legal_moves)
         selected_move = legal_moves[int(input("Choose your move by index: "))]
 
-        WP, BP, K = do_move(WP, BP, K, selected_move, current_player)
+        position = position.play(selected_move)
 
-        print_board(WP, BP, K)
+        print_board(*position)
 
-        current_player = switch_player(current_player)
         move_count += 1
 
     print(f"Game over in {move_count} moves.")
@@ -44,9 +45,7 @@ def human_vs_AI(
     early_stop_depth=1,  # number of depths to search without improvement before stopping (any value greater than like 20 will disable this feature)
 ):
     if initial_board is None:
-        (WP, BP, K) = get_fresh_board()
-    else:
-        WP, BP, K = initial_board
+        initial_board = get_fresh_board()
 
     if time_limit is None:
         time_limit = 5
@@ -55,18 +54,21 @@ def human_vs_AI(
     if human_color is None:
         human_color = PlayerTurn.BLACK
 
-    current_player = who_moves_first
+    position = Position(*initial_board, who_moves_first)
+    current_player = position.turn
     ai_color = switch_player(human_color)
     move_count = 0
     max_depth = 20
+    move_orderer = MoveOrderer()  # history carries over between the AI's searches
 
     print(
         f"\nWelcome to Checkers! You are playing as {human_color.name}. AI is playing as {ai_color.name}. {current_player.name} moves first. The AI has {time_limit} seconds to make a move."
     )
-    print_board(WP, BP, K)
+    print_board(*position)
     while move_count < 150:
+        current_player = position.turn
         if current_player == human_color:
-            legal_moves = generate_legal_moves(WP, BP, K, current_player)
+            legal_moves = position.legal_moves()
 
             if not legal_moves:  # No legal moves left for human
                 print(f"\nGame Over... {switch_player(current_player).name} won!")
@@ -94,12 +96,12 @@ def human_vs_AI(
             print(f"Move chosen: {selected_move}")
 
             print(f"Move chosen: {convert_move_list_to_pdn([selected_move])}")
-            WP, BP, K = do_move(WP, BP, K, selected_move, current_player)
+            position = position.play(selected_move)
 
         else:  # AI's turn
             print("AI: Thinking...")
             start_time = time.time()
-            legal_moves = generate_legal_moves(WP, BP, K, current_player)
+            legal_moves = position.legal_moves()
 
             if not legal_moves:  # No legal moves left for AI
                 print(f"\nGame Over... {switch_player(current_player).name} won!")
@@ -111,13 +113,15 @@ def human_vs_AI(
                 best_move = legal_moves[0]
             else:
                 best_move, depth_reached = AI(
-                    (WP, BP, K),
+                    position,
                     ai_color,
                     max_depth,
                     time_limit,
                     heuristic="smart",
                     early_stop_depth=early_stop_depth,
-                    global_board_state=(WP, BP, K),
+                    global_board_state=position,
+                    move_orderer=move_orderer,
+                    manage_time=True,
                 )
 
             end_time = time.time()
@@ -128,7 +132,7 @@ def human_vs_AI(
 
             move_description = convert_move_list_to_pdn([best_move])
             print(f"AI MOVED: {move_description}")
-            WP, BP, K = do_move(WP, BP, K, best_move, current_player)
+            position = position.play(best_move)
 
             if not immediate_move:
                 if elapsed_time <= 4.99:
@@ -138,13 +142,12 @@ def human_vs_AI(
                 else:
                     print(f"AI hit the 'time limit' and reached depth {depth_reached}.")
 
-        print_board(WP, BP, K)
+        print_board(*position)
         print(
-            f"EVAL: {smart(WP, BP, K, turn=current_player, depth=1, global_board_state=(WP, BP, K), legal_moves=legal_moves)}"
+            f"EVAL: {smart(*position, turn=current_player, depth=1, global_board_state=position, legal_moves=legal_moves)}"
         )
         print("-" * 50 + "\n")
 
-        current_player = switch_player(current_player)
         move_count += 1
 
     print(f"\nGame lasted {move_count} moves.")
@@ -163,13 +166,14 @@ def AI_vs_AI(
         who_moves_first = PlayerTurn.BLACK
 
     if initial_board is None:
-        WP, BP, K = get_fresh_board()
+        initial_board = get_fresh_board()
         # WP = remove_piece_by_pdntext(WP, "D6")
         # WP = remove_piece_by_pdntext(WP, "F6")
-    else:
-        WP, BP, K = initial_board
 
-    current_player = who_moves_first
+    position = Position(*initial_board, who_moves_first)
+    current_player = position.turn
+    move_orderers = {PlayerTurn.WHITE: MoveOrderer(), PlayerTurn.BLACK: MoveOrderer()}
+    time_report = []  # (move number, player, seconds used, planned seconds, depth)
 
     move_count = 0
     game_over = False
@@ -177,12 +181,12 @@ def AI_vs_AI(
         f"\nWelcome to Checkers! AI vs AI mode! {current_player.name} moves first. The AIs each have {time_limit} seconds to make a move."
     )
 
-    print_board(WP, BP, K)
+    print_board(*position)
     while move_count < 200 and not game_over:
         print(f"It's {current_player.name}'s Turn.\n")
         start_time = time.time()
 
-        legal_moves = generate_legal_moves(WP, BP, K, current_player)
+        legal_moves = position.legal_moves()
         if not legal_moves:
             print(
                 f"GAME OVER. {switch_player(current_player).name} WON in {move_count} moves!"
@@ -198,13 +202,15 @@ def AI_vs_AI(
             best_move = legal_moves[0]
         else:
             best_move, depth_reached = AI(
-                position=(WP, BP, K),
+                position=position,
                 current_player=current_player,
                 time_limit=time_limit,
                 heuristic="smart"
                 if current_player == PlayerTurn.BLACK
                 else "experiment",
-                global_board_state=(WP, BP, K),
+                global_board_state=position,
+                move_orderer=move_orderers[current_player],
+                manage_time=True,
             )
 
         end_time = time.time()
@@ -221,9 +227,18 @@ def AI_vs_AI(
 
         move_description = convert_move_list_to_pdn([best_move])
         print(f"AI ({current_player.name}) MOVED: {move_description}")
-        WP, BP, K = do_move(WP, BP, K, best_move, current_player)
+        position = position.play(best_move)
 
         if not immediate_move:
+            time_report.append(
+                (
+                    move_count + 1,
+                    current_player.name,
+                    elapsed_time,
+                    SEARCH_INFO.get("soft_limit", time_limit),
+                    depth_reached,
+                )
+            )
             if elapsed_time <= time_limit:
                 print(
                     f"AI ({current_player.name}) searched to depth {depth_reached} in {elapsed_time:.2f} seconds."
@@ -233,15 +248,15 @@ def AI_vs_AI(
                     f"AI ({current_player.name}) hit the 'time limit' and reached depth {depth_reached}."
                 )
 
-        current_player = switch_player(current_player)
+        current_player = position.turn
         move_count += 1
 
-        print_board(WP, BP, K)
+        print_board(*position)
         print(
-            f"SMART (WHITE): {smart(WP,BP,K,turn=current_player,depth=0,global_board_state=(WP, BP, K),legal_moves=legal_moves)}"
+            f"SMART (WHITE): {smart(*position,turn=current_player,depth=0,global_board_state=position,legal_moves=legal_moves)}"
         )
         print(
-            f"EXPERIMENT (BLACK): {experiment(WP,BP,K,turn=current_player,depth=0,global_board_state=(WP, BP, K),legal_moves=legal_moves)}"
+            f"EXPERIMENT (BLACK): {experiment(*position,turn=current_player,depth=0,global_board_state=position,legal_moves=legal_moves)}"
         )
 
         print("-" * 50 + "\n")
@@ -249,6 +264,25 @@ def AI_vs_AI(
     if not game_over:
         print(f"GAME OVER in {move_count} moves! DRAW.")
 
+    print_time_report(time_report, time_limit)
+
+
+def print_time_report(time_report, time_limit):
+    """
+    Prints the time each AI move used against the time planned for it and the per-move limit.
+    """
+    print(f"\nTime per move (limit {time_limit}s):")
+    print(f"{'Move':>4} {'Player':>6} {'Used':>6} {'Planned':>7} {'Depth':>5}")
+    for move_number, player, used, planned, depth in time_report:
+        print(f"{move_number:>4} {player:>6} {used:>6.2f} {planned:>7.2f} {depth:>5}")
+    for player in (PlayerTurn.BLACK.name, PlayerTurn.WHITE.name):
+        used = [entry[2] for entry in time_report if entry[1] == player]
+        if used:
+            print(
+                f"{player}: {sum(used):.2f}s over {len(used)} searched moves "
+                f"(mean {sum(used) / len(used):.2f}s, max {max(used):.2f}s)"
+            )
+
 
 if __name__ == "__main__":
     from_file = input("Would you like to load a game from a file (Y/N)? ")
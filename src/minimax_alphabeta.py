@@ -1,27 +1,37 @@
 import pathlib
-import signal
 import sys
-import time
 
 # Assuming checkers and heuristic modules are in the parent directory as in the first script
 parent = pathlib.Path(__file__).parent.parent.absolute()
 sys.path.append(str(parent))
 
+import checkers
+from board_state import BoardState
 from checkers import *
-from checkers import PlayerTurn, do_move, generate_legal_moves
+from checkers import PlayerTurn, do_move
 from heuristic import smart as heuristic_function
 from heuristic import experiment
+from move_ordering import MoveOrderer, first_moves
+from time_control import (
+    TimeControl,
+    TimeOutException,
+    iteration_time_factor,
+    position_time_fraction,
+)
+from transposition_table import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
 
 global NC
 NC = 0
+QNC = 0  # quiescence nodes, counted separately from NC
 
+QUIESCENCE_DEPTH = 8  # default cap on capture plies searched below the horizon
 
-class TimeOutException(Exception):
-    pass
+# Search a single move for capture sequences that lead to the same position (a king taking
+# the same pieces along different paths); move lists shown to players keep every path.
+UNIQUE_CAPTURES = True
 
-
-def signal_handler(signum, frame):
-    raise TimeOutException()
+# Result of the last completed AI() iteration: depth, score (WHITE-relative), pv, nodes.
+SEARCH_INFO = {}
 
 
 def sort_moves_by_heuristic(legal_moves, position, current_player, current_depth):
@@ -56,6 +66,256 @@ def sort_moves_by_heuristic(legal_moves, position, current_player, current_depth
         # will assume that multiple captures are a better indicator of a good move then the eval.
 
 
+def order_moves(
+    legal_moves, position, current_player, current_depth, depth, hash_move, move_orderer
+):
+    """
+    Returns the legal moves in search order, the eager form of generate_staged_moves: the
+    hash move, then for quiet moves the promotions and the killer moves (see first_moves),
+    then the rest by the move orderer below its eval_sort_min_depth, otherwise by static
+    evaluation.
+    """
+    if isinstance(legal_moves[0], list):
+        promotions = ()
+    else:
+        promotions = generate_promotion_moves(*position, current_player)
+    if move_orderer is not None and depth < move_orderer.eval_sort_min_depth:
+        return move_orderer.order(legal_moves, current_depth, hash_move, promotions)
+
+    killers = () if move_orderer is None else move_orderer.killers_at(current_depth)
+    first = first_moves(legal_moves, hash_move, promotions, killers)
+    rest = [move for move in legal_moves if move not in first]
+    return first + (
+        sort_moves_by_heuristic(rest, position, current_player, current_depth) or []
+    )
+
+
+def generate_staged_moves(
+    position,
+    current_player,
+    current_depth,
+    depth,
+    hash_move=None,
+    move_orderer=None,
+    key=None,
+):
+    """
+    Yields the legal moves in the same order as order_moves, in stages, so that a cutoff
+    skips the work for the stages after it:
+        1. captures (compulsory, so the only moves when there are any): the hash move, then
+           the other sequences sorted
+        2. the hash move, checked for legality without generating the other moves
+        3. promotions, generated from the men one step from their king row
+        4. the killer moves for the ply, checked for legality
+        5. the remaining moves, generated and sorted by history or static evaluation
+    Stage 5 sorts by the history scores saved before stage 2, as order_moves sees them,
+    although the subtrees of earlier moves update the table. The caller must check first
+    that the side to move has a move at all. key is the position's Zobrist key, if known,
+    for the legal-move cache.
+    """
+    WP, BP, K = position
+    if current_player == PlayerTurn.WHITE:
+        jumpers = get_jumpers_white(WP, BP, K)
+    else:
+        jumpers = get_jumpers_black(WP, BP, K)
+    history_sorted = (
+        move_orderer is not None and depth < move_orderer.eval_sort_min_depth
+    )
+
+    if jumpers:
+        captures = cached_legal_moves(WP, BP, K, current_player, key, UNIQUE_CAPTURES)
+        first = first_moves(captures, hash_move)
+        rest = [move for move in captures if move not in first]
+        if history_sorted:  # sorted before the hash move's subtree updates the history
+            rest = move_orderer.sort_by_history(rest)
+        yield from first
+        if not history_sorted:
+            rest = sort_moves_by_heuristic(
+                rest, position, current_player, current_depth
+            )
+        yield from rest or ()
+        return
+
+    first = []
+    if isinstance(hash_move, tuple) and is_legal_simple_move(
+        WP, BP, K, hash_move, current_player
+    ):
+        first.append(hash_move)
+    for move in generate_promotion_moves(WP, BP, K, current_player):
+        if move not in first:
+            first.append(move)
+    if move_orderer is not None:
+        for killer in move_orderer.killers_at(current_depth):
+            if (
+                killer is not None
+                and killer not in first
+                and is_legal_simple_move(WP, BP, K, killer, current_player)
+            ):
+                first.append(killer)
+
+    history = None
+    if first and history_sorted:
+        if current_player == PlayerTurn.WHITE:
+            movers = get_movers_white(WP, BP, K)
+        else:
+            movers = get_movers_black(WP, BP, K)
+        history = move_orderer.save_history(bit_indices(movers))
+    yield from first
+
+    legal_moves = cached_legal_moves(WP, BP, K, current_player, key, UNIQUE_CAPTURES)
+    rest = [move for move in legal_moves if move not in first]
+    if history_sorted:
+        yield from move_orderer.sort_by_history(rest, history)
+    else:
+        yield from sort_moves_by_heuristic(
+            rest, position, current_player, current_depth
+        ) or ()
+
+
+def has_legal_moves(WP, BP, K, current_player) -> bool:
+    if current_player == PlayerTurn.WHITE:
+        return bool(get_movers_white(WP, BP, K) or get_jumpers_white(WP, BP, K))
+    return bool(get_movers_black(WP, BP, K) or get_jumpers_black(WP, BP, K))
+
+
+def evaluate(
+    position,
+    current_player,
+    legal_moves,
+    current_depth,
+    global_board_state,
+    heuristic,
+    capture_threats=True,
+):
+    """
+    Static evaluation of a leaf from WHITE's point of view with the named heuristic.
+    capture_threats=False skips the capture-threat terms of heuristics that have them; used
+    when quiescence search has already resolved pending captures.
+    """
+    if heuristic is None or heuristic == "smart":
+        return heuristic_function(
+            *position,
+            turn=current_player,
+            legal_moves=legal_moves,
+            depth=current_depth,
+            global_board_state=global_board_state,
+        )
+    elif heuristic == "experiment":
+        return experiment(
+            *position,
+            turn=current_player,
+            legal_moves=legal_moves,
+            depth=current_depth,
+            global_board_state=global_board_state,
+            capture_threats=capture_threats,
+        )
+
+
+def bound_flag(score, alpha, beta):
+    """
+    Returns the transposition table flag for a WHITE-relative score searched with (alpha, beta).
+    """
+    if score <= alpha:
+        return UPPER_BOUND
+    if score >= beta:
+        return LOWER_BOUND
+    return EXACT
+
+
+def quiescence(
+    position,
+    alpha,
+    beta,
+    current_player,
+    qdepth,
+    current_depth=0,
+    global_board_state=None,
+    heuristic=None,
+    time_control=None,
+    key=None,
+):
+    """
+    Resolves pending captures below the horizon. Scores are WHITE-relative like minimax.
+
+    Captures are compulsory in checkers, so the side to move can only stand pat on the static
+    evaluation when it has no capture, or when qdepth capture plies have been used up.
+    Otherwise every capture sequence is searched with alpha-beta bounds. position is a
+    (WP, BP, K) tuple or a BoardState that is walked in place (see minimax).
+    """
+    global QNC
+    QNC += 1
+    if time_control is not None:
+        time_control.check()
+
+    if isinstance(position, BoardState):
+        board = position
+    else:
+        board = BoardState(*position, current_player, key)
+    WP, BP, K = board.WP, board.BP, board.K
+    if current_player == PlayerTurn.WHITE:
+        jumpers = get_jumpers_white(WP, BP, K)
+    else:
+        jumpers = get_jumpers_black(WP, BP, K)
+
+    legal_moves = cached_legal_moves(
+        WP, BP, K, current_player, board.key, UNIQUE_CAPTURES
+    )
+    if not jumpers or qdepth == 0:  # stand pat: the position is quiet (or we stop here)
+        return evaluate(
+            (WP, BP, K),
+            current_player,
+            legal_moves,
+            current_depth,
+            global_board_state,
+            heuristic,
+            capture_threats=False,
+        )
+
+    if current_player == PlayerTurn.WHITE:  # MAXIMIZING PLAYER
+        best = float("-inf")
+        for move in legal_moves:
+            board.make(move)
+            score = quiescence(
+                board,
+                alpha,
+                beta,
+                PlayerTurn.BLACK,
+                qdepth - 1,
+                current_depth + 1,
+                global_board_state,
+                heuristic,
+                time_control,
+            )
+            board.unmake()
+            if score > best:
+                best = score
+                alpha = max(alpha, score)
+                if beta <= alpha:
+                    break
+    else:  # MINIMIZING PLAYER
+        best = float("inf")
+        for move in legal_moves:
+            board.make(move)
+            score = quiescence(
+                board,
+                alpha,
+                beta,
+                PlayerTurn.WHITE,
+                qdepth - 1,
+                current_depth + 1,
+                global_board_state,
+                heuristic,
+                time_control,
+            )
+            board.unmake()
+            if score < best:
+                best = score
+                beta = min(beta, score)
+                if beta <= alpha:
+                    break
+    return best
+
+
 def minimax(
     position,
     depth,
@@ -66,41 +326,96 @@ def minimax(
     is_root=False,
     global_board_state=None,
     heuristic=None,
+    transposition_table=None,
+    key=None,
+    move_orderer=None,
+    quiescence_depth=0,
+    time_control=None,
+    staged=True,
 ):
-    legal_moves = sort_moves_by_heuristic(
-        generate_legal_moves(*position, current_player),
-        position,
-        current_player,
-        current_depth,
-    )
+    """
+    Fail-hard alpha-beta minimax; scores are WHITE-relative. position is a (WP, BP, K)
+    tuple, or a BoardState for current_player that the search walks with make/unmake and
+    leaves as it found it (unless the search times out, which abandons the board).
+        Output: (best move at the root, None below it; score)
+    """
     global NC
     NC += 1
+    if time_control is not None:
+        time_control.check()
 
-    if depth == 0 or not legal_moves:
-        if heuristic is None or heuristic == "smart":
-            return None, heuristic_function(
-                *position,
-                turn=current_player,
-                legal_moves=legal_moves,
-                depth=current_depth,
-                global_board_state=global_board_state,
-            )
-        elif heuristic == "experiment":
-            return None, experiment(
-                *position,
-                turn=current_player,
-                legal_moves=legal_moves,
-                depth=current_depth,
-                global_board_state=global_board_state,
+    if isinstance(position, BoardState):
+        board = position
+    else:  # root: hash from scratch, children are updated incrementally
+        board = BoardState(*position, current_player, key)
+    key = board.key
+
+    hash_move = None
+    if transposition_table is not None:
+        entry = transposition_table.probe(key)
+        if entry is not None:
+            hash_move = entry[4]
+            if not is_root:
+                score = transposition_table.cutoff_score(entry, depth, alpha, beta)
+                if score is not None:
+                    return None, score
+
+    if depth == 0 and quiescence_depth:
+        eval = quiescence(
+            board,
+            alpha,
+            beta,
+            current_player,
+            quiescence_depth,
+            current_depth,
+            global_board_state,
+            heuristic,
+            time_control,
+        )
+        if transposition_table is not None:
+            transposition_table.store(key, 0, eval, bound_flag(eval, alpha, beta), None)
+        return None, eval
+
+    WP, BP, K = position = board.position
+    if staged and depth > 0 and has_legal_moves(WP, BP, K, current_player):
+        legal_moves = generate_staged_moves(
+            position, current_player, current_depth, depth, hash_move, move_orderer, key
+        )
+    else:
+        legal_moves = cached_legal_moves(
+            WP, BP, K, current_player, key, UNIQUE_CAPTURES
+        )
+        if depth == 0 or not legal_moves:
+            eval = evaluate(
+                position,
+                current_player,
+                legal_moves,
+                current_depth,
+                global_board_state,
+                heuristic,
             )
+            if transposition_table is not None:
+                transposition_table.store(key, depth, eval, EXACT, None)
+            return None, eval
+        legal_moves = order_moves(
+            legal_moves,
+            position,
+            current_player,
+            current_depth,
+            depth,
+            hash_move,
+            move_orderer,
+        )
 
+    alpha_orig, beta_orig = alpha, beta
     best_move = None
+    node_best_move = None
     if current_player == PlayerTurn.WHITE:  # MAXIMIZING PLAYER
         max_eval = float("-inf")
-        for move in legal_moves:
-            new_position = do_move(*position, move, current_player)
+        for move_index, move in enumerate(legal_moves):
+            board.make(move)
             _, eval = minimax(
-                position=new_position,
+                position=board,
                 depth=depth - 1,
                 alpha=alpha,
                 beta=beta,
@@ -108,20 +423,35 @@ def minimax(
                 current_depth=(current_depth + 1),
                 is_root=False,
                 global_board_state=global_board_state,
+                heuristic=heuristic,
+                transposition_table=transposition_table,
+                move_orderer=move_orderer,
+                quiescence_depth=quiescence_depth,
+                time_control=time_control,
+                staged=staged,
             )
+            board.unmake()
             if eval > max_eval:
                 max_eval = eval
+                node_best_move = move
                 best_move = move if is_root else None
+                if is_root and time_control is not None and eval > alpha_orig:
+                    time_control.root_best_move = move  # kept if this iteration times out
                 alpha = max(alpha, eval)
                 if beta <= alpha:
+                    if move_orderer is not None:
+                        move_orderer.record_cutoff(move, current_depth, depth, move_index)
                     break
+        if transposition_table is not None:
+            flag = bound_flag(max_eval, alpha_orig, beta_orig)
+            transposition_table.store(key, depth, max_eval, flag, node_best_move)
         return best_move, max_eval
     else:  # MINIMIZING PLAYER
         min_eval = float("inf")
-        for move in legal_moves:
-            new_position = do_move(*position, move, current_player)
+        for move_index, move in enumerate(legal_moves):
+            board.make(move)
             _, eval = minimax(
-                position=new_position,
+                position=board,
                 depth=depth - 1,
                 alpha=alpha,
                 beta=beta,
@@ -129,16 +459,203 @@ def minimax(
                 current_depth=(current_depth + 1),
                 is_root=False,
                 global_board_state=global_board_state,
+                heuristic=heuristic,
+                transposition_table=transposition_table,
+                move_orderer=move_orderer,
+                quiescence_depth=quiescence_depth,
+                time_control=time_control,
+                staged=staged,
             )
+            board.unmake()
             if eval < min_eval:
                 min_eval = eval
+                node_best_move = move
                 best_move = move if is_root else None
+                if is_root and time_control is not None and eval < beta_orig:
+                    time_control.root_best_move = move  # kept if this iteration times out
                 beta = min(beta, eval)
                 if beta <= alpha:
+                    if move_orderer is not None:
+                        move_orderer.record_cutoff(move, current_depth, depth, move_index)
                     break
+        if transposition_table is not None:
+            flag = bound_flag(min_eval, alpha_orig, beta_orig)
+            transposition_table.store(key, depth, min_eval, flag, node_best_move)
         return best_move, min_eval
 
 
+def pvs(
+    position,
+    depth,
+    alpha,
+    beta,
+    current_player,
+    current_depth=0,
+    global_board_state=None,
+    heuristic=None,
+    transposition_table=None,
+    key=None,
+    move_orderer=None,
+    quiescence_depth=0,
+    time_control=None,
+    staged=True,
+):
+    """
+    Principal Variation Search (NegaScout) in negamax form.
+
+    Scores are from the point of view of the side to move. The first move at each node is
+    searched with the full window; the others are scouted with a null window (alpha, alpha + 1)
+    and re-searched with the full window only if they fail high inside it. position is a
+    (WP, BP, K) tuple or a BoardState walked in place, as in minimax.
+        Output: (score, principal variation as a list of moves starting at this node)
+    """
+    global NC
+    NC += 1
+    if time_control is not None:
+        time_control.check()
+
+    if isinstance(position, BoardState):
+        board = position
+    else:
+        board = BoardState(*position, current_player, key)
+    key = board.key
+    sign = 1 if current_player == PlayerTurn.WHITE else -1
+    is_pv_node = beta - alpha > 1
+
+    hash_move = None
+    if transposition_table is not None:
+        entry = transposition_table.probe(key)
+        if entry is not None:
+            hash_move = entry[4]
+            if not is_pv_node:  # PV nodes always search so the returned PV is complete
+                # The table stores WHITE-relative scores like minimax; convert the window.
+                if sign > 0:
+                    score = transposition_table.cutoff_score(entry, depth, alpha, beta)
+                else:
+                    score = transposition_table.cutoff_score(entry, depth, -beta, -alpha)
+                if score is not None:
+                    return sign * score, []
+
+    if depth == 0 and quiescence_depth:
+        white_alpha, white_beta = (alpha, beta) if sign > 0 else (-beta, -alpha)
+        eval = quiescence(
+            board,
+            white_alpha,
+            white_beta,
+            current_player,
+            quiescence_depth,
+            current_depth,
+            global_board_state,
+            heuristic,
+            time_control,
+        )
+        if transposition_table is not None:
+            flag = bound_flag(eval, white_alpha, white_beta)
+            transposition_table.store(key, 0, eval, flag, None)
+        return sign * eval, []
+
+    WP, BP, K = position = board.position
+    if staged and depth > 0 and has_legal_moves(WP, BP, K, current_player):
+        legal_moves = generate_staged_moves(
+            position, current_player, current_depth, depth, hash_move, move_orderer, key
+        )
+    else:
+        legal_moves = cached_legal_moves(
+            WP, BP, K, current_player, key, UNIQUE_CAPTURES
+        )
+        if depth == 0 or not legal_moves:
+            eval = evaluate(
+                position,
+                current_player,
+                legal_moves,
+                current_depth,
+                global_board_state,
+                heuristic,
+            )
+            if transposition_table is not None:
+                transposition_table.store(key, depth, eval, EXACT, None)
+            return sign * eval, []
+        legal_moves = order_moves(
+            legal_moves,
+            position,
+            current_player,
+            current_depth,
+            depth,
+            hash_move,
+            move_orderer,
+        )
+
+    alpha_orig = alpha
+    best_score = float("-inf")
+    best_pv = []
+    child_args = dict(
+        position=board,
+        depth=depth - 1,
+        current_player=switch_player(current_player),
+        current_depth=current_depth + 1,
+        global_board_state=global_board_state,
+        heuristic=heuristic,
+        transposition_table=transposition_table,
+        move_orderer=move_orderer,
+        quiescence_depth=quiescence_depth,
+        time_control=time_control,
+        staged=staged,
+    )
+    for move_index, move in enumerate(legal_moves):
+        board.make(move)
+        if move_index == 0:
+            score, child_pv = pvs(alpha=-beta, beta=-alpha, **child_args)
+            score = -score
+        else:
+            score, child_pv = pvs(alpha=-alpha - 1, beta=-alpha, **child_args)
+            score = -score
+            if alpha < score < beta:  # scout failed high: re-search with the full window
+                score, child_pv = pvs(alpha=-beta, beta=-score, **child_args)
+                score = -score
+        board.unmake()
+
+        if score > best_score:
+            best_score = score
+            best_pv = [move] + child_pv
+            if current_depth == 0 and time_control is not None and score > alpha_orig:
+                time_control.root_best_move = move  # kept if this iteration times out
+        if score > alpha:
+            alpha = score
+        if alpha >= beta:
+            if move_orderer is not None:
+                move_orderer.record_cutoff(move, current_depth, depth, move_index)
+            break
+
+    if transposition_table is not None:
+        if best_score <= alpha_orig:
+            flag = UPPER_BOUND if sign > 0 else LOWER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND if sign > 0 else UPPER_BOUND
+        else:
+            flag = EXACT
+        transposition_table.store(key, depth, sign * best_score, flag, best_pv[0])
+    return best_score, best_pv
+
+
+def search_root(search, alpha, beta, current_player, **kwargs):
+    """
+    Searches the root with the selected search mode.
+        Output: (best move, WHITE-relative score, principal variation)
+    """
+    if search == "pvs":
+        if current_player == PlayerTurn.WHITE:
+            score, pv = pvs(alpha=alpha, beta=beta, current_player=current_player, **kwargs)
+        else:  # pvs works from the side to move's point of view
+            score, pv = pvs(alpha=-beta, beta=-alpha, current_player=current_player, **kwargs)
+            score = -score
+        return (pv[0] if pv else None), score, pv
+
+    move, score = minimax(
+        alpha=alpha, beta=beta, current_player=current_player, is_root=True, **kwargs
+    )
+    return move, score, [move]
+
+
 def AI(
     position,
     current_player,
@@ -147,36 +664,132 @@ def AI(
     heuristic="smart",
     early_stop_depth=999,
     global_board_state=None,
+    tt_size_mb=16,
+    move_orderer=None,
+    search="minimax",
+    aspiration_window=50,
+    aspiration_growth=4,
+    quiescence_depth=QUIESCENCE_DEPTH,
+    soft_time_limit=None,
+    time_control=None,
+    manage_time=False,
+    transposition_table=None,
+    staged=True,
 ):
+    """
+    Iterative deepening search. search selects "minimax" (fail-hard minimax with separate
+    max/min branches) or "pvs" (negamax Principal Variation Search). The principal variation,
+    score and node count of the last completed iteration are left in SEARCH_INFO.
+
+    From depth 2 on, each iteration starts with the window (score - aspiration_window,
+    score + aspiration_window) around the previous score; a fail low or fail high multiplies
+    the window by aspiration_growth on that side and searches again. aspiration_window=0
+    searches every iteration with an infinite window.
+
+    Leaves with a capture pending are extended by up to quiescence_depth capture plies
+    (0 disables quiescence search and evaluates them statically).
+
+    Time is kept by a TimeControl polled inside the search, so AI can run in any thread.
+    time_limit is the hard limit at which a running iteration is abandoned; no new iteration
+    starts after soft_time_limit (defaults to time_limit). Pass time_control to stop the
+    search from another thread with time_control.stop().
+
+    With manage_time, the soft limit is planned from the position (see
+    position_time_fraction) and rescaled after every iteration from best-move stability and
+    score swings (see iteration_time_factor); it never exceeds time_limit. It has no effect
+    when soft_time_limit is given or time_control is passed in, whose deadlines are kept.
+
+    With staged, moves are produced in stages by generate_staged_moves in the same order as
+    the eager path (staged=False), so a cutoff skips generating and sorting the rest.
+    """
+    if search not in ("minimax", "pvs"):
+        raise ValueError("Invalid search mode specified")
+
+    # A Position (see position.py) is searched as its (WP, BP, K) tuple, which unpacks
+    # faster at every node and leaf.
+    position = tuple(position)
+    if global_board_state is not None:
+        global_board_state = tuple(global_board_state)
+
+    SEARCH_INFO.clear()
     best_move = None
     best_score = float("-inf") if current_player == PlayerTurn.WHITE else float("inf")
     depth_reached = 0
     stable_depths = 0  # Track the number of depths where the best move hasn't changed
     last_best_move = None
 
-    start_time = time.time()
-    legal_moves = generate_legal_moves(*position, current_player)
+    # A time control passed in belongs to the caller: its deadlines are never moved.
+    if time_control is None:
+        time_control = TimeControl(time_limit, soft_time_limit)
+    else:
+        manage_time = False
+    legal_moves = cached_legal_moves(*position, current_player, None, UNIQUE_CAPTURES)
+
+    manage_time = manage_time and soft_time_limit is None and bool(legal_moves)
+    if manage_time:
+        planned_fraction = position_time_fraction(position, legal_moves)
+        time_control.allocate(planned_fraction)
+    move_stability = 0  # iterations the root move has survived, whatever the score does
+    previous_move = previous_score = None
+
+    # One table per call: entries depend on global_board_state, which changes every move.
+    # A table passed in (e.g. shared with other search processes) is used as is.
+    if transposition_table is None and tt_size_mb:
+        transposition_table = TranspositionTable(tt_size_mb)
+
+    # Pass the same orderer on every move of a game to carry the history table between searches.
+    if move_orderer is None:
+        move_orderer = MoveOrderer()
+    else:
+        move_orderer.age()
+    move_orderer.reset_stats()
 
-    signal.signal(signal.SIGALRM, signal_handler)
-    signal.alarm(time_limit)
+    aspiration_stats = {"iterations": 0, "re_searches": 0, "fail_lows": 0, "fail_highs": 0}
+    SEARCH_INFO["aspiration"] = aspiration_stats
 
     try:
         for depth in range(1, max_depth + 1):
             current_depth = 0  # Initialize currentDepth at the root level
+            time_control.root_best_move = None
             alpha = float("-inf")
             beta = float("inf")
 
-            move, score = minimax(
-                position=position,
-                depth=depth,
-                alpha=alpha,
-                beta=beta,
-                current_player=current_player,
-                current_depth=current_depth,
-                is_root=True,
-                global_board_state=global_board_state,
-                heuristic=heuristic,
-            )
+            # Aspiration window around the previous iteration's score
+            window = aspiration_window
+            if aspiration_window and depth > 1 and abs(best_score) != float("inf"):
+                alpha = best_score - window
+                beta = best_score + window
+
+            while True:
+                move, score, pv = search_root(
+                    search,
+                    position=position,
+                    depth=depth,
+                    alpha=alpha,
+                    beta=beta,
+                    current_player=current_player,
+                    current_depth=current_depth,
+                    global_board_state=global_board_state,
+                    heuristic=heuristic,
+                    transposition_table=transposition_table,
+                    move_orderer=move_orderer,
+                    quiescence_depth=quiescence_depth,
+                    time_control=time_control,
+                    staged=staged,
+                )
+                if score <= alpha:  # fail low: widen downwards and search again
+                    aspiration_stats["fail_lows"] += 1
+                    window *= aspiration_growth
+                    alpha = score - window
+                elif score >= beta:  # fail high: widen upwards and search again
+                    aspiration_stats["fail_highs"] += 1
+                    window *= aspiration_growth
+                    beta = score + window
+                else:
+                    break
+                aspiration_stats["re_searches"] += 1
+
+            aspiration_stats["iterations"] += 1
 
             # Debugging information
             # print(
@@ -204,20 +817,54 @@ def AI(
 
             depth_reached = depth
             last_best_move = best_move
+            SEARCH_INFO.update(depth=depth, score=score, pv=pv, nodes=NC, qnodes=QNC)
 
-            if time.time() - start_time >= time_limit:
-                raise TimeOutException()
+            if manage_time and move is not None:
+                move_stability = move_stability + 1 if move == previous_move else 0
+                score_swing = 0 if previous_score is None else abs(score - previous_score)
+                time_control.allocate(
+                    planned_fraction * iteration_time_factor(move_stability, score_swing)
+                )
+                previous_move, previous_score = move, score
 
-            # Update legal_moves for the next iteration
-            legal_moves = generate_legal_moves(*position, current_player)
+            if time_control.soft_expired():
+                break  # Not enough time left to finish another iteration
 
-        signal.alarm(0)  # Cancel the alarm if we finished in time
+            # Update legal_moves for the next iteration
+            legal_moves = cached_legal_moves(
+                *position, current_player, None, UNIQUE_CAPTURES
+            )
 
     except TimeOutException:
-        signal.alarm(0)  # Cancel the alarm since we've run out of time
+        # The root move that already beat the previous best in the abandoned iteration
+        # is at least as good as the last completed one.
+        if time_control.root_best_move is not None:
+            best_move = time_control.root_best_move
+            SEARCH_INFO["partial_depth"] = depth_reached + 1
         if best_move is None and legal_moves:
             best_move = legal_moves[0]  # Select the first legal move as a last resort
 
+    SEARCH_INFO["soft_limit"] = time_control.soft_limit()
     print("Total nodes evaluated:", NC)
+    if quiescence_depth:
+        print("Quiescence nodes:", QNC)
     print("Depth reached:", depth_reached)
+    if SEARCH_INFO.get("pv") and search == "pvs":
+        print("Principal variation:", convert_move_list_to_pdn(SEARCH_INFO["pv"]))
+    if transposition_table is not None:
+        tt_stats = transposition_table.stats()
+        print(
+            f"TT hits: {tt_stats['hits']}/{tt_stats['probes']} ({tt_stats['hit_rate']:.1%}), cutoffs: {tt_stats['cutoffs']}"
+        )
+    if checkers.LEGAL_MOVE_CACHE is not None:  # kept across searches, so totals so far
+        cache_stats = checkers.LEGAL_MOVE_CACHE.stats()
+        lookups = cache_stats["hits"] + cache_stats["misses"]
+        print(
+            f"Legal-move cache hits: {cache_stats['hits']}/{lookups} ({cache_stats['hit_rate']:.1%}), {cache_stats['memory_mb']:.1f} MB"
+        )
+    print(f"Cutoffs on first move: {move_orderer.first_move_cutoff_rate():.1%}")
+    if aspiration_window:
+        print(
+            f"Aspiration re-searches: {aspiration_stats['re_searches']} in {aspiration_stats['iterations']} iterations"
+        )
     return best_move, depth_reached
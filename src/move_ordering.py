@@ -0,0 +1,115 @@
+NUM_KILLERS = 2  # Killer moves remembered per ply.
+
+# Remaining depth at or above which children are still sorted with the full static evaluation.
+# Below it, ordering comes only from the hash move, killers and history (no do_move/eval per child).
+EVAL_SORT_MIN_DEPTH = 5
+
+
+class MoveOrderer:
+    """
+    Move ordering for alpha-beta that does not evaluate children.
+
+    Moves are tried in the order: hash move, promotions, killer moves for the ply (quiet moves
+    that caused a cutoff in a sibling node), then by a from/to history score that grows with
+    every cutoff. Jump sequences keep their longest-first order, with history breaking ties.
+    """
+
+    def __init__(self, eval_sort_min_depth=EVAL_SORT_MIN_DEPTH):
+        self.eval_sort_min_depth = eval_sort_min_depth
+        self.killers = []
+        self.history = [[0] * 32 for _ in range(32)]
+
+        # Counters
+        self.cutoff_nodes = 0  # nodes where some move caused a beta cutoff
+        self.first_move_cutoffs = 0  # ... and it was the first move searched
+
+    def age(self):
+        """
+        Called between searches: halves the history scores and forgets killer moves.
+        """
+        for row in self.history:
+            for to_square in range(32):
+                row[to_square] >>= 1
+        self.killers = []
+
+    def reset_stats(self):
+        self.cutoff_nodes = 0
+        self.first_move_cutoffs = 0
+
+    def killers_at(self, ply):
+        while len(self.killers) <= ply:
+            self.killers.append([None] * NUM_KILLERS)
+        return self.killers[ply]
+
+    def order(self, legal_moves, ply, hash_move=None, promotions=()) -> list:
+        """
+        Returns a new list with the legal moves in the order they should be searched: the
+        moves from first_moves, then the rest by history (see sort_by_history).
+        """
+        first = first_moves(legal_moves, hash_move, promotions, self.killers_at(ply))
+        rest = [move for move in legal_moves if move not in first]
+        return first + self.sort_by_history(rest)
+
+    def sort_by_history(self, moves, history=None) -> list:
+        """
+        Returns the moves sorted by history score, jump sequences longest first with history
+        breaking ties. history defaults to the current table; a dict of saved rows (see
+        save_history) sorts by the scores as they were when it was saved.
+        """
+        if history is None:
+            history = self.history
+        if moves and isinstance(moves[0], list):
+            return sorted(
+                moves,
+                key=lambda move: (len(move), history[move[0]][move[-1]]),
+                reverse=True,
+            )
+        return sorted(moves, key=lambda move: history[move[0]][move[-1]], reverse=True)
+
+    def save_history(self, squares) -> dict:
+        """
+        Copies the history rows of the given origin squares.
+        """
+        return {square: self.history[square][:] for square in squares}
+
+    def record_cutoff(self, move, ply, depth, move_index):
+        """
+        Updates killers, history and counters after the move at move_index caused a cutoff.
+        """
+        self.cutoff_nodes += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+
+        self.history[move[0]][move[-1]] += depth * depth
+
+        if isinstance(move, tuple):  # only quiet moves become killers
+            killers = self.killers_at(ply)
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+
+    def first_move_cutoff_rate(self) -> float:
+        return self.first_move_cutoffs / self.cutoff_nodes if self.cutoff_nodes else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "cutoff_nodes": self.cutoff_nodes,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "first_move_cutoff_rate": self.first_move_cutoff_rate(),
+        }
+
+
+def first_moves(legal_moves, hash_move=None, promotions=(), killers=()) -> list:
+    """
+    Returns the moves searched before the sorted rest: the hash move, then for quiet moves
+    the promotions and the killer moves, each once and only if legal.
+    """
+    first = [hash_move] if hash_move is not None and hash_move in legal_moves else []
+    if not isinstance(legal_moves[0], list):
+        first += [move for move in promotions if move not in first]
+        first += [
+            killer
+            for killer in killers
+            if killer is not None and killer not in first and killer in legal_moves
+        ]
+    return first
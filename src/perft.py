@@ -0,0 +1,251 @@
+import argparse
+import pathlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+parent = pathlib.Path(__file__).parent.absolute()
+sys.path.append(str(parent))
+
+import checkers
+from checkers import *
+from util.fen_pdn_helper import setup_board_from_position_lists
+from util.helpers import *
+
+# Published perft values for English draughts from the fresh board, black to move.
+# A move generator change that alters any of them has changed which moves are legal.
+KNOWN_PERFT = {
+    1: 7,
+    2: 49,
+    3: 302,
+    4: 1469,
+    5: 7361,
+    6: 36768,
+    7: 179740,
+    8: 845931,
+    9: 3963680,
+    10: 18391564,
+    11: 85242128,
+    12: 388623673,
+}
+
+# Middlegame positions from random games where most nodes of the tree have a capture to
+# make, for timing the capture generator: (white pieces, black pieces, side to move).
+CAPTURE_POSITIONS = {
+    "contact": (
+        ["A5", "B6", "H6", "A7", "C7", "E7", "G7", "B8", "F8", "H8"],
+        ["A1", "C1", "E1", "G1", "B2", "H2", "A3", "C3", "H4", "E5"],
+        PlayerTurn.BLACK,
+    ),
+    "white king": (
+        ["KE1", "A3", "B4", "E5", "H6", "A7", "E7", "B8", "D8", "H8"],
+        ["A1", "C1", "B2", "H2", "E3", "G3"],
+        PlayerTurn.BLACK,
+    ),
+    "open center": (
+        ["KC1", "C5", "E5", "D6", "F6", "A7", "E7", "H8"],
+        ["A1", "G1", "D2", "F2", "C3", "G3", "G7"],
+        PlayerTurn.BLACK,
+    ),
+}
+
+
+# King endgames where a king can take a ring of pieces either way round, so different
+# capture paths lead to the same position: (white pieces, black pieces, side to move).
+KING_POSITIONS = {
+    "ring C1": (
+        ["KC1", "KG7"],
+        ["B2", "D2", "B4", "D4", "KF6", "KH8"],
+        PlayerTurn.WHITE,
+    ),
+    "ring D2": (
+        ["KD2", "KH6", "B6"],
+        ["C3", "E3", "C5", "E5", "KA7", "KE7"],
+        PlayerTurn.BLACK,
+    ),
+    "ring E1": (
+        ["KE1", "KB8", "D6"],
+        ["D2", "F2", "D4", "F4", "KG7", "KA5"],
+        PlayerTurn.BLACK,
+    ),
+    "ring A3": (
+        ["KA3", "KF6", "H2"],
+        ["B2", "D2", "B4", "D4", "KC7", "KH8"],
+        PlayerTurn.WHITE,
+    ),
+}
+
+
+def perft(WP, BP, K, player, depth, cache=None, unique_captures=False) -> int:
+    """
+    Counts the leaf nodes of the legal move tree to the given depth. The last ply is
+    bulk-counted from the length of the move list. Pass a dict as cache to reuse the counts
+    of transposed positions, and unique_captures to count capture sequences that lead to
+    the same position once.
+    """
+    if depth == 0:
+        return 1
+    legal_moves = generate_legal_moves(WP, BP, K, player, unique_captures) or []
+    if depth == 1:
+        return len(legal_moves)
+
+    if cache is not None:
+        key = (WP, BP, K, player, depth)
+        if key in cache:
+            return cache[key]
+
+    opponent = switch_player(player)
+    nodes = 0
+    for move in legal_moves:
+        nodes += perft(
+            *do_move(WP, BP, K, move, player),
+            opponent,
+            depth - 1,
+            cache,
+            unique_captures,
+        )
+
+    if cache is not None:
+        cache[key] = nodes
+    return nodes
+
+
+def _perft_root_move(WP, BP, K, player, move, depth, use_cache):
+    return perft(
+        *do_move(WP, BP, K, move, player),
+        switch_player(player),
+        depth - 1,
+        {} if use_cache else None,
+    )
+
+
+def divide(WP, BP, K, player, depth, use_cache=False, pool=None) -> list:
+    """
+    Returns [(move, nodes)] for every root move. With a process pool the root moves are
+    counted in parallel; each keeps its own cache when use_cache is set.
+    """
+    legal_moves = generate_legal_moves(WP, BP, K, player) or []
+    if depth <= 0:
+        return []
+    if pool is not None:
+        futures = [
+            pool.submit(_perft_root_move, WP, BP, K, player, move, depth, use_cache)
+            for move in legal_moves
+        ]
+        return [(move, future.result()) for move, future in zip(legal_moves, futures)]
+
+    cache = {} if use_cache else None
+    return [
+        (
+            move,
+            perft(
+                *do_move(WP, BP, K, move, player), switch_player(player), depth - 1, cache
+            ),
+        )
+        for move in legal_moves
+    ]
+
+
+def run_perft(position, player, depth, show_divide=False, use_cache=False, workers=1):
+    """
+    Runs perft at every depth from 1 to depth and prints the node count, time and nodes per
+    second for each.
+        Output: {depth: nodes}
+    """
+    results = {}
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    print(f"{'depth':<8}{'nodes':>14}{'time (s)':>10}{'nodes/s':>14}")
+    for current_depth in range(1, depth + 1):
+        start = time.perf_counter()
+        counts = divide(*position, player, current_depth, use_cache, pool)
+        seconds = time.perf_counter() - start
+        nodes = sum(count for _, count in counts)
+        results[current_depth] = nodes
+        nps = nodes / max(seconds, 1e-9)
+        print(f"{current_depth:<8}{nodes:>14}{seconds:>10.3f}{nps:>14.0f}")
+
+    if checkers.JUMP_TREE_CACHE is not None:
+        stats = checkers.JUMP_TREE_CACHE.stats()
+        print(
+            f"jump cache: {stats['entries']} trees, {stats['hit_rate']:.1%} hits, "
+            f"{stats['evictions']} evictions, {stats['memory_mb']:.1f} MB"
+        )
+
+    if show_divide:
+        print(f"\nDivide at depth {depth}:")
+        for move, count in counts:
+            print(f"{convert_move_list_to_pdn([move])}: {count}")
+    if pool is not None:
+        pool.shutdown()
+    return results
+
+
+def check_known_values(results) -> bool:
+    """
+    Compares perft counts from the fresh board with KNOWN_PERFT and prints any mismatch.
+    """
+    ok = True
+    for depth, nodes in results.items():
+        expected = KNOWN_PERFT.get(depth)
+        if expected is not None and nodes != expected:
+            print(f"MISMATCH at depth {depth}: got {nodes}, expected {expected}")
+            ok = False
+    if ok:
+        print("All counts match the known perft values.")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count move-generator leaf nodes (perft).")
+    parser.add_argument("depth", type=int, help="search depth in plies")
+    parser.add_argument("--board", help="sable board file (default: fresh board)")
+    parser.add_argument(
+        "--divide", action="store_true", help="print counts per root move"
+    )
+    parser.add_argument(
+        "--hash", action="store_true", help="reuse counts of transposed positions"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="processes to split root moves over"
+    )
+    parser.add_argument(
+        "--captures", action="store_true", help="run on the CAPTURE_POSITIONS instead"
+    )
+    parser.add_argument(
+        "--jump-cache",
+        action="store_true",
+        help="memoize capture trees (check against a run without it)",
+    )
+    args = parser.parse_args(argv)
+    if args.jump_cache:
+        checkers.JUMP_TREE_CACHE = JumpTreeCache()
+
+    if args.captures:
+        for name, (white, black, player) in CAPTURE_POSITIONS.items():
+            print(f"\n{name}")
+            run_perft(
+                setup_board_from_position_lists(white, black),
+                player,
+                args.depth,
+                args.divide,
+                args.hash,
+                args.workers,
+            )
+        return 0
+
+    if args.board:
+        WP, BP, K, current_player, _ = load_game_from_sable_file(args.board)
+        player = PlayerTurn.BLACK if current_player == 1 else PlayerTurn.WHITE
+    else:
+        (WP, BP, K), player = get_fresh_board(), PlayerTurn.BLACK
+
+    results = run_perft(
+        (WP, BP, K), player, args.depth, args.divide, args.hash, args.workers
+    )
+    if not args.board and not check_known_values(results):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+from checkers import cached_legal_moves, do_move, do_move_hashed
+from util.bitboard import popcount
+from util.helpers import (
+    MASK_32,
+    PlayerTurn,
+    flip_position,
+    get_fresh_board,
+    switch_player,
+)
+from util.zobrist import hash_position
+
+
+class Position:
+    """
+    Immutable position: WP, BP, K and the side to move, with the Zobrist key and derived
+    bitboards and piece counts computed on first use and kept.
+
+    A Position iterates as (WP, BP, K) and compares equal to that tuple, so it goes wherever
+    a position tuple does (do_move(*position, ...), global_board_state=position). play(move)
+    returns the successor, updating the key incrementally once it is known.
+    """
+
+    __slots__ = ("WP", "BP", "K", "turn", "_key", "_masks", "_counts")
+
+    def __init__(self, WP, BP, K, turn=PlayerTurn.BLACK, key=None):
+        set_slot = object.__setattr__
+        set_slot(self, "WP", WP)
+        set_slot(self, "BP", BP)
+        set_slot(self, "K", K)
+        set_slot(self, "turn", turn)
+        set_slot(self, "_key", key)
+        set_slot(self, "_masks", None)
+        set_slot(self, "_counts", None)
+
+    @classmethod
+    def fresh(cls):
+        """
+        The starting position, black to move.
+        """
+        return cls(*get_fresh_board(), PlayerTurn.BLACK)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position is immutable, use play() for the next position")
+
+    def __delattr__(self, name):
+        raise AttributeError("Position is immutable")
+
+    def __reduce__(self):  # pickled for worker processes (lazy_smp, ybwc)
+        return Position, (self.WP, self.BP, self.K, self.turn, self._key)
+
+    def __iter__(self):
+        return iter((self.WP, self.BP, self.K))
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, index):
+        return (self.WP, self.BP, self.K)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Position):
+            return tuple(self) == tuple(other) and self.turn == other.turn
+        if isinstance(other, tuple):
+            return (self.WP, self.BP, self.K) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.WP, self.BP, self.K))
+
+    def __repr__(self):
+        return f"Position({self.WP:#x}, {self.BP:#x}, {self.K:#x}, {self.turn})"
+
+    @property
+    def key(self) -> int:
+        """
+        Zobrist key of the position with its side to move (see util.zobrist).
+        """
+        if self._key is None:
+            object.__setattr__(
+                self, "_key", hash_position(self.WP, self.BP, self.K, self.turn)
+            )
+        return self._key
+
+    def _derived_masks(self):
+        if self._masks is None:
+            WP, BP, K = self.WP, self.BP, self.K
+            masks = (~(WP | BP) & MASK_32, WP & ~K, WP & K, BP & ~K, BP & K)
+            object.__setattr__(self, "_masks", masks)
+        return self._masks
+
+    @property
+    def empty(self) -> int:
+        return self._derived_masks()[0]
+
+    @property
+    def white_men(self) -> int:
+        return self._derived_masks()[1]
+
+    @property
+    def white_kings(self) -> int:
+        return self._derived_masks()[2]
+
+    @property
+    def black_men(self) -> int:
+        return self._derived_masks()[3]
+
+    @property
+    def black_kings(self) -> int:
+        return self._derived_masks()[4]
+
+    @property
+    def piece_counts(self) -> tuple:
+        """
+        (white men, white kings, black men, black kings)
+        """
+        if self._counts is None:
+            counts = tuple(popcount(mask) for mask in self._derived_masks()[1:])
+            object.__setattr__(self, "_counts", counts)
+        return self._counts
+
+    @property
+    def white_count(self) -> int:
+        white_men, white_kings, _, _ = self.piece_counts
+        return white_men + white_kings
+
+    @property
+    def black_count(self) -> int:
+        _, _, black_men, black_kings = self.piece_counts
+        return black_men + black_kings
+
+    def legal_moves(self, unique_captures=False):
+        """
+        Returns the legal moves of the side to move as a tuple, through the legal-move
+        cache when one is set (see checkers.cached_legal_moves), None if it has none.
+        """
+        return cached_legal_moves(
+            self.WP, self.BP, self.K, self.turn, self.key, unique_captures
+        )
+
+    def play(self, move):
+        """
+        Returns the position after the side to move plays move (tuple/list form or encoded).
+        """
+        next_turn = switch_player(self.turn)
+        if self._key is None:
+            WP, BP, K = do_move(self.WP, self.BP, self.K, move, self.turn)
+            return Position(WP, BP, K, next_turn)
+        WP, BP, K, key = do_move_hashed(
+            self.WP, self.BP, self.K, move, self.turn, self._key
+        )
+        return Position(WP, BP, K, next_turn, key)
+
+    def flipped(self):
+        """
+        The same game from the other side: colours swapped and the board turned round (see
+        flip_position).
+        """
+        flipped_position = flip_position(self.WP, self.BP, self.K)
+        return Position(*flipped_position, switch_player(self.turn))
@@ -0,0 +1,69 @@
+import pathlib
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import heuristic
+import minimax_alphabeta
+from checkers import *
+from minimax_alphabeta import AI
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+
+@pytest.fixture(autouse=True)
+def no_eval_noise(monkeypatch):
+    monkeypatch.setattr(heuristic.random, "randint", lambda a, b: 0)
+
+
+def search_score(position, player, **kwargs):
+    AI(
+        position,
+        player,
+        max_depth=6,
+        time_limit=30,
+        global_board_state=position,
+        tt_size_mb=0,
+        **kwargs,
+    )
+    return dict(minimax_alphabeta.SEARCH_INFO)
+
+
+@pytest.mark.parametrize("search", ["minimax", "pvs"])
+@pytest.mark.parametrize(
+    "position, player",
+    [
+        (get_fresh_board(), PlayerTurn.BLACK),
+        (
+            setup_board_from_position_lists(
+                ["D4", "F4", "KD2", "D6", "F6"], ["KC5", "E5", "KG3", "KH8"]
+            ),
+            PlayerTurn.WHITE,
+        ),
+    ],
+)
+def test_narrow_window_gives_full_window_score(position, player, search):
+    full = search_score(position, player, search=search, aspiration_window=0)
+    narrow = search_score(
+        position, player, search=search, aspiration_window=1, aspiration_growth=2
+    )
+    assert narrow["score"] == full["score"]
+    assert narrow["depth"] == full["depth"] == 6
+    assert narrow["aspiration"]["re_searches"] > 0
+    assert full["aspiration"]["re_searches"] == 0
+
+
+def test_re_search_statistics_add_up():
+    info = search_score(
+        get_fresh_board(), PlayerTurn.BLACK, aspiration_window=1, aspiration_growth=2
+    )
+    stats = info["aspiration"]
+    assert stats["iterations"] == 6
+    assert stats["re_searches"] == stats["fail_lows"] + stats["fail_highs"]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,39 @@
+import pathlib
+import random
+import sys
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+from util.bitboard import *
+from util.masks import MASK_32
+
+
+def scan_bits(bitboard):
+    return [index for index in range(32) if bitboard & (1 << index)]
+
+
+def test_primitives_match_a_bit_scan():
+    rng = random.Random(11)
+    bitboards = [0, 1, 1 << 31, MASK_32, 0x0000FFFF, 0xFFFF0000]
+    bitboards += [rng.getrandbits(32) & rng.getrandbits(32) for _ in range(2000)]
+    for bitboard in bitboards:
+        indices = scan_bits(bitboard)
+        assert popcount(bitboard) == table_popcount(bitboard) == len(indices)
+        assert list(bit_indices(bitboard)) == list(iter_bits(bitboard)) == indices
+        assert lowest_bit(bitboard) == (indices[0] if indices else -1)
+        assert highest_bit(bitboard) == (indices[-1] if indices else -1)
+
+
+def test_lookup_tables():
+    assert len(POPCOUNT_16) == 1 << 16 and POPCOUNT_16[0xFFFF] == 16
+    assert BIT_INDICES_8[0][0b10100001] == (0, 5, 7)
+    assert BIT_INDICES_8[3][0b11] == (24, 25)
+
+
+def test_reverse_bits():
+    rng = random.Random(12)
+    for bitboard in [0, 1, MASK_32] + [rng.getrandbits(32) for _ in range(500)]:
+        reversed_indices = [31 - index for index in scan_bits(bitboard)]
+        assert sorted(reversed_indices) == scan_bits(reverse_bits(bitboard))
+        assert reverse_bits(reverse_bits(bitboard)) == bitboard
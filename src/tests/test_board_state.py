@@ -0,0 +1,103 @@
+import pathlib
+import random
+import sys
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import heuristic
+import minimax_alphabeta
+from board_state import *
+from checkers import *
+from minimax_alphabeta import minimax, pvs, quiescence
+from transposition_table import TranspositionTable
+from util.fen_pdn_helper import *
+from util.helpers import *
+from util.zobrist import hash_position
+
+
+def snapshot(board):
+    return (
+        board.position,
+        board.turn,
+        board.key,
+        board.white_count,
+        board.black_count,
+    )
+
+
+def test_make_matches_do_move_and_unmake_restores_in_random_games():
+    rng = random.Random(5)
+    for _ in range(30):
+        board = BoardState(*get_fresh_board(), PlayerTurn.BLACK)
+        snapshots = []
+        for _ in range(150):
+            legal_moves = board.legal_moves()
+            if not legal_moves:
+                break
+            move = rng.choice(legal_moves)
+            expected = do_move(*board.position, move, board.turn)
+            snapshots.append(snapshot(board))
+            board.make(move)
+
+            assert board.position == expected
+            assert board.key == hash_position(*board.position, board.turn)
+            assert board.white_count == count_bits(board.WP)
+            assert board.black_count == count_bits(board.BP)
+
+        while snapshots:
+            board.unmake()
+            assert snapshot(board) == snapshots.pop()
+
+
+def test_make_capturing_a_king_with_promotion():
+    WP, BP, K = setup_board_from_position_lists(
+        white_positions=["E3", "KE5", "E7"], black_positions=["C1", "D2"]
+    )
+    board = BoardState(WP, BP, K, PlayerTurn.BLACK)
+    encoded = board.make(board.legal_moves()[0])  # [5, 14, 21, 30]
+
+    assert board.position == setup_board_from_position_lists([], ["C1", "KF8"])
+    assert board.turn == PlayerTurn.WHITE
+    assert (board.white_count, board.black_count) == (0, 2)
+    assert board.key == hash_position(*board.position, PlayerTurn.WHITE)
+
+    assert board.unmake() == encoded
+    assert board.position == (WP, BP, K)
+    assert board.key == hash_position(WP, BP, K, PlayerTurn.BLACK)
+
+
+def test_search_walks_a_board_in_place_and_restores_it(monkeypatch):
+    monkeypatch.setattr(heuristic.random, "randint", lambda a, b: 0)
+    position = setup_board_from_position_lists(
+        ["D4", "F4", "KD2", "D6", "F6"], ["KC5", "E5", "KG3", "KH8"]
+    )
+    inf = float("inf")
+    searches = [
+        lambda root: minimax(
+            root,
+            5,
+            -inf,
+            inf,
+            PlayerTurn.WHITE,
+            is_root=True,
+            global_board_state=position,
+            transposition_table=TranspositionTable(1),
+            quiescence_depth=4,
+        ),
+        lambda root: pvs(
+            root, 5, -inf, inf, PlayerTurn.WHITE, global_board_state=position
+        ),
+        lambda root: quiescence(
+            root, -inf, inf, PlayerTurn.WHITE, 8, global_board_state=position
+        ),
+    ]
+    for search in searches:
+        results = []
+        for root in (position, BoardState(*position, PlayerTurn.WHITE)):
+            minimax_alphabeta.NC = minimax_alphabeta.QNC = 0
+            before = snapshot(root) if isinstance(root, BoardState) else None
+            results.append((search(root), minimax_alphabeta.NC, minimax_alphabeta.QNC))
+            if before is not None:
+                assert snapshot(root) == before and not root.history
+        assert results[0] == results[1]
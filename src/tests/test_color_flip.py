@@ -0,0 +1,67 @@
+import pathlib
+import random
+import sys
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+from checkers import *
+from heuristic import (
+    calculate_safe_black_pieces,
+    calculate_total_distance_to_promotion_black,
+    count_black_pieces_that_can_be_captured_by_white,
+    count_white_pieces_that_can_be_captured_by_black,
+)
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+
+def mirrored(move):
+    squares = [31 - square for square in move]  # square i -> 31 - i, see flip_position
+    return squares if isinstance(move, list) else tuple(squares)
+
+
+def test_flip_position():
+    WP, BP, K = setup_board_from_position_lists(["KA1", "D4"], ["H8", "KC5"])
+    assert flip_position(WP, BP, K) == setup_board_from_position_lists(
+        ["A1", "KF4"], ["KH8", "E5"]
+    )
+    assert flip_position(*get_fresh_board()) == get_fresh_board()
+
+
+def test_flipped_board_has_mirrored_moves_and_black_terms_in_random_games():
+    rng = random.Random(31)
+    for _ in range(40):
+        position, player = get_fresh_board(), PlayerTurn.BLACK
+        for _ in range(120):
+            legal_moves = generate_legal_moves(*position, player)
+            if not legal_moves:
+                break
+            WP, BP, K = position
+            flipped = flip_position(*position)
+            assert flip_position(*flipped) == position
+            flipped_moves = generate_legal_moves(*flipped, switch_player(player))
+            assert sorted(map(mirrored, legal_moves)) == sorted(flipped_moves)
+            assert get_movers_black(*position) == reverse_bits(
+                get_movers_white(*flipped)
+            )
+            assert get_jumpers_black(*position) == reverse_bits(
+                get_jumpers_white(*flipped)
+            )
+
+            # The black terms of the heuristic are the white ones on the flipped board;
+            # check them against the mirrored square maps directly.
+            safe = 0
+            for pos in bit_indices(BP):
+                behind = [WHITE_SOUTHEAST.get(pos), WHITE_SOUTHWEST.get(pos)]
+                safe += all(square is None or is_set(BP, square) for square in behind)
+            assert calculate_safe_black_pieces(BP, K) == safe
+            assert calculate_total_distance_to_promotion_black(BP, K) == sum(
+                index // 4 for index in bit_indices(BP & ~K)
+            )
+            assert count_white_pieces_that_can_be_captured_by_black(WP, BP, K) == (
+                count_black_pieces_that_can_be_captured_by_white(*flipped)
+            )
+
+            position = do_move(*position, rng.choice(legal_moves), player)
+            player = switch_player(player)
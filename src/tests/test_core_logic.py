@@ -181,5 +181,46 @@ def test_case_sensitivity():
     assert (WP, BP, K) == (WP_upper, BP_upper, K_upper)
 
 
+@pytest.mark.parametrize("pos", [0, 7, 13, 24, 31])
+def test_square_tables_match_direction_dicts(pos):
+    assert WHITE_MAN_STEPS[pos] == tuple(
+        d[pos] for d in (WHITE_SOUTHWEST, WHITE_SOUTHEAST) if d[pos] is not None
+    )
+    assert set(WHITE_KING_STEPS[pos]) == set(WHITE_MAN_STEPS[pos] + BLACK_MAN_STEPS[pos])
+    assert count_bits(BLACK_KING_STEP_MASKS[pos]) == len(BLACK_KING_STEPS[pos])
+    for jumped, landing, jumped_mask, landing_mask in BLACK_KING_JUMPS[pos]:
+        assert find_jumped_pos(pos, landing) == jumped
+        assert (jumped_mask, landing_mask) == (1 << jumped, 1 << landing)
+
+
+def test_capture_records_end_at_promotion():
+    WP, BP, K = setup_board_from_position_lists(["E3", "E5", "E7", "G7"], ["C1", "D2"])
+    jumpers = get_jumpers_black(WP, BP, K)
+    captured = S[10] | S[18] | S[26]
+    # A man is crowned on F8 and stops, even though G7 could be jumped next
+    assert generate_capture_records(WP, BP, K, jumpers, PlayerTurn.BLACK) == [
+        ([5, 14, 21, 30], captured, True)
+    ]
+
+    K = insert_piece_by_pdntext(K, "D2")  # a king carries on
+    assert generate_capture_records(WP, BP, K, jumpers, PlayerTurn.BLACK) == [
+        ([5, 14, 21, 30, 23], captured | S[27], False)
+    ]
+
+
+def test_unique_captures_keep_one_path_per_result():
+    # The king on C1 can take the ring B2, D2, D4, B4 either way round
+    WP, BP, K = setup_board_from_position_lists(["KC1"], ["B2", "D2", "B4", "D4"])
+    all_paths = generate_legal_moves(WP, BP, K, PlayerTurn.WHITE)
+    assert all_paths == [[1, 10, 17, 8, 1], [1, 8, 17, 10, 1]]
+    assert generate_legal_moves(WP, BP, K, PlayerTurn.WHITE, unique_captures=True) == [
+        [1, 10, 17, 8, 1]
+    ]
+    assert convert_move_list_to_pdn(all_paths) == [
+        "C1->E3->C5->A3->C1",
+        "C1->A3->C5->E3->C1",
+    ]
+
+
 if __name__ == "__main__":
     pytest.main()
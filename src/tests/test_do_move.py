@@ -153,6 +153,75 @@ def test_oscilate_to_test_bit_errors():
     assert (WP, BP, K) == setup_board_from_position_lists(["D4"], ["A1", "G1", "F2"])
 
 
+def test_incremental_hash_matches_full_recompute_in_random_games():
+    rng = random.Random(7)
+    for _ in range(30):
+        WP, BP, K = get_fresh_board()
+        turn = PlayerTurn.BLACK
+        key = hash_position(WP, BP, K, turn)
+        for _ in range(150):
+            legal_moves = generate_legal_moves(WP, BP, K, turn)
+            if not legal_moves:
+                break
+            move = rng.choice(legal_moves)
+            # debug=True recomputes the key from scratch and asserts equality
+            WP, BP, K, key = do_move_hashed(WP, BP, K, move, turn, key, debug=True)
+            turn = switch_player(turn)
+
+
+def test_incremental_hash_multi_jump_with_promotion():
+    WP, BP, K = setup_board_from_position_lists(
+        white_positions=["E3", "E5", "KE7"], black_positions=["C1", "D2"]
+    )
+    key = hash_position(WP, BP, K, PlayerTurn.BLACK)
+    move = generate_legal_moves(WP, BP, K, PlayerTurn.BLACK)[0]  # [5, 14, 21, 30]
+    *position, key = do_move_hashed(WP, BP, K, move, PlayerTurn.BLACK, key)
+    assert tuple(position) == setup_board_from_position_lists([], ["C1", "KF8"])
+    assert key == hash_position(*position, PlayerTurn.WHITE)
+
+
+def test_incremental_hash_debug_mode_detects_stale_key():
+    WP, BP, K = get_fresh_board()
+    with pytest.raises(AssertionError):
+        do_move_hashed(WP, BP, K, (8, 12), PlayerTurn.BLACK, key=0, debug=True)
+
+
+def test_encoded_move_multi_jump_with_promotion():
+    WP, BP, K = setup_board_from_position_lists(
+        white_positions=["E3", "E5", "KE7"], black_positions=["C1", "D2"]
+    )
+    move = generate_legal_moves(WP, BP, K, PlayerTurn.BLACK)[0]  # [5, 14, 21, 30]
+    encoded = encode_move(move, K, PlayerTurn.BLACK)
+
+    assert move_from(encoded) == 5 and move_to(encoded) == 30
+    assert captured_mask(encoded) == S[10] | S[18] | S[26]
+    assert encoded & PROMOTION_FLAG and not encoded & KING_FLAG
+    assert decode_move(encoded, WP | BP) == move
+    position = do_move(WP, BP, K, encoded, PlayerTurn.BLACK)
+    assert position == setup_board_from_position_lists([], ["C1", "KF8"])
+    decoded = decode_move(encoded, WP | BP)
+    assert convert_move_list_to_pdn([decoded]) == ["D2->F4->D6->F8"]
+
+
+def test_encoded_moves_round_trip_in_random_games():
+    rng = random.Random(11)
+    for _ in range(30):
+        WP, BP, K = get_fresh_board()
+        turn = PlayerTurn.BLACK
+        for _ in range(150):
+            legal_moves = generate_legal_moves(WP, BP, K, turn)
+            if not legal_moves:
+                break
+            for move in legal_moves:
+                encoded = encode_move(move, K, turn)
+                new_position = do_move(WP, BP, K, encoded, turn)
+                assert new_position == do_move(WP, BP, K, move, turn)
+                decoded = decode_move(encoded, WP | BP)
+                assert do_move(WP, BP, K, decoded, turn) == new_position
+            WP, BP, K = do_move(WP, BP, K, rng.choice(legal_moves), turn)
+            turn = switch_player(turn)
+
+
 # def false_king_edge_case_simulation():  # FOUND THE ERRONEOUS KING PROMOTION
 #     WP, BP, K = get_fresh_board()
 #     turn = PlayerTurn.BLACK
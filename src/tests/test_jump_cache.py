@@ -0,0 +1,61 @@
+import pathlib
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import checkers
+from checkers import *
+from perft import CAPTURE_POSITIONS, KING_POSITIONS, perft
+from util.fen_pdn_helper import *
+from util.helpers import *
+from util.jump_cache import *
+
+BOARDS = list(KING_POSITIONS.values()) + list(CAPTURE_POSITIONS.values())
+
+
+@pytest.mark.parametrize("white, black, player", BOARDS)
+def test_cached_perft_matches_uncached(monkeypatch, white, black, player):
+    position = setup_board_from_position_lists(white, black)
+    monkeypatch.setattr(checkers, "JUMP_TREE_CACHE", None)
+    expected = [perft(*position, player, depth) for depth in range(1, 6)]
+
+    cache = JumpTreeCache(max_entries=64)  # small enough to evict
+    monkeypatch.setattr(checkers, "JUMP_TREE_CACHE", cache)
+    assert [perft(*position, player, depth) for depth in range(1, 6)] == expected
+    assert cache.hits > 0 and cache.misses > 0
+
+
+def test_cached_records_match_on_repeat_lookup(monkeypatch):
+    WP, BP, K = setup_board_from_position_lists(["D4", "F4", "D6"], ["KC3", "E3"])
+    monkeypatch.setattr(checkers, "JUMP_TREE_CACHE", JumpTreeCache())
+    first = generate_capture_records(WP, BP, K, BP, PlayerTurn.BLACK)
+    second = generate_capture_records(WP, BP, K, BP, PlayerTurn.BLACK)
+    assert first == second and first
+    assert checkers.JUMP_TREE_CACHE.hits == 2  # one tree per black piece
+
+
+def test_lru_eviction_and_stats():
+    cache = JumpTreeCache(max_entries=2)
+    tree = [([9, 18], 1 << 13, False)]
+    cache.put(1, tree)
+    cache.put(2, [])
+    assert cache.get(1) is tree  # 1 is now the most recently used
+    cache.put(3, [])
+    assert cache.get(2) is None
+    assert cache.get(1) is tree
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+    assert stats["memory_mb"] > 0
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0 and cache.bytes == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,39 @@
+import pathlib
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import minimax_alphabeta
+from checkers import *
+from lazy_smp import helper_move_orderer, lazy_smp_AI
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+
+def test_helpers_order_moves_differently():
+    depths = {helper_move_orderer(i).eval_sort_min_depth for i in range(1, 5)}
+    assert len(depths) == 4
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_lazy_smp_returns_main_search_result(workers):
+    position = get_fresh_board()
+    move, depth = lazy_smp_AI(
+        position,
+        PlayerTurn.BLACK,
+        workers=workers,
+        max_depth=5,
+        time_limit=10,
+        tt_size_mb=1,
+        global_board_state=position,
+    )
+    assert move in generate_legal_moves(*position, PlayerTurn.BLACK)
+    assert depth == 5
+    assert minimax_alphabeta.SEARCH_INFO["workers"] == workers
+
+
+if __name__ == "__main__":
+    pytest.main()
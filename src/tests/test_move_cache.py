@@ -0,0 +1,114 @@
+import pathlib
+import random
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import checkers
+import heuristic
+import minimax_alphabeta
+from checkers import *
+from minimax_alphabeta import AI
+from util.fen_pdn_helper import *
+from util.helpers import *
+from util.move_cache import *
+from util.zobrist import hash_position
+
+
+def test_cached_legal_moves_match_generated_in_random_games(monkeypatch):
+    cache = LegalMoveCache()
+    monkeypatch.setattr(checkers, "LEGAL_MOVE_CACHE", cache)
+    rng = random.Random(19)
+    lookups = 0
+    for _ in range(20):
+        position, player = get_fresh_board(), PlayerTurn.BLACK
+        for _ in range(100):
+            key = hash_position(*position, player)
+            for unique_captures in (False, True):
+                legal_moves = generate_legal_moves(*position, player, unique_captures)
+                expected = tuple(legal_moves) if legal_moves else None
+                assert cached_legal_moves(*position, player, key, unique_captures) == (
+                    expected
+                )
+                assert cached_legal_moves(*position, player, None, unique_captures) == (
+                    expected
+                )  # hashed here, and a hit
+                lookups += 2
+            if not legal_moves:
+                break
+            position = do_move(*position, rng.choice(legal_moves), player)
+            player = switch_player(player)
+    assert cache.hits + cache.misses == lookups
+    assert cache.hits >= lookups // 2 and cache.collisions == 0
+
+
+def test_collision_regenerates():
+    cache = LegalMoveCache()
+    fresh = get_fresh_board()
+    cache.put(7, fresh, ((8, 12),))
+    assert cache.get(7, fresh) == ((8, 12),)
+    assert cache.get(7, (0, 0, 0)) is False
+    assert (cache.hits, cache.misses, cache.collisions) == (1, 1, 1)
+
+
+def test_captures_handed_out_cannot_change_the_cache():
+    cache = LegalMoveCache()
+    position = (1, 2, 3)
+    captures = [[9, 18], [9, 16, 25]]
+    cache.put(5, position, tuple(captures))
+    captures[0].append(27)
+    moves = cache.get(5, position)
+    assert moves == ([9, 18], [9, 16, 25])
+    moves[1].pop()
+    assert cache.get(5, position) == ([9, 18], [9, 16, 25])
+
+
+def test_lru_eviction_by_entries_and_memory():
+    cache = LegalMoveCache(max_entries=2)
+    cache.put(1, (1, 0, 0), ((0, 4),))
+    cache.put(2, (2, 0, 0), None)  # no moves is a result too
+    assert cache.get(1, (1, 0, 0)) == ((0, 4),)
+    cache.put(3, (3, 0, 0), ())
+    assert cache.get(2, (2, 0, 0)) is False  # least recently used
+    assert cache.stats()["evictions"] == 1
+
+    moves = tuple((index, index + 4) for index in range(10))
+    cache = LegalMoveCache(max_mb=3 * entry_bytes(moves) / (1024 * 1024))
+    for key in range(10):
+        cache.put(key, (key, 0, 0), moves)
+    stats = cache.stats()
+    assert stats["entries"] == 3 and stats["evictions"] == 7
+    assert stats["memory_mb"] * 1024 * 1024 == 3 * entry_bytes(moves)
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0 and cache.bytes == 0
+
+
+@pytest.mark.parametrize("search", ["minimax", "pvs"])
+def test_search_is_the_same_with_and_without_the_cache(monkeypatch, search):
+    monkeypatch.setattr(heuristic.random, "randint", lambda a, b: 0)
+    position = setup_board_from_position_lists(
+        ["D4", "F4", "KD2", "D6", "F6"], ["KC5", "E5", "KG3", "KH8"]
+    )
+    results = []
+    for cache in (None, LegalMoveCache()):
+        monkeypatch.setattr(checkers, "LEGAL_MOVE_CACHE", cache)
+        minimax_alphabeta.NC = 0
+        move, _ = AI(
+            position,
+            PlayerTurn.WHITE,
+            max_depth=6,
+            global_board_state=position,
+            search=search,
+            manage_time=False,
+        )
+        info = minimax_alphabeta.SEARCH_INFO
+        results.append((move, info["score"], info["pv"], minimax_alphabeta.NC))
+    assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,78 @@
+import pathlib
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+from checkers import *
+from minimax_alphabeta import AI
+from move_ordering import MoveOrderer
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+
+def test_hash_move_is_searched_first():
+    WP, BP, K = get_fresh_board()
+    legal_moves = generate_legal_moves(WP, BP, K, PlayerTurn.BLACK)
+    orderer = MoveOrderer()
+    ordered = orderer.order(legal_moves, ply=0, hash_move=legal_moves[-1])
+    assert ordered[0] == legal_moves[-1]
+    assert sorted(ordered) == sorted(legal_moves)
+
+
+def test_killer_moves_come_before_other_quiet_moves():
+    WP, BP, K = get_fresh_board()
+    legal_moves = generate_legal_moves(WP, BP, K, PlayerTurn.BLACK)
+    orderer = MoveOrderer()
+    orderer.record_cutoff(legal_moves[3], ply=2, depth=1, move_index=3)
+    assert orderer.order(legal_moves, ply=2)[0] == legal_moves[3]
+    assert orderer.killers_at(1) == [None, None]  # killers are per ply
+
+
+def test_history_orders_moves_and_ages():
+    WP, BP, K = get_fresh_board()
+    legal_moves = generate_legal_moves(WP, BP, K, PlayerTurn.BLACK)
+    orderer = MoveOrderer()
+    orderer.record_cutoff(legal_moves[4], ply=5, depth=3, move_index=1)
+    orderer.record_cutoff(legal_moves[2], ply=5, depth=2, move_index=0)
+    ordered = orderer.order(legal_moves, ply=0)
+    assert ordered[:2] == [legal_moves[4], legal_moves[2]]
+
+    orderer.age()
+    assert orderer.history[legal_moves[4][0]][legal_moves[4][1]] == 4
+    assert orderer.killers == []
+
+
+def test_jump_sequences_stay_longest_first():
+    WP, BP, K = setup_board_from_position_lists(
+        white_positions=["F6", "F4", "D2", "B4"], black_positions=["C1", "A3"]
+    )
+    legal_moves = generate_legal_moves(WP, BP, K, PlayerTurn.BLACK)
+    orderer = MoveOrderer()
+    shortest = min(legal_moves, key=len)
+    orderer.record_cutoff(shortest, ply=0, depth=9, move_index=1)
+    ordered = orderer.order(legal_moves, ply=0)
+    assert [len(move) for move in ordered] == sorted(
+        [len(move) for move in legal_moves], reverse=True
+    )
+
+
+def test_first_move_cutoff_rate_is_reported():
+    WP, BP, K = get_fresh_board()
+    orderer = MoveOrderer()
+    AI(
+        (WP, BP, K),
+        PlayerTurn.BLACK,
+        max_depth=5,
+        time_limit=5,
+        global_board_state=(WP, BP, K),
+        move_orderer=orderer,
+    )
+    assert orderer.cutoff_nodes > 0
+    assert 0 < orderer.first_move_cutoff_rate() <= 1
+
+
+if __name__ == "__main__":
+    pytest.main()
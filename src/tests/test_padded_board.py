@@ -0,0 +1,73 @@
+import pathlib
+import random
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+sys.path.append(str(parent.parent / "tools"))
+
+from checkers import *
+from padded_board import *
+from perft import CAPTURE_POSITIONS, KNOWN_PERFT, perft
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+
+def test_conversion_round_trip():
+    rng = random.Random(8)
+    for bitboard in [0, MASK_32] + [rng.getrandbits(32) for _ in range(500)]:
+        padded = to_padded(bitboard)
+        assert from_padded(padded) == bitboard
+        assert not padded & GHOST_SQUARES
+    for index in range(32):
+        assert to_padded(S[index]) == 1 << PADDED_SQUARE[index]
+    assert to_padded(MASK_32) == PADDED_BOARD
+
+
+def test_padded_moves_match_legal_moves_in_random_games():
+    rng = random.Random(23)
+    for _ in range(40):
+        position, player = get_fresh_board(), PlayerTurn.BLACK
+        for _ in range(150):
+            padded = tuple(to_padded(bitboard) for bitboard in position)
+            legal_moves = generate_legal_moves(*position, player)
+            padded_moves = generate_padded_moves(*padded, player)
+            if not legal_moves:
+                assert padded_moves is None
+                break
+            assert sorted(map(from_padded_move, padded_moves)) == sorted(legal_moves)
+
+            move = rng.choice(legal_moves)
+            next_position = do_move(*position, move, player)
+            assert do_padded_move(*padded, to_padded_move(move), player) == tuple(
+                to_padded(bitboard) for bitboard in next_position
+            )
+            position, player = next_position, switch_player(player)
+
+
+def test_padded_perft_known_values():
+    for depth in range(1, 7):
+        assert (
+            padded_perft(*get_padded_fresh_board(), PlayerTurn.BLACK, depth)
+            == KNOWN_PERFT[depth]
+        )
+
+
+@pytest.mark.parametrize("white, black, player", CAPTURE_POSITIONS.values())
+def test_padded_perft_matches_perft(white, black, player):
+    position = setup_board_from_position_lists(white, black)
+    padded = tuple(to_padded(bitboard) for bitboard in position)
+    assert padded_perft(*padded, player, 5) == perft(*position, player, 5)
+
+
+def test_king_on_first_row_steps_and_jumps_only_north():
+    WP, BP, K = setup_board_from_position_lists(["D2"], ["KC1"])
+    padded = tuple(to_padded(bitboard) for bitboard in (WP, BP, K))
+    moves = generate_padded_moves(*padded, PlayerTurn.BLACK)
+    assert [from_padded_move(move) for move in moves] == [[1, 10]]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,47 @@
+import pathlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+from checkers import *
+from perft import *
+from util.helpers import *
+
+
+@pytest.mark.parametrize("depth", range(1, 7))
+def test_fresh_board_matches_known_values(depth):
+    WP, BP, K = get_fresh_board()
+    assert perft(WP, BP, K, PlayerTurn.BLACK, depth) == KNOWN_PERFT[depth]
+
+
+def test_hash_and_parallel_counts_agree():
+    WP, BP, K, current_player, _ = load_game_from_sable_file(
+        parent / "boards" / "sample-cb1.txt"
+    )
+    player = PlayerTurn.BLACK if current_player == 1 else PlayerTurn.WHITE
+    plain = divide(WP, BP, K, player, 5)
+    assert divide(WP, BP, K, player, 5, use_cache=True) == plain
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert divide(WP, BP, K, player, 5, pool=pool) == plain
+    assert sum(count for _, count in plain) == perft(WP, BP, K, player, 5)
+
+
+def test_main_reports_mismatch(monkeypatch):
+    assert main(["4"]) == 0
+    monkeypatch.setitem(KNOWN_PERFT, 4, 1470)
+    assert main(["4"]) == 1
+
+
+def test_capture_positions():
+    for white, black, player in CAPTURE_POSITIONS.values():
+        position = setup_board_from_position_lists(white, black)
+        assert perft(*position, player, 4, cache={}) == perft(*position, player, 4)
+    assert main(["3", "--captures"]) == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
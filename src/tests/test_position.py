@@ -0,0 +1,83 @@
+import pathlib
+import pickle
+import random
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import heuristic
+import minimax_alphabeta
+from checkers import *
+from minimax_alphabeta import AI
+from position import Position
+from util.fen_pdn_helper import *
+from util.helpers import *
+from util.zobrist import hash_position
+
+
+def test_play_matches_do_move_in_random_games():
+    rng = random.Random(41)
+    for _ in range(20):
+        position = Position.fresh()
+        position.key  # known from here on, so play updates it incrementally
+        WP, BP, K, player = *get_fresh_board(), PlayerTurn.BLACK
+        for _ in range(120):
+            legal_moves = generate_legal_moves(WP, BP, K, player)
+            expected = tuple(legal_moves) if legal_moves else None
+            assert position.legal_moves() == expected
+            if not legal_moves:
+                break
+            move = rng.choice(legal_moves)
+            WP, BP, K = do_move(WP, BP, K, move, player)
+            player = switch_player(player)
+            position = position.play(move)
+
+            assert position == (WP, BP, K) and position.turn == player
+            assert position.key == hash_position(WP, BP, K, player)
+            assert position.piece_counts == (
+                count_bits(WP & ~K),
+                count_bits(WP & K),
+                count_bits(BP & ~K),
+                count_bits(BP & K),
+            )
+
+
+def test_derived_data_and_tuple_compatibility():
+    WP, BP, K = setup_board_from_position_lists(["KD4", "F6"], ["A3", "KH2", "C1"])
+    position = Position(WP, BP, K, PlayerTurn.WHITE)
+
+    assert tuple(position) == (WP, BP, K) and len(position) == 3 and position[2] == K
+    assert position.empty == ~(WP | BP) & MASK_32
+    assert (position.white_men, position.white_kings) == (WP & ~K, WP & K)
+    assert (position.black_men, position.black_kings) == (BP & ~K, BP & K)
+    assert (position.white_count, position.black_count) == (2, 3)
+    assert position.key == hash_position(WP, BP, K, PlayerTurn.WHITE)
+    assert position != Position(WP, BP, K, PlayerTurn.BLACK)
+    assert position.flipped().flipped() == position
+
+    with pytest.raises(AttributeError):
+        position.WP = 0
+    assert pickle.loads(pickle.dumps(position)) == position
+
+
+def test_ai_searches_a_position_like_its_tuple(monkeypatch):
+    monkeypatch.setattr(heuristic.random, "randint", lambda a, b: 0)
+    position = Position.fresh().play((9, 13)).play((22, 17))
+    results = []
+    for board in (position, tuple(position)):
+        move, _ = AI(
+            board,
+            position.turn,
+            max_depth=5,
+            global_board_state=board,
+            manage_time=False,
+        )
+        results.append((move, minimax_alphabeta.SEARCH_INFO["pv"]))
+    assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    pytest.main()
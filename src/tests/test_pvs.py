@@ -0,0 +1,88 @@
+import pathlib
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import heuristic
+import minimax_alphabeta
+from checkers import *
+from minimax_alphabeta import AI, minimax, pvs
+from move_ordering import MoveOrderer
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+POSITIONS = [
+    (get_fresh_board(), PlayerTurn.BLACK),
+    (
+        setup_board_from_position_lists(
+            ["D4", "F4", "KD2", "D6", "F6"], ["KC5", "E5", "KG3", "KH8"]
+        ),
+        PlayerTurn.WHITE,
+    ),
+    (setup_board_from_position_lists(["KC3", "KA1"], ["KH8"]), PlayerTurn.BLACK),
+]
+
+
+@pytest.fixture(autouse=True)
+def no_eval_noise(monkeypatch):
+    monkeypatch.setattr(heuristic.random, "randint", lambda a, b: 0)
+
+
+@pytest.mark.parametrize("position, player", POSITIONS)
+@pytest.mark.parametrize("depth", [1, 3, 5])
+def test_pvs_score_matches_minimax(position, player, depth):
+    inf = float("inf")
+    _, minimax_score = minimax(
+        position, depth, -inf, inf, player, is_root=True, global_board_state=position
+    )
+    pvs_score, _ = pvs(
+        position,
+        depth,
+        -inf,
+        inf,
+        player,
+        global_board_state=position,
+        move_orderer=MoveOrderer(),
+    )
+    sign = 1 if player == PlayerTurn.WHITE else -1
+    assert sign * pvs_score == minimax_score
+
+
+@pytest.mark.parametrize("position, player", POSITIONS)
+def test_pvs_returns_complete_legal_principal_variation(position, player):
+    inf = float("inf")
+    _, pv = pvs(position, 5, -inf, inf, player, global_board_state=position)
+    assert len(pv) == 5
+    WP, BP, K = position
+    for move in pv:
+        assert move in generate_legal_moves(WP, BP, K, player)
+        WP, BP, K = do_move(WP, BP, K, move, player)
+        player = switch_player(player)
+
+
+def test_ai_pvs_mode_records_principal_variation():
+    position, player = POSITIONS[0]
+    move, depth = AI(
+        position,
+        player,
+        max_depth=6,
+        time_limit=5,
+        global_board_state=position,
+        search="pvs",
+    )
+    assert depth == 6
+    assert minimax_alphabeta.SEARCH_INFO["pv"][0] == move
+    assert len(minimax_alphabeta.SEARCH_INFO["pv"]) == 6
+
+
+def test_ai_rejects_unknown_search_mode():
+    position, player = POSITIONS[0]
+    with pytest.raises(ValueError):
+        AI(position, player, max_depth=2, search="mtdf")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,109 @@
+import pathlib
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import heuristic
+import minimax_alphabeta
+from checkers import *
+from minimax_alphabeta import AI, minimax, pvs, quiescence
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+INF = float("inf")
+
+
+@pytest.fixture(autouse=True)
+def no_eval_noise(monkeypatch):
+    monkeypatch.setattr(heuristic.random, "randint", lambda a, b: 0)
+
+
+def test_quiet_position_stands_pat():
+    position = get_fresh_board()
+    score = quiescence(position, -INF, INF, PlayerTurn.BLACK, 8, global_board_state=position)
+    static = heuristic.smart(
+        *position,
+        turn=PlayerTurn.BLACK,
+        legal_moves=generate_legal_moves(*position, PlayerTurn.BLACK),
+        depth=0,
+        global_board_state=position,
+    )
+    assert score == static
+
+
+def test_quiescence_sees_capture_behind_the_horizon():
+    position = setup_board_from_position_lists(
+        ["F4", "H2", "E3", "H4", "D6", "B8"], ["A3", "G7", "C5", "B4", "F6", "A7"]
+    )
+    blind_move, blind_score = minimax(
+        position, 1, -INF, INF, PlayerTurn.WHITE, is_root=True, global_board_state=position
+    )
+    # The depth-1 favourite lets black capture straight away.
+    assert get_jumpers_black(*do_move(*position, blind_move, PlayerTurn.WHITE))
+
+    q_move, q_score = minimax(
+        position,
+        1,
+        -INF,
+        INF,
+        PlayerTurn.WHITE,
+        is_root=True,
+        global_board_state=position,
+        quiescence_depth=8,
+    )
+    assert q_move != blind_move
+    assert q_score < blind_score
+
+
+def test_pvs_and_minimax_agree_with_quiescence():
+    position = setup_board_from_position_lists(
+        ["D4", "F4", "KD2", "D6", "F6"], ["KC5", "E5", "KG3", "KH8"]
+    )
+    _, minimax_score = minimax(
+        position,
+        3,
+        -INF,
+        INF,
+        PlayerTurn.BLACK,
+        is_root=True,
+        global_board_state=position,
+        quiescence_depth=8,
+    )
+    pvs_score, _ = pvs(
+        position,
+        3,
+        -INF,
+        INF,
+        PlayerTurn.BLACK,
+        global_board_state=position,
+        quiescence_depth=8,
+    )
+    assert -pvs_score == minimax_score
+
+
+def test_quiescence_nodes_are_counted_separately():
+    position = setup_board_from_position_lists(
+        ["F4", "H2", "E3", "H4", "D6", "B8"], ["A3", "G7", "C5", "B4", "F6", "A7"]
+    )
+    minimax_alphabeta.NC = 0
+    minimax_alphabeta.QNC = 0
+    AI(position, PlayerTurn.WHITE, max_depth=3, global_board_state=position)
+    assert minimax_alphabeta.SEARCH_INFO["qnodes"] > 0
+    assert minimax_alphabeta.QNC == minimax_alphabeta.SEARCH_INFO["qnodes"]
+
+    minimax_alphabeta.QNC = 0
+    AI(
+        position,
+        PlayerTurn.WHITE,
+        max_depth=3,
+        global_board_state=position,
+        quiescence_depth=0,
+    )
+    assert minimax_alphabeta.QNC == 0
+
+
+if __name__ == "__main__":
+    pytest.main()
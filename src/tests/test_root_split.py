@@ -0,0 +1,115 @@
+import math
+import pathlib
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+sys.path.append(str(parent / "arena"))
+
+import threadsafe_alpha_beta
+from checkers import *
+from threadsafe_alpha_beta import RootWindow, minimax, threadsafe_AI
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+POSITIONS = [
+    (get_fresh_board(), PlayerTurn.BLACK),
+    (
+        setup_board_from_position_lists(
+            ["D4", "F4", "KD2", "D6", "F6"], ["KC5", "E5", "KG3", "KH8"]
+        ),
+        PlayerTurn.WHITE,
+    ),
+    (
+        setup_board_from_position_lists(
+            ["A5", "B6", "H6", "A7", "C7", "E7", "G7", "B8", "F8", "H8"],
+            ["A1", "C1", "E1", "G1", "B2", "H2", "A3", "C3", "H4", "E5"],
+        ),
+        PlayerTurn.BLACK,
+    ),
+    (setup_board_from_position_lists(["KC3", "KA1"], ["KH8"]), PlayerTurn.WHITE),
+]
+
+
+def material(WP, BP, K, turn):
+    """
+    Noise-free evaluation: men 100, kings 150, plus a point per row a man has advanced.
+    """
+    score = 100 * (popcount(WP) - popcount(BP)) + 50 * (popcount(WP & K) - popcount(BP & K))
+    score += sum(7 - index // 4 for index in bit_indices(WP & ~K))
+    score -= sum(index // 4 for index in bit_indices(BP & ~K))
+    return score
+
+
+@pytest.fixture(autouse=True)
+def root_pool():
+    yield
+    threadsafe_alpha_beta.shutdown_root_pool()
+
+
+def search(position, player, mode, depth=4):
+    move, depth_reached = threadsafe_AI(
+        position,
+        player,
+        depth,
+        time_limit=600,
+        heuristic=material,
+        search=mode,
+        workers=2,
+    )
+    assert depth_reached == depth
+    return move, threadsafe_alpha_beta.SEARCH_INFO["score"]
+
+
+@pytest.mark.parametrize("position, player", POSITIONS)
+def test_root_split_matches_serial_minimax(position, player):
+    assert search(position, player, "root_split") == search(
+        position, player, "minimax"
+    )
+
+
+@pytest.mark.parametrize("position, player", POSITIONS)
+@pytest.mark.parametrize("depth", [1, 4])
+def test_pvs_matches_serial_minimax(position, player, depth):
+    inf = float("inf")
+    expected = minimax(position, depth, -inf, inf, player, material)
+    move, score = search(position, player, "pvs", depth)
+    assert score == expected
+    child_score = minimax(
+        do_move(*position, move, player),
+        depth - 1,
+        -inf,
+        inf,
+        switch_player(player),
+        material,
+    )
+    assert child_score == expected
+
+
+def _worker_bound(move_index):
+    # Runs in a pool worker: reads ROOT_BOUND through the worker's shared copy.
+    window = RootWindow(threadsafe_alpha_beta._root_bound, move_index, True)
+    return window.narrow(-math.inf, math.inf)
+
+
+def test_root_window_bound_reaches_workers():
+    pool = threadsafe_alpha_beta.get_root_pool(1)
+    shared_bound = threadsafe_alpha_beta.ROOT_BOUND
+    shared_bound[0], shared_bound[1] = -math.inf, -1
+    assert pool.submit(_worker_bound, 2).result() == (-math.inf, math.inf)
+
+    RootWindow(shared_bound, 1, True).publish(5.0)
+    assert pool.submit(_worker_bound, 2).result() == (5.0, math.inf)
+    # A bound from a later root move is nudged down, so an equal score stays exact.
+    assert pool.submit(_worker_bound, 0).result()[0] < 5.0
+
+    window = RootWindow(shared_bound, 3, True, poll_interval=2)
+    RootWindow(shared_bound, 1, True).publish(7.0)
+    assert window.narrow(-math.inf, math.inf) == (5.0, math.inf)
+    assert window.narrow(-math.inf, math.inf) == (7.0, math.inf)  # re-read on poll
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,119 @@
+import pathlib
+import random
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import heuristic
+import minimax_alphabeta
+from checkers import *
+from minimax_alphabeta import AI, generate_staged_moves, order_moves
+from move_ordering import MoveOrderer
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+POSITIONS = [
+    (get_fresh_board(), PlayerTurn.BLACK),
+    (
+        setup_board_from_position_lists(
+            ["D4", "F4", "KD2", "D6", "F6"], ["KC5", "E5", "KG3", "KH8"]
+        ),
+        PlayerTurn.WHITE,
+    ),
+    (setup_board_from_position_lists(["KC3", "KA1"], ["KH8"]), PlayerTurn.BLACK),
+]
+
+
+@pytest.fixture(autouse=True)
+def no_eval_noise(monkeypatch):
+    monkeypatch.setattr(heuristic.random, "randint", lambda a, b: 0)
+
+
+def test_staged_moves_match_eager_order_in_random_games():
+    rng = random.Random(17)
+    orderer = MoveOrderer()
+    for _ in range(10):
+        position, player = get_fresh_board(), PlayerTurn.BLACK
+        for ply in range(80):
+            legal_moves = generate_legal_moves(*position, player)
+            if not legal_moves:
+                break
+            if isinstance(legal_moves[0], tuple):  # a killer for this ply, legal or not
+                orderer.record_cutoff(rng.choice(legal_moves), ply, 1, 0)
+            for hash_move in (None, rng.choice(legal_moves), (8, 12), [0, 9]):
+                for depth in (1, 6):
+                    expected = order_moves(
+                        legal_moves, position, player, ply, depth, hash_move, orderer
+                    )
+                    staged = generate_staged_moves(
+                        position, player, ply, depth, hash_move, orderer
+                    )
+                    assert list(staged) == expected
+            position = do_move(*position, rng.choice(legal_moves), player)
+            player = switch_player(player)
+
+
+def test_stages_hash_promotions_killers_then_rest(monkeypatch):
+    WP, BP, K = setup_board_from_position_lists(["B2", "F6", "KD4"], ["A7", "H8"])
+    legal_moves = generate_legal_moves(WP, BP, K, PlayerTurn.WHITE)
+    promotions = generate_promotion_moves(WP, BP, K, PlayerTurn.WHITE)
+    assert promotions == [(4, 0), (4, 1)]
+    hash_move, killer = (13, 9), (22, 19)
+    orderer = MoveOrderer()
+    orderer.record_cutoff(killer, ply=3, depth=1, move_index=0)
+
+    scored = []
+    sort = minimax_alphabeta.sort_moves_by_heuristic
+
+    def recording_sort(moves, *args):
+        scored.extend(moves)
+        return sort(moves, *args)
+
+    monkeypatch.setattr(minimax_alphabeta, "sort_moves_by_heuristic", recording_sort)
+    for depth in (1, 6):  # sorted by history, then by static evaluation
+        staged = list(
+            generate_staged_moves(
+                (WP, BP, K), PlayerTurn.WHITE, 3, depth, hash_move, orderer
+            )
+        )
+        assert staged[:4] == [hash_move, *promotions, killer]
+        assert sorted(staged) == sorted(legal_moves)
+    assert scored and not set(scored) & {hash_move, *promotions, killer}
+
+
+def test_is_legal_simple_move():
+    WP, BP, K = setup_board_from_position_lists(["KD4", "F6", "C3"], ["A3"])
+    assert is_legal_simple_move(WP, BP, K, (13, 18), PlayerTurn.WHITE)  # king
+    assert is_legal_simple_move(WP, BP, K, (22, 19), PlayerTurn.WHITE)
+    assert not is_legal_simple_move(WP, BP, K, (22, 26), PlayerTurn.WHITE)  # man
+    assert not is_legal_simple_move(WP, BP, K, (13, 9), PlayerTurn.WHITE)  # occupied
+    assert not is_legal_simple_move(WP, BP, K, (13, 17), PlayerTurn.BLACK)
+    assert is_legal_simple_move(WP, BP, K, (8, 12), PlayerTurn.BLACK)
+
+
+@pytest.mark.parametrize("position, player", POSITIONS)
+@pytest.mark.parametrize("search", ["minimax", "pvs"])
+def test_staged_search_matches_eager_search(position, player, search):
+    results = []
+    for staged in (False, True):
+        minimax_alphabeta.NC = 0
+        move, _ = AI(
+            position,
+            player,
+            max_depth=6,
+            time_limit=100,
+            global_board_state=position,
+            search=search,
+            manage_time=False,
+            staged=staged,
+        )
+        info = minimax_alphabeta.SEARCH_INFO
+        results.append((move, info["score"], info["pv"], minimax_alphabeta.NC))
+    assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,174 @@
+import pathlib
+import sys
+import threading
+import time
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import heuristic
+import minimax_alphabeta
+from checkers import *
+from minimax_alphabeta import AI
+from time_control import *
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+
+def test_check_raises_after_hard_deadline():
+    time_control = TimeControl(0.05, poll_interval=1)
+    time_control.check()
+    time.sleep(0.06)
+    assert time_control.hard_expired()
+    with pytest.raises(TimeOutException):
+        time_control.check()
+
+
+def test_soft_limit_is_capped_by_hard_limit():
+    time_control = TimeControl(0.0, soft_limit=10)
+    assert time_control.soft_expired()
+    assert not TimeControl(10, soft_limit=5).soft_expired()
+
+
+def test_allocation_stays_within_hard_limit():
+    time_control = TimeControl(2)
+    time_control.allocate(5.0)
+    assert time_control.soft_limit() == pytest.approx(2)
+    time_control.allocate(0.0)
+    assert time_control.soft_limit() == pytest.approx(2 * MIN_TIME_FRACTION)
+
+
+def test_position_time_fraction_by_phase_and_complexity():
+    opening = get_fresh_board()
+    endgame = setup_board_from_position_lists(["A1", "KD2"], ["KG7", "KH8"])
+    forced = setup_board_from_position_lists(["D4", "F4", "KD2", "D6"], ["C5", "KH8"])
+    fractions = {
+        name: position_time_fraction(position, generate_legal_moves(*position, player))
+        for name, position, player in [
+            ("opening", opening, PlayerTurn.BLACK),
+            ("endgame", endgame, PlayerTurn.BLACK),
+            ("forced", forced, PlayerTurn.BLACK),
+        ]
+    }
+    assert fractions["opening"] < fractions["endgame"] <= 1
+    assert fractions["forced"] < fractions["endgame"]
+
+
+def test_iteration_time_factor():
+    assert iteration_time_factor(STABLE_DEPTHS, 0) < 1
+    assert iteration_time_factor(0, 0) > 1
+    assert iteration_time_factor(STABLE_DEPTHS, SCORE_SWING) > 1
+
+
+def test_ai_plans_less_than_the_limit_for_easy_moves():
+    position = get_fresh_board()
+    AI(
+        position,
+        PlayerTurn.BLACK,
+        time_limit=0.5,
+        global_board_state=position,
+        manage_time=True,
+    )
+    assert minimax_alphabeta.SEARCH_INFO["soft_limit"] < 0.5
+
+    AI(position, PlayerTurn.BLACK, time_limit=0.5, global_board_state=position)
+    assert minimax_alphabeta.SEARCH_INFO["soft_limit"] == pytest.approx(0.5)
+
+
+def test_ai_keeps_the_deadlines_of_a_time_control_passed_in():
+    position = get_fresh_board()
+    time_control = TimeControl(0.5, 0.3)
+    AI(
+        position,
+        PlayerTurn.BLACK,
+        global_board_state=position,
+        time_control=time_control,
+        manage_time=True,
+    )
+    assert time_control.soft_limit() == pytest.approx(0.3)
+
+
+def test_ai_runs_outside_the_main_thread():
+    position = get_fresh_board()
+    result = {}
+
+    def run():
+        result["move"], result["depth"] = AI(
+            position,
+            PlayerTurn.BLACK,
+            max_depth=4,
+            time_limit=10,
+            global_board_state=position,
+        )
+
+    worker = threading.Thread(target=run)
+    worker.start()
+    worker.join(30)
+    assert not worker.is_alive()
+    assert result["depth"] == 4
+    assert result["move"] in generate_legal_moves(*position, PlayerTurn.BLACK)
+
+
+def test_hard_deadline_interrupts_the_search():
+    position = get_fresh_board()
+    start = time.monotonic()
+    move, depth = AI(position, PlayerTurn.BLACK, time_limit=0.5, global_board_state=position)
+    assert time.monotonic() - start < 1.5
+    assert 0 < depth < 9999
+    assert move in generate_legal_moves(*position, PlayerTurn.BLACK)
+
+
+def test_stop_from_another_thread():
+    position = get_fresh_board()
+    time_control = TimeControl(60)
+    threading.Timer(0.3, time_control.stop).start()
+    start = time.monotonic()
+    move, _ = AI(
+        position,
+        PlayerTurn.BLACK,
+        time_limit=60,
+        global_board_state=position,
+        time_control=time_control,
+    )
+    assert time.monotonic() - start < 5
+    assert move in generate_legal_moves(*position, PlayerTurn.BLACK)
+
+
+class NodeBudget(TimeControl):
+    """
+    Times out after a fixed number of nodes instead of seconds, so the cut is reproducible.
+    """
+
+    def __init__(self, nodes):
+        super().__init__(60)
+        self.nodes = nodes
+
+    def check(self):
+        self.nodes -= 1
+        if self.nodes < 0:
+            raise TimeOutException()
+
+
+def test_partial_iteration_move_is_used(monkeypatch):
+    monkeypatch.setattr(heuristic.random, "randint", lambda a, b: 0)
+    position = get_fresh_board()
+    partial_searches = 0
+    for nodes in range(1000, 20000, 1000):
+        time_control = NodeBudget(nodes)
+        move, depth = AI(
+            position,
+            PlayerTurn.BLACK,
+            global_board_state=position,
+            time_control=time_control,
+        )
+        if "partial_depth" in minimax_alphabeta.SEARCH_INFO:
+            partial_searches += 1
+            assert move == time_control.root_best_move
+            assert minimax_alphabeta.SEARCH_INFO["partial_depth"] == depth + 1
+    assert partial_searches > 0
+
+
+if __name__ == "__main__":
+    pytest.main()
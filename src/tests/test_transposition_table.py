@@ -0,0 +1,153 @@
+import multiprocessing
+import pathlib
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+from checkers import *
+from minimax_alphabeta import AI
+from transposition_table import *
+from util.fen_pdn_helper import *
+from util.helpers import *
+from util.zobrist import hash_position
+
+
+def test_hash_depends_on_side_to_move():
+    WP, BP, K = get_fresh_board()
+    assert hash_position(WP, BP, K, PlayerTurn.WHITE) != hash_position(
+        WP, BP, K, PlayerTurn.BLACK
+    )
+
+
+def test_hash_distinguishes_kings_from_men():
+    WP, BP, K = setup_board_from_position_lists(["D4"], ["E5"])
+    WP_k, BP_k, K_k = setup_board_from_position_lists(["KD4"], ["E5"])
+    assert hash_position(WP, BP, K, PlayerTurn.WHITE) != hash_position(
+        WP_k, BP_k, K_k, PlayerTurn.WHITE
+    )
+
+
+def test_transpositions_share_a_key():
+    WP, BP, K = get_fresh_board()
+    # A5-B6... reach the same position through two different move orders.
+    a = do_move(WP, BP, K, (8, 12), PlayerTurn.BLACK)
+    a = do_move(*a, (20, 16), PlayerTurn.WHITE)
+    a = do_move(*a, (9, 13), PlayerTurn.BLACK)
+    b = do_move(WP, BP, K, (9, 13), PlayerTurn.BLACK)
+    b = do_move(*b, (20, 16), PlayerTurn.WHITE)
+    b = do_move(*b, (8, 12), PlayerTurn.BLACK)
+    assert a == b
+    assert hash_position(*a, PlayerTurn.WHITE) == hash_position(*b, PlayerTurn.WHITE)
+
+
+def test_store_and_probe():
+    tt = TranspositionTable(size_mb=1)
+    tt.store(12345, 4, 70, EXACT, (8, 12))
+    entry = tt.probe(12345)
+    assert entry[1:5] == (4, 70, EXACT, (8, 12))
+    assert tt.probe(54321) is None
+    assert tt.stats()["hits"] == 1
+    assert tt.stats()["probes"] == 2
+
+
+@pytest.mark.parametrize(
+    "flag, alpha, beta, expected",
+    [
+        (EXACT, -100, 100, 50),
+        (LOWER_BOUND, -100, 40, 50),
+        (LOWER_BOUND, -100, 100, None),
+        (UPPER_BOUND, 60, 100, 50),
+        (UPPER_BOUND, -100, 100, None),
+    ],
+)
+def test_cutoff_score_respects_bounds(flag, alpha, beta, expected):
+    tt = TranspositionTable(size_mb=1)
+    tt.store(1, 3, 50, flag, None)
+    assert tt.cutoff_score(tt.probe(1), 3, alpha, beta) == expected
+    assert tt.cutoff_score(tt.probe(1), 4, alpha, beta) is None  # too shallow
+
+
+def test_depth_preferred_replacement():
+    tt = TranspositionTable(size_mb=1)
+    slots = tt.num_slots
+    tt.store(1, 6, 10, EXACT, None)
+    tt.store(1 + slots, 2, 20, EXACT, None)  # same slot, shallower: rejected
+    assert tt.probe(1) is not None
+    assert tt.probe(1 + slots) is None
+
+    tt.new_search()
+    tt.store(1 + slots, 2, 20, EXACT, None)  # stale entries are always replaced
+    assert tt.probe(1) is None
+    assert tt.probe(1 + slots)[2] == 20
+
+
+def test_table_size_is_bounded():
+    tt = TranspositionTable(size_mb=1)
+    for key in range(tt.num_slots * 3):
+        tt.store(key, 1, 0, EXACT, None)
+    assert len(tt.slots) == tt.num_slots
+
+
+def test_ai_with_transposition_table_returns_legal_move():
+    WP, BP, K = setup_board_from_position_lists(["KC3", "KA1"], ["KH8"])
+    move, depth = AI(
+        (WP, BP, K),
+        PlayerTurn.WHITE,
+        max_depth=6,
+        time_limit=5,
+        global_board_state=(WP, BP, K),
+        tt_size_mb=1,
+    )
+    assert move in generate_legal_moves(WP, BP, K, PlayerTurn.WHITE)
+    assert depth == 6
+
+
+@pytest.mark.parametrize("move", [None, (9, 13), [22, 15, 6, 13, 22], list(range(11))])
+def test_packed_moves_round_trip(move):
+    assert unpack_move(pack_move(move)) == move
+
+
+def test_shared_table_matches_entry_format():
+    tt = SharedTranspositionTable(size_mb=1)
+    tt.store(2**64 - 3, 4, -37.5, UPPER_BOUND, [5, 14, 23])
+    assert tt.probe(2**64 - 3) == (2**64 - 3, 4, -37.5, UPPER_BOUND, [5, 14, 23], 0)
+    assert tt.probe(2**64 - 3 + tt.num_slots) is None
+    assert tt.cutoff_score(tt.probe(2**64 - 3), 3, -10, 10) == -37.5
+
+
+def test_shared_table_keeps_deeper_entry():
+    tt = SharedTranspositionTable(size_mb=1)
+    tt.store(1, 8, 10, EXACT, (1, 5))
+    tt.store(1 + tt.num_slots, 2, 20, EXACT, None)
+    assert tt.probe(1)[1] == 8
+    tt.store(1, 2, 30, LOWER_BOUND, None)  # same position: always replaced
+    assert tt.probe(1)[2] == 30
+
+
+def store_from_child(shared_slots):
+    SharedTranspositionTable(size_mb=1, shared_slots=shared_slots).store(
+        42, 6, 15, EXACT, (10, 14)
+    )
+
+
+def test_shared_table_is_visible_across_processes():
+    tt = SharedTranspositionTable(size_mb=1)
+    child = multiprocessing.Process(target=store_from_child, args=(tt.shared_slots,))
+    child.start()
+    child.join()
+    assert tt.probe(42) == (42, 6, 15, EXACT, (10, 14), 0)
+
+
+def test_torn_slot_reads_as_miss():
+    tt = SharedTranspositionTable(size_mb=1)
+    tt.store(42, 6, 15, EXACT, (10, 14))
+    base = (42 % tt.num_slots) * SHARED_SLOT_WORDS
+    tt.shared_slots[base + 2] ^= 1  # as if another process had half-written the score
+    assert tt.probe(42) is None
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,104 @@
+import pathlib
+import sys
+
+import pytest
+
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent))
+
+import heuristic
+import ybwc
+from checkers import *
+from minimax_alphabeta import minimax
+from util.fen_pdn_helper import *
+from util.helpers import *
+
+INF = float("inf")
+
+
+@pytest.fixture(autouse=True)
+def no_eval_noise(monkeypatch):
+    monkeypatch.setattr(heuristic.random, "randint", lambda a, b: 0)
+
+
+@pytest.fixture
+def pool():
+    yield ybwc.get_ybwc_pool(2)  # started after the noise is patched out
+    ybwc.shutdown_ybwc_pool()
+
+
+@pytest.mark.parametrize(
+    "position, player",
+    [
+        (get_fresh_board(), PlayerTurn.BLACK),
+        (
+            setup_board_from_position_lists(
+                ["D4", "F4", "KD2", "D6", "F6"], ["KC5", "E5", "KG3", "KH8"]
+            ),
+            PlayerTurn.WHITE,
+        ),
+    ],
+)
+def test_parallel_score_matches_minimax(position, player, pool):
+    _, serial_score = minimax(
+        position,
+        5,
+        -INF,
+        INF,
+        player,
+        is_root=True,
+        global_board_state=position,
+        quiescence_depth=8,
+    )
+    move, score = ybwc.ybwc(
+        position,
+        5,
+        -INF,
+        INF,
+        player,
+        global_board_state=position,
+        pool=pool,
+        min_split_depth=2,
+    )
+    assert score == serial_score
+    assert move in generate_legal_moves(*position, player)
+
+
+def test_abort_flag_stops_worker_search(pool):
+    position = get_fresh_board()
+    split_point = ybwc._new_split_point()
+    ybwc.ABORT_FLAGS[split_point] = 1
+    future = pool.submit(
+        ybwc._search_young_brother,
+        position,
+        12,
+        -INF,
+        INF,
+        PlayerTurn.BLACK,
+        0,
+        position,
+        None,
+        8,
+        split_point,
+        None,
+    )
+    assert future.result(timeout=10) is None
+
+
+def test_ybwc_ai_serial_and_parallel(pool):
+    position = get_fresh_board()
+    for workers in (0, 2):
+        move, depth = ybwc.ybwc_AI(
+            position,
+            PlayerTurn.BLACK,
+            max_depth=5,
+            time_limit=30,
+            global_board_state=position,
+            workers=workers,
+        )
+        assert depth == 5
+        assert move in generate_legal_moves(*position, PlayerTurn.BLACK)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,114 @@
+import threading
+import time
+
+from util.bitboard import popcount
+
+POLL_INTERVAL = 64  # nodes between two reads of the clock
+
+# Time allocation: fractions of the per-move limit used as the soft limit.
+BASE_TIME_FRACTION = 0.5
+MIN_TIME_FRACTION = 0.1
+OPENING_PIECES = 20  # at least this many pieces on the board: opening
+ENDGAME_PIECES = 8  # at most this many pieces on the board: endgame
+STABLE_DEPTHS = 3  # iterations with the same best move before the search is cut short
+SCORE_SWING = 30  # score change between iterations that counts as unstable
+
+
+class TimeOutException(Exception):
+    pass
+
+
+class TimeControl:
+    """
+    Cooperative, signal-free time control that works from any thread.
+
+    The search calls check() at every node; only every poll_interval-th call reads the clock,
+    and TimeOutException is raised once the hard deadline has passed or stop() was called
+    (from any thread). Between iterations the caller asks soft_expired() to decide whether to
+    start another one. While an iteration runs, the root search records its best move so far in
+    root_best_move so a timed-out iteration is not wasted.
+    """
+
+    def __init__(
+        self, hard_limit, soft_limit=None, poll_interval=POLL_INTERVAL, stop_event=None
+    ):
+        self.start_time = time.monotonic()
+        self.hard_limit = hard_limit
+        self.hard_deadline = self.start_time + hard_limit
+        self.soft_deadline = self.start_time + (
+            hard_limit if soft_limit is None else min(soft_limit, hard_limit)
+        )
+        self.poll_interval = poll_interval
+        self.countdown = poll_interval
+        # Any object with set()/is_set(), e.g. a multiprocessing.Event shared between processes
+        self.stop_event = threading.Event() if stop_event is None else stop_event
+        self.root_best_move = None
+
+    def check(self):
+        self.countdown -= 1
+        if self.countdown <= 0:
+            self.countdown = self.poll_interval
+            if self.stop_event.is_set() or time.monotonic() >= self.hard_deadline:
+                raise TimeOutException()
+
+    def stop(self):
+        """
+        Asks the search to stop at its next poll. Safe to call from another thread.
+        """
+        self.stop_event.set()
+
+    def allocate(self, fraction):
+        """
+        Moves the soft deadline to the given fraction of the hard limit (capped at the hard limit).
+        """
+        fraction = min(max(fraction, MIN_TIME_FRACTION), 1.0)
+        self.soft_deadline = self.start_time + fraction * self.hard_limit
+
+    def soft_limit(self) -> float:
+        return self.soft_deadline - self.start_time
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start_time
+
+    def soft_expired(self) -> bool:
+        return self.stop_event.is_set() or time.monotonic() >= self.soft_deadline
+
+    def hard_expired(self) -> bool:
+        return self.stop_event.is_set() or time.monotonic() >= self.hard_deadline
+
+
+def position_time_fraction(position, legal_moves) -> float:
+    """
+    Share of the per-move limit planned for a position before searching it.
+    Forced captures with few options are easy, wide positions are hard, the opening
+    is played faster and the endgame (where depth decides) slower.
+    """
+    WP, BP, _ = position
+    pieces = popcount(WP) + popcount(BP)
+    fraction = BASE_TIME_FRACTION
+
+    if isinstance(legal_moves[0], list) and len(legal_moves) <= 2:
+        fraction *= 0.5
+    elif len(legal_moves) >= 10:
+        fraction *= 1.3
+
+    if pieces >= OPENING_PIECES:
+        fraction *= 0.7
+    elif pieces <= ENDGAME_PIECES:
+        fraction *= 1.4
+
+    return fraction
+
+
+def iteration_time_factor(stable_depths, score_swing) -> float:
+    """
+    Scales the planned time after an iteration: a best move that has held for STABLE_DEPTHS
+    iterations halves it, a new best move or a score swing of SCORE_SWING or more extends it.
+    """
+    if score_swing >= SCORE_SWING:
+        return 2.0
+    if stable_depths == 0:
+        return 1.5
+    if stable_depths >= STABLE_DEPTHS:
+        return 0.5
+    return 1.0
@@ -0,0 +1,214 @@
+import multiprocessing
+import struct
+
+EXACT = 0  # Score is the exact minimax value of the position.
+LOWER_BOUND = 1  # Search failed high: the true value is >= score.
+UPPER_BOUND = 2  # Search failed low: the true value is <= score.
+
+# Rough size of one stored entry (tuple + ints + move) in CPython, used to turn MB into slots.
+ENTRY_BYTES = 160
+
+# SharedTranspositionTable slot: four unsigned 64-bit words
+# (key ^ meta ^ score ^ move, meta, score, move); meta packs depth, flag and generation.
+SHARED_SLOT_WORDS = 4
+SHARED_ENTRY_BYTES = SHARED_SLOT_WORDS * 8
+MOVE_SQUARE_BITS = 5
+MAX_PACKED_SQUARES = 11
+
+
+class TranspositionTable:
+    """
+    Fixed-size, single-slot transposition table indexed by a 64-bit Zobrist key.
+
+    Each slot holds (key, depth, score, flag, best_move, generation). When two positions map to
+    the same slot the replacement policy is depth-preferred: an entry is overwritten when it is
+    from an older search, describes the same position, or was searched no deeper than the new one.
+    """
+
+    def __init__(self, size_mb=16):
+        self.size_mb = size_mb
+        self.num_slots = max(1, int(size_mb * 1024 * 1024) // ENTRY_BYTES)
+        self.slots = [None] * self.num_slots
+        self.generation = 0
+
+        # Counters
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def clear(self):
+        self.slots = [None] * self.num_slots
+        self.generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def new_search(self):
+        """
+        Marks every stored entry as stale so it is the first to be replaced, while keeping it usable.
+        """
+        self.generation += 1
+
+    def probe(self, key):
+        """
+        Returns the entry stored for the given key or None.
+        """
+        self.probes += 1
+        entry = self.slots[key % self.num_slots]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def cutoff_score(self, entry, depth, alpha, beta):
+        """
+        Returns the stored score if the entry is deep enough to end the search at this node
+        within the (alpha, beta) window, otherwise None.
+        """
+        _, entry_depth, score, flag, _, _ = entry
+        if entry_depth < depth:
+            return None
+        if (
+            flag == EXACT
+            or (flag == LOWER_BOUND and score >= beta)
+            or (flag == UPPER_BOUND and score <= alpha)
+        ):
+            self.cutoffs += 1
+            return score
+        return None
+
+    def store(self, key, depth, score, flag, best_move):
+        index = key % self.num_slots
+        current = self.slots[index]
+        if current is not None:
+            if (
+                current[0] != key
+                and current[5] == self.generation
+                and current[1] > depth
+            ):
+                return  # keep the deeper entry from this search
+            self.replacements += 1
+
+        self.slots[index] = (key, depth, score, flag, best_move, self.generation)
+        self.stores += 1
+
+    def stats(self) -> dict:
+        return {
+            "size_mb": self.size_mb,
+            "slots": self.num_slots,
+            "probes": self.probes,
+            "hits": self.hits,
+            "cutoffs": self.cutoffs,
+            "stores": self.stores,
+            "replacements": self.replacements,
+            "hit_rate": self.hits / self.probes if self.probes else 0.0,
+        }
+
+
+def pack_move(move) -> int:
+    """
+    Packs a move into an int: bits 0-3 hold the number of squares (0 for None), bit 4 is set
+    for jump sequences (lists), and each square takes 5 bits from bit 5 on.
+    """
+    if move is None:
+        return 0
+    if len(move) > MAX_PACKED_SQUARES:
+        return 0  # too long to store; the entry keeps its score without a hash move
+    packed = len(move) | (isinstance(move, list) << 4)
+    for i, square in enumerate(move):
+        packed |= square << (5 + i * MOVE_SQUARE_BITS)
+    return packed
+
+
+def unpack_move(packed):
+    length = packed & 0xF
+    if length == 0:
+        return None
+    squares = [(packed >> (5 + i * MOVE_SQUARE_BITS)) & 0x1F for i in range(length)]
+    return squares if packed & 0x10 else tuple(squares)
+
+
+def _score_bits(score) -> int:
+    return struct.unpack("<Q", struct.pack("<d", score))[0]
+
+
+def _bits_score(bits):
+    score = struct.unpack("<d", struct.pack("<Q", bits))[0]
+    return int(score) if score.is_integer() else score
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """
+    TranspositionTable kept in shared memory so several search processes can use it at once.
+
+    Slots live in a lock-free multiprocessing RawArray. Each slot stores the key XORed with
+    its data words, so a slot torn by two processes writing at the same time fails the key
+    check on probe and reads as a miss. Entries and counters look the same as the
+    single-process table; the counters are kept per process.
+    Pass shared_slots (the .shared_slots of an existing table) to attach to its memory
+    in another process.
+    """
+
+    def __init__(self, size_mb=16, shared_slots=None):
+        self.size_mb = size_mb
+        self.num_slots = max(1, int(size_mb * 1024 * 1024) // SHARED_ENTRY_BYTES)
+        if shared_slots is None:
+            shared_slots = multiprocessing.RawArray("Q", self.num_slots * SHARED_SLOT_WORDS)
+        self.shared_slots = shared_slots
+        self.generation = 0
+        self.reset_stats()
+
+    def clear(self):
+        for i in range(len(self.shared_slots)):
+            self.shared_slots[i] = 0
+        self.generation = 0
+        self.reset_stats()
+
+    def probe(self, key):
+        self.probes += 1
+        base = (key % self.num_slots) * SHARED_SLOT_WORDS
+        check, meta, score, move = self.shared_slots[base : base + SHARED_SLOT_WORDS]
+        if meta and check ^ meta ^ score ^ move == key:
+            self.hits += 1
+            return (
+                key,
+                (meta & 0xFFFF) - 1,
+                _bits_score(score),
+                (meta >> 16) & 0x3,
+                unpack_move(move),
+                meta >> 18,
+            )
+        return None
+
+    def store(self, key, depth, score, flag, best_move):
+        base = (key % self.num_slots) * SHARED_SLOT_WORDS
+        check, meta, current_score, current_move = self.shared_slots[
+            base : base + SHARED_SLOT_WORDS
+        ]
+        if meta:
+            if (
+                check ^ meta ^ current_score ^ current_move != key
+                and meta >> 18 == self.generation
+                and (meta & 0xFFFF) - 1 > depth
+            ):
+                return  # keep the deeper entry from this search
+            self.replacements += 1
+
+        # depth + 1 keeps meta non-zero, which marks the slot as used
+        meta = (depth + 1) | (flag << 16) | (self.generation << 18)
+        score = _score_bits(score)
+        move = pack_move(best_move)
+        self.shared_slots[base : base + SHARED_SLOT_WORDS] = [
+            key ^ meta ^ score ^ move,
+            meta,
+            score,
+            move,
+        ]
+        self.stores += 1
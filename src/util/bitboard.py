@@ -0,0 +1,85 @@
+def _table_popcount_16():
+    table = [0] * (1 << 16)
+    for index in range(1, 1 << 16):
+        table[index] = table[index >> 1] + (index & 1)
+    return table
+
+
+def _table_bit_indices_8(offset):
+    table = [()] * (1 << 8)
+    for index in range(1, 1 << 8):
+        lowest = index & -index
+        table[index] = (lowest.bit_length() - 1 + offset,) + table[index ^ lowest]
+    return tuple(table)
+
+
+def _table_reverse_8():
+    return tuple(int(f"{index:08b}"[::-1], 2) for index in range(1 << 8))
+
+
+POPCOUNT_16 = _table_popcount_16()  # set bits of every 16-bit value
+# Indices of the set bits of every byte, ascending, for each of the four bytes of a board.
+# Byte tables rather than 16-bit ones: those would cost ~15 MB and most of a second to build.
+BIT_INDICES_8 = tuple(_table_bit_indices_8(offset) for offset in (0, 8, 16, 24))
+REVERSE_8 = _table_reverse_8()  # every byte with its bit order reversed
+
+
+def table_popcount(bitboard: int) -> int:
+    """
+    Counts the set bits of a 32-bit bitboard with two lookups in POPCOUNT_16.
+    """
+    return POPCOUNT_16[bitboard & 0xFFFF] + POPCOUNT_16[bitboard >> 16 & 0xFFFF]
+
+
+# int.bit_count is a single C call (Python 3.10+); older interpreters use the table.
+popcount = int.bit_count if hasattr(int, "bit_count") else table_popcount
+
+
+def bit_indices(bitboard: int) -> tuple:
+    """
+    Returns the indices of the set bits of a 32-bit bitboard in ascending order.
+    """
+    byte_0, byte_1, byte_2, byte_3 = BIT_INDICES_8
+    return (
+        byte_0[bitboard & 0xFF]
+        + byte_1[bitboard >> 8 & 0xFF]
+        + byte_2[bitboard >> 16 & 0xFF]
+        + byte_3[bitboard >> 24 & 0xFF]
+    )
+
+
+def iter_bits(bitboard: int):
+    """
+    Yields the indices of the set bits lowest first, clearing the lowest bit each step.
+    """
+    while bitboard:
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+
+def lowest_bit(bitboard: int) -> int:
+    """
+    Returns the index of the lowest set bit, -1 for an empty bitboard.
+    """
+    return (bitboard & -bitboard).bit_length() - 1
+
+
+def highest_bit(bitboard: int) -> int:
+    """
+    Returns the index of the highest set bit, -1 for an empty bitboard.
+    """
+    return bitboard.bit_length() - 1
+
+
+def reverse_bits(bitboard: int) -> int:
+    """
+    Reverses the order of the 32 bits with one REVERSE_8 lookup per byte. Square i goes to
+    31 - i, which turns the board round by 180 degrees (A1 <-> H8, C1 <-> F8).
+    """
+    return (
+        REVERSE_8[bitboard & 0xFF] << 24
+        | REVERSE_8[bitboard >> 8 & 0xFF] << 16
+        | REVERSE_8[bitboard >> 16 & 0xFF] << 8
+        | REVERSE_8[bitboard >> 24 & 0xFF]
+    )
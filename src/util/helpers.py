@@ -1,5 +1,7 @@
 from enum import Enum
 
+from util.bitboard import bit_indices, popcount, reverse_bits
+
 MASK_32 = 0xFFFFFFFF  # To explicitly invoke 32-bit integers.
 
 
@@ -83,7 +85,7 @@ def load_game_from_sable_file(file_path):
 
 
 def bitboard_to_pdn_positions(bitboard):
-    pdn_positions = [bitindex_to_coords(index) for index in find_set_bits(bitboard)]
+    pdn_positions = [bitindex_to_coords(index) for index in bit_indices(bitboard)]
     return pdn_positions
 
 
@@ -165,16 +167,16 @@ def remove_piece_by_pdntext(bitboard, pdn_text) -> int:
 
 def find_set_bits(bitboard) -> list:
     """
-    Returns a list of indices of bits that are set to 1 in the bitboard using list comprehension.
+    Returns a list of indices of bits that are set to 1 in the bitboard (see util.bitboard).
     """
-    return [index for index in range(32) if (bitboard & (1 << index)) != 0]
+    return list(bit_indices(bitboard))
 
 
 def count_bits(bitboard: int) -> int:
     """
     Counts the number of bits set to 1 in the bitboard.
     """
-    return len(find_set_bits(bitboard))
+    return popcount(bitboard)
 
 
 def is_set(bitboard, index) -> bool:
@@ -195,6 +197,17 @@ def switch_player(player):
     return PlayerTurn.BLACK if player == PlayerTurn.WHITE else PlayerTurn.WHITE
 
 
+def flip_position(WP, BP, K) -> tuple:
+    """
+    Turns the board round and swaps the colours: black's pieces become white pieces on the
+    mirrored squares (square i -> 31 - i) and vice versa. Black to move on the original is
+    the same game as white to move on the flipped board, so single-sided (white) code can
+    serve both sides. Flipping twice gives back the original.
+        Output: WP, BP, K of the flipped board
+    """
+    return reverse_bits(BP), reverse_bits(WP), reverse_bits(K)
+
+
 def print_legal_moves(legal_moves):
     print(
         f"Legal moves - {[f'{i}: {m}' for i,m in enumerate(convert_move_list_to_pdn(legal_moves))]}"
@@ -278,7 +291,8 @@ def get_ascii_board(WP, BP, kings) -> str:
 
 def convert_move_list_to_pdn(move_list) -> None:
     """
-    Converts a list of move lists into PDN coordinates.
+    Converts a list of move lists into PDN coordinates. Encoded (int) moves must be decoded
+    with util.move_encoding.decode_move first.
     """
     if move_list is None:
         return []
@@ -0,0 +1,113 @@
+import sys
+from collections import OrderedDict
+
+from util.masks import (
+    BLACK_KING_JUMPS,
+    BLACK_MAN_JUMPS,
+    WHITE_KING_JUMPS,
+    WHITE_MAN_JUMPS,
+)
+
+JUMP_CACHE_ENTRIES = 1 << 16  # default bound on cached capture trees
+ENTRY_OVERHEAD_BYTES = 120  # key and OrderedDict slot of one entry, roughly
+
+
+def _reach_masks(jumps):
+    """
+    For every square, the squares a capture sequence starting there can jump over or land on.
+    Only their occupancy decides the sequences, so the rest of the board is left out of keys.
+    """
+    masks = []
+    for pos in range(32):
+        reach, frontier, seen = 0, [pos], {pos}
+        while frontier:
+            square = frontier.pop()
+            for _, landing, jumped_mask, landing_mask in jumps[square]:
+                reach |= jumped_mask | landing_mask
+                if landing not in seen:
+                    seen.add(landing)
+                    frontier.append(landing)
+        masks.append(reach)
+    return tuple(masks)
+
+
+WHITE_MAN_REACH = _reach_masks(WHITE_MAN_JUMPS)
+BLACK_MAN_REACH = _reach_masks(BLACK_MAN_JUMPS)
+WHITE_KING_REACH = _reach_masks(WHITE_KING_JUMPS)
+BLACK_KING_REACH = _reach_masks(BLACK_KING_JUMPS)
+
+
+class JumpTreeCache:
+    """
+    Bounded LRU cache of capture trees.
+
+    The capture sequences of one piece depend only on its square, whether it is a king, its
+    side, and which squares within its reach are empty or hold an opponent piece. The key
+    packs those into one int; the value is the list of (path, captured mask, promoted)
+    records generate_capture_records produced for it. Cached records are shared, so callers
+    must not modify them. Past max_entries the least recently used tree is dropped.
+    """
+
+    def __init__(self, max_entries=JUMP_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.trees = OrderedDict()
+        self.bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        self.trees.clear()
+        self.bytes = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Returns the records stored for the key (marking them recently used) or None.
+        """
+        records = self.trees.get(key)
+        if records is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.trees.move_to_end(key)
+        return records
+
+    def put(self, key, records):
+        self.trees[key] = records
+        self.bytes += tree_bytes(records)
+        if len(self.trees) > self.max_entries:
+            _, evicted = self.trees.popitem(last=False)
+            self.bytes -= tree_bytes(evicted)
+            self.evictions += 1
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.trees),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate(),
+            "memory_mb": self.bytes / (1024 * 1024),
+        }
+
+
+def tree_bytes(records) -> int:
+    """
+    Approximate memory held by one cached tree (the records, their paths and masks).
+    """
+    size = sys.getsizeof(records) + ENTRY_OVERHEAD_BYTES
+    for path, captured, _ in records:
+        size += sys.getsizeof(path) + sys.getsizeof(captured) + 64  # 64: record tuple
+    return size
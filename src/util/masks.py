@@ -285,23 +285,6 @@ WHITE_JUMP_SOUTHWEST = {
 }
 
 
-# To find the jumped position given the start and end positions # TODO: can be simplified at the expense of modifying move representation
-JUMP_MASKS = {
-    "JSE": WHITE_JUMP_SOUTHEAST,
-    "JSW": WHITE_JUMP_SOUTHWEST,
-    "JNE": BLACK_JUMP_NORTHEAST,
-    "JNW": BLACK_JUMP_NORTHWEST,
-}
-
-MOVE_MASKS = {
-    "MSE": WHITE_SOUTHEAST,
-    "MSW": WHITE_SOUTHWEST,
-    "MNE": BLACK_NORTHEAST,
-    "MNW": BLACK_NORTHWEST,
-}
-
-DIRECTION_MAP = {"JSE": "MSE", "JSW": "MSW", "JNE": "MNE", "JNW": "MNW"}
-
 S = [1 << i for i in range(32)]
 
 # L3, L5, R3, R5 MASKS inspired by: https://3dkingdoms.com/checkers/bitboards.htm
@@ -348,6 +331,10 @@ SINGLE_CORNER = S[0] | S[31]
 KING_ROW_WHITE = S[0] | S[1] | S[2] | S[3]
 KING_ROW_BLACK = S[28] | S[29] | S[30] | S[31]
 
+# Rows one step from the king row: a man stepping forward from here promotes
+PROMOTION_ROW_WHITE = S[4] | S[5] | S[6] | S[7]
+PROMOTION_ROW_BLACK = S[24] | S[25] | S[26] | S[27]
+
 EDGES = (
     S[0]
     | S[1]
@@ -393,3 +380,71 @@ RANK2 = S[4] | S[5] | S[6] | S[7]
 
 DOUBLE_CORNER = S[3] | S[7] | S[24] | S[28]
 SINGLE_CORNER = S[0] | S[31]
+
+
+def _steps(*directions):
+    return tuple(
+        tuple(direction[pos] for direction in directions if direction[pos] is not None)
+        for pos in range(32)
+    )
+
+
+def _jumps(*directions):
+    """
+    (jumped square, landing square, jumped square mask, landing square mask) per direction.
+    """
+    return tuple(
+        tuple(
+            (move_dir[pos], jump_dir[pos], S[move_dir[pos]], S[jump_dir[pos]])
+            for move_dir, jump_dir in directions
+            if move_dir[pos] is not None and jump_dir[pos] is not None
+        )
+        for pos in range(32)
+    )
+
+
+def _target_masks(table):
+    masks = []
+    for entries in table:
+        mask = 0
+        for entry in entries:
+            mask |= S[entry]
+        masks.append(mask)
+    return tuple(masks)
+
+
+# Per-square move generation tables, indexed by square and computed once from the direction
+# dicts above. Squares off the board are left out, so every entry can be used as is.
+
+# Simple move targets, in the order the generator emits them (own directions first for kings)
+WHITE_MAN_STEPS = _steps(WHITE_SOUTHWEST, WHITE_SOUTHEAST)
+BLACK_MAN_STEPS = _steps(BLACK_NORTHEAST, BLACK_NORTHWEST)
+WHITE_KING_STEPS = tuple(WHITE_MAN_STEPS[i] + BLACK_MAN_STEPS[i] for i in range(32))
+BLACK_KING_STEPS = tuple(BLACK_MAN_STEPS[i] + WHITE_MAN_STEPS[i] for i in range(32))
+
+# Single jumps
+_WHITE_JUMP_DIRECTIONS = (
+    (WHITE_SOUTHEAST, WHITE_JUMP_SOUTHEAST),
+    (WHITE_SOUTHWEST, WHITE_JUMP_SOUTHWEST),
+)
+_BLACK_JUMP_DIRECTIONS = (
+    (BLACK_NORTHEAST, BLACK_JUMP_NORTHEAST),
+    (BLACK_NORTHWEST, BLACK_JUMP_NORTHWEST),
+)
+WHITE_MAN_JUMPS = _jumps(*_WHITE_JUMP_DIRECTIONS)
+BLACK_MAN_JUMPS = _jumps(*_BLACK_JUMP_DIRECTIONS)
+WHITE_KING_JUMPS = _jumps(*_WHITE_JUMP_DIRECTIONS, *_BLACK_JUMP_DIRECTIONS)
+BLACK_KING_JUMPS = _jumps(*_BLACK_JUMP_DIRECTIONS, *_WHITE_JUMP_DIRECTIONS)
+
+# Bitmasks of every square a piece on the square can step to
+WHITE_MAN_STEP_MASKS = _target_masks(WHITE_MAN_STEPS)
+BLACK_MAN_STEP_MASKS = _target_masks(BLACK_MAN_STEPS)
+WHITE_KING_STEP_MASKS = _target_masks(WHITE_KING_STEPS)
+BLACK_KING_STEP_MASKS = _target_masks(BLACK_KING_STEPS)
+
+# JUMPED_SQUARE[start * 32 + end] is the square jumped over, None if start -> end is no jump
+_jumped_square = [None] * (32 * 32)
+for _pos in range(32):
+    for _jumped, _landing, _, _ in WHITE_KING_JUMPS[_pos]:
+        _jumped_square[_pos * 32 + _landing] = _jumped
+JUMPED_SQUARE = tuple(_jumped_square)
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+
+MOVE_CACHE_ENTRIES = 1 << 16  # default bound on cached move lists
+MOVE_CACHE_MB = 32  # default memory cap, so long runs and games stay bounded
+ENTRY_OVERHEAD_BYTES = 200  # key, OrderedDict slot and position tuple of one entry, roughly
+MOVE_BYTES = 72  # one move: a 2-tuple or a short capture path, plus its slot in the tuple
+
+
+class LegalMoveCache:
+    """
+    Bounded LRU cache of legal-move lists keyed by Zobrist key and side to move.
+
+    Each entry keeps the position next to its moves and a lookup only hits when the position
+    matches, so a key collision costs a regeneration rather than wrong moves. Capture paths
+    are frozen into tuples on put and handed back as fresh lists (the capture format
+    everywhere else), so nothing a caller does to its moves reaches the cache. Past
+    max_entries or max_mb the least recently used lists are dropped.
+    """
+
+    def __init__(self, max_entries=MOVE_CACHE_ENTRIES, max_mb=MOVE_CACHE_MB):
+        self.max_entries = max_entries
+        self.max_bytes = max_mb * 1024 * 1024
+        self.entries = OrderedDict()
+        self.bytes = 0
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.evictions = 0
+
+    def clear(self):
+        self.entries.clear()
+        self.bytes = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.evictions = 0
+
+    def get(self, key, position):
+        """
+        Returns the moves stored for the key and position (marking them recently used), or
+        False when there are none. None is a valid result: the side to move has no moves.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False
+        if entry[0] != position:
+            self.misses += 1
+            self.collisions += 1
+            return False
+        self.hits += 1
+        self.entries.move_to_end(key)
+        if entry[3]:
+            return tuple(map(list, entry[1]))
+        return entry[1]
+
+    def put(self, key, position, moves):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[2]
+        size = entry_bytes(moves)
+        captures = bool(moves) and isinstance(moves[0], list)
+        if captures:
+            moves = tuple(map(tuple, moves))
+        self.entries[key] = (position, moves, size, captures)
+        self.bytes += size
+        while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+            _, (_, _, evicted_size, _) = self.entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate(),
+            "memory_mb": self.bytes / (1024 * 1024),
+        }
+
+
+def entry_bytes(moves) -> int:
+    """
+    Approximate memory held by one cached move list, estimated from its length alone so
+    that storing a list stays cheap.
+    """
+    if moves is None:
+        return ENTRY_OVERHEAD_BYTES
+    return ENTRY_OVERHEAD_BYTES + MOVE_BYTES * len(moves)
@@ -0,0 +1,108 @@
+from util.helpers import PlayerTurn
+from util.masks import (
+    JUMPED_SQUARE,
+    KING_ROW_BLACK,
+    KING_ROW_WHITE,
+    MASK_32,
+    S,
+    WHITE_KING_JUMPS,
+)
+
+# A move packed into one int:
+#   bits 0-4   origin square
+#   bits 5-9   landing square
+#   bit 10     promotion (a man lands on its king row)
+#   bit 11     the moving piece is a king
+#   bits 12-43 bitmask of the captured pieces
+# Applying it is one XOR per bitboard (see apply_encoded_move); the captured squares are
+# enough to rebuild the jump path in the tuple/list form (see decode_move).
+SQUARE_BITS = 0x1F
+TO_SHIFT = 5
+PROMOTION_FLAG = 1 << 10
+KING_FLAG = 1 << 11
+CAPTURED_SHIFT = 12
+
+
+def encode_move(move, K, player) -> int:
+    """
+    Packs a move in the tuple/list form into an int. K is the king bitboard before the move.
+    """
+    start_pos, end_pos = move[0], move[-1]
+    captured = 0
+    for i in range(len(move) - 1):
+        jumped_pos = JUMPED_SQUARE[move[i] * 32 + move[i + 1]]
+        if jumped_pos is not None:
+            captured |= S[jumped_pos]
+
+    encoded = start_pos | end_pos << TO_SHIFT | captured << CAPTURED_SHIFT
+    if K & S[start_pos]:
+        encoded |= KING_FLAG
+    else:
+        king_row = KING_ROW_WHITE if player == PlayerTurn.WHITE else KING_ROW_BLACK
+        if S[end_pos] & king_row:
+            encoded |= PROMOTION_FLAG
+    return encoded
+
+
+def move_from(encoded) -> int:
+    return encoded & SQUARE_BITS
+
+
+def move_to(encoded) -> int:
+    return encoded >> TO_SHIFT & SQUARE_BITS
+
+
+def captured_mask(encoded) -> int:
+    return encoded >> CAPTURED_SHIFT
+
+
+def decode_move(encoded, occupied=0):
+    """
+    Unpacks an encoded move into the tuple/list form: a tuple for a simple move, a list of
+    squares for a jump sequence. The path is rebuilt by following jumps over the captured
+    squares until all are taken and the landing square is reached. Pass the occupied squares
+    of the board to skip paths that land on a piece (only possible for kings capturing in a
+    loop, where either direction leads to the same position).
+    """
+    start_pos, end_pos = move_from(encoded), move_to(encoded)
+    captured = captured_mask(encoded)
+    if not captured:
+        return (start_pos, end_pos)
+
+    occupied &= ~S[start_pos] & MASK_32
+    path = [start_pos]
+
+    def extend(pos, remaining):
+        if not remaining:
+            return pos == end_pos
+        for _, landing, jumped_mask, landing_mask in WHITE_KING_JUMPS[pos]:
+            if remaining & jumped_mask and not occupied & landing_mask:
+                path.append(landing)
+                if extend(landing, remaining ^ jumped_mask):
+                    return True
+                path.pop()
+        return False
+
+    if not extend(start_pos, captured):
+        raise ValueError(f"No jump path for encoded move {encoded:#x}")
+    return path
+
+
+def apply_encoded_move(WP, BP, K, encoded, player):
+    """
+    Returns the board after the encoded move: the mover's pieces, the opponent's pieces and
+    the kings each change by a single XOR.
+    """
+    start_pos, end_pos = encoded & SQUARE_BITS, encoded >> TO_SHIFT & SQUARE_BITS
+    captured = encoded >> CAPTURED_SHIFT
+    moved = S[start_pos] ^ S[end_pos]  # 0 when a king returns to its origin
+
+    king_change = K & captured
+    if encoded & KING_FLAG:
+        king_change ^= moved
+    elif encoded & PROMOTION_FLAG:
+        king_change ^= S[end_pos]
+
+    if player == PlayerTurn.WHITE:
+        return WP ^ moved, BP ^ captured, K ^ king_change
+    return WP ^ captured, BP ^ moved, K ^ king_change
@@ -0,0 +1,38 @@
+import os
+import random
+
+from util.bitboard import bit_indices
+from util.helpers import PlayerTurn
+from util.masks import MASK_32
+
+ZOBRIST_SEED = 469  # Fixed seed so keys (and therefore TT behaviour) are reproducible.
+
+# Verify every incrementally updated key against a full recompute (slow, for debugging).
+ZOBRIST_DEBUG = os.environ.get("CHECKERS_ZOBRIST_DEBUG") == "1"
+
+_rng = random.Random(ZOBRIST_SEED)
+
+# One 64-bit key per (piece type, square) plus one for the side to move.
+WHITE_MAN_KEYS = [_rng.getrandbits(64) for _ in range(32)]
+WHITE_KING_KEYS = [_rng.getrandbits(64) for _ in range(32)]
+BLACK_MAN_KEYS = [_rng.getrandbits(64) for _ in range(32)]
+BLACK_KING_KEYS = [_rng.getrandbits(64) for _ in range(32)]
+WHITE_TO_MOVE_KEY = _rng.getrandbits(64)
+
+
+def hash_position(WP, BP, K, turn) -> int:
+    """
+    Returns the 64-bit Zobrist key of the position (WP, BP, K) with the given side to move.
+    """
+    key = WHITE_TO_MOVE_KEY if turn == PlayerTurn.WHITE else 0
+
+    for index in bit_indices(WP & ~K & MASK_32):
+        key ^= WHITE_MAN_KEYS[index]
+    for index in bit_indices(WP & K & MASK_32):
+        key ^= WHITE_KING_KEYS[index]
+    for index in bit_indices(BP & ~K & MASK_32):
+        key ^= BLACK_MAN_KEYS[index]
+    for index in bit_indices(BP & K & MASK_32):
+        key ^= BLACK_KING_KEYS[index]
+
+    return key
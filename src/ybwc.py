@@ -0,0 +1,307 @@
+import multiprocessing
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+parent = pathlib.Path(__file__).parent.absolute()
+sys.path.append(str(parent))
+
+from checkers import *
+from checkers import PlayerTurn, do_move, generate_legal_moves
+from minimax_alphabeta import QUIESCENCE_DEPTH, minimax, sort_moves_by_heuristic
+from move_ordering import MoveOrderer
+from time_control import TimeControl, TimeOutException
+from transposition_table import TranspositionTable
+
+MIN_SPLIT_DEPTH = 4  # nodes with less depth left are searched serially by whoever reaches them
+MAX_SPLIT_POINTS = 4096  # abort flags, reused round-robin
+TT_SIZE_MB = 16  # per process
+
+# Persistent pool, started on first use. ABORT_FLAGS has one byte per split point; a parent
+# that gets a cutoff sets its split point's byte to stop the siblings still being searched.
+YBWC_POOL = None
+ABORT_FLAGS = None
+_next_split_point = 0
+
+# Worker process state, set by _init_worker
+_abort_flags = None
+_worker_table = None
+_worker_root = None
+
+
+class AbortFlag:
+    """
+    One byte of a shared flag array with the set()/is_set() interface of an Event, so it can
+    be a TimeControl's stop_event.
+    """
+
+    def __init__(self, flags, index):
+        self.flags = flags
+        self.index = index
+
+    def set(self):
+        self.flags[self.index] = 1
+
+    def is_set(self) -> bool:
+        return self.flags[self.index] != 0
+
+
+def _init_worker(abort_flags):
+    global _abort_flags
+    _abort_flags = abort_flags
+
+
+def get_ybwc_pool(workers=None):
+    """
+    Returns the YBWC worker pool, starting it with the given number of workers
+    (default: one per CPU core) if it is not running yet.
+    """
+    global YBWC_POOL, ABORT_FLAGS
+    if YBWC_POOL is None:
+        ABORT_FLAGS = multiprocessing.RawArray("b", MAX_SPLIT_POINTS)
+        YBWC_POOL = ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(ABORT_FLAGS,),
+        )
+    return YBWC_POOL
+
+
+def shutdown_ybwc_pool():
+    global YBWC_POOL, ABORT_FLAGS
+    if YBWC_POOL is not None:
+        YBWC_POOL.shutdown(cancel_futures=True)
+        YBWC_POOL = ABORT_FLAGS = None
+
+
+def _search_young_brother(
+    position,
+    depth,
+    alpha,
+    beta,
+    current_player,
+    current_depth,
+    global_board_state,
+    heuristic,
+    quiescence_depth,
+    split_point,
+    deadline,
+):
+    """
+    Worker side: searches one sibling serially with minimax_alphabeta.minimax.
+        Output: WHITE-relative score, or None if the split point was aborted or time ran out
+    """
+    global _worker_table, _worker_root
+    # Table entries depend on global_board_state, so the table only lives for one root.
+    if _worker_root != global_board_state:
+        _worker_table = TranspositionTable(TT_SIZE_MB)
+        _worker_root = global_board_state
+
+    seconds_left = float("inf") if deadline is None else deadline - time.time()
+    time_control = TimeControl(
+        seconds_left, stop_event=AbortFlag(_abort_flags, split_point)
+    )
+    try:
+        _, score = minimax(
+            position,
+            depth,
+            alpha,
+            beta,
+            current_player,
+            current_depth=current_depth,
+            global_board_state=global_board_state,
+            heuristic=heuristic,
+            transposition_table=_worker_table,
+            move_orderer=MoveOrderer(),
+            quiescence_depth=quiescence_depth,
+            time_control=time_control,
+        )
+    except TimeOutException:
+        return None
+    return score
+
+
+def _new_split_point():
+    global _next_split_point
+    split_point = _next_split_point
+    _next_split_point = (_next_split_point + 1) % MAX_SPLIT_POINTS
+    ABORT_FLAGS[split_point] = 0
+    return split_point
+
+
+def ybwc(
+    position,
+    depth,
+    alpha,
+    beta,
+    current_player,
+    current_depth=0,
+    global_board_state=None,
+    heuristic=None,
+    quiescence_depth=QUIESCENCE_DEPTH,
+    pool=None,
+    min_split_depth=MIN_SPLIT_DEPTH,
+    time_control=None,
+    deadline=None,
+    transposition_table=None,
+):
+    """
+    Young Brothers Wait alpha-beta, WHITE-relative like minimax. The first (eldest) child of
+    every node is searched serially; once it has set the bound, the remaining children are
+    sent to the pool with the current window. A cutoff cancels the queued siblings and sets
+    the split point's abort flag for the running ones. Nodes with less than min_split_depth
+    plies left, and every node when pool is None, are searched with plain minimax.
+        Output: (best move, score)
+    """
+    serial = pool is None or depth < min_split_depth
+    legal_moves = generate_legal_moves(*position, current_player)
+    if serial or not legal_moves:
+        return minimax(
+            position,
+            depth,
+            alpha,
+            beta,
+            current_player,
+            current_depth=current_depth,
+            is_root=True,
+            global_board_state=global_board_state,
+            heuristic=heuristic,
+            transposition_table=transposition_table,
+            move_orderer=MoveOrderer(),
+            quiescence_depth=quiescence_depth,
+            time_control=time_control,
+        )
+
+    maximizing = current_player == PlayerTurn.WHITE
+    opponent = switch_player(current_player)
+    legal_moves = sort_moves_by_heuristic(
+        legal_moves, position, current_player, current_depth
+    )
+
+    def child(move):
+        return do_move(*position, move, current_player)
+
+    # Eldest brother: searched here, recursively splitting further down.
+    best_move = legal_moves[0]
+    _, best_score = ybwc(
+        child(best_move),
+        depth - 1,
+        alpha,
+        beta,
+        opponent,
+        current_depth + 1,
+        global_board_state,
+        heuristic,
+        quiescence_depth,
+        pool,
+        min_split_depth,
+        time_control,
+        deadline,
+        transposition_table,
+    )
+    if maximizing:
+        alpha = max(alpha, best_score)
+    else:
+        beta = min(beta, best_score)
+    if beta <= alpha or len(legal_moves) == 1:
+        return best_move, best_score
+
+    # Young brothers: searched in parallel with the bound the eldest one established.
+    split_point = _new_split_point()
+    futures = {
+        pool.submit(
+            _search_young_brother,
+            child(move),
+            depth - 1,
+            alpha,
+            beta,
+            opponent,
+            current_depth + 1,
+            global_board_state,
+            heuristic,
+            quiescence_depth,
+            split_point,
+            deadline,
+        ): move
+        for move in legal_moves[1:]
+    }
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            if time_control is not None and time_control.hard_expired():
+                raise TimeOutException()
+            for future in done:
+                score = future.result()
+                if score is None:  # only happens once the deadline has passed
+                    raise TimeOutException()
+                if (maximizing and score > best_score) or (
+                    not maximizing and score < best_score
+                ):
+                    best_move, best_score = futures[future], score
+                if maximizing:
+                    alpha = max(alpha, score)
+                else:
+                    beta = min(beta, score)
+            if beta <= alpha:
+                break  # cutoff: the remaining siblings cannot change the result
+    finally:
+        ABORT_FLAGS[split_point] = 1
+        for future in pending:
+            future.cancel()
+
+    return best_move, best_score
+
+
+def ybwc_AI(
+    position,
+    current_player,
+    max_depth=9999,
+    time_limit=5,
+    heuristic="smart",
+    global_board_state=None,
+    workers=None,
+    min_split_depth=MIN_SPLIT_DEPTH,
+    quiescence_depth=QUIESCENCE_DEPTH,
+):
+    """
+    Iterative deepening over ybwc with the persistent worker pool (see get_ybwc_pool).
+    workers=0 runs the same search serially in this process.
+        Output: (best move, depth reached)
+    """
+    pool = get_ybwc_pool(workers) if workers != 0 else None
+    time_control = TimeControl(time_limit)
+    transposition_table = TranspositionTable(TT_SIZE_MB)  # for the nodes searched here
+    deadline = time.time() + time_limit  # wall clock: shared with the workers
+    legal_moves = generate_legal_moves(*position, current_player)
+    best_move = legal_moves[0] if legal_moves else None
+    depth_reached = 0
+
+    try:
+        for depth in range(1, max_depth + 1):
+            move, _ = ybwc(
+                position,
+                depth,
+                float("-inf"),
+                float("inf"),
+                current_player,
+                global_board_state=global_board_state,
+                heuristic=heuristic,
+                quiescence_depth=quiescence_depth,
+                pool=pool,
+                min_split_depth=min_split_depth,
+                time_control=time_control,
+                deadline=deadline,
+                transposition_table=transposition_table,
+            )
+            if move is not None:
+                best_move = move
+            depth_reached = depth
+            if time_control.soft_expired():
+                break
+    except TimeOutException:
+        pass
+
+    return best_move, depth_reached
@@ -0,0 +1,276 @@
+import pathlib
+import sys
+
+# Kept out of src/ so the engine carries a single move generator.
+parent = pathlib.Path(__file__).parent.parent.absolute()
+sys.path.append(str(parent / "src"))
+
+from util.helpers import MASK_32, PlayerTurn, get_fresh_board, switch_player
+
+# Padded ("ghost square") layout: a ghost bit follows every even row (A1-G1, A3-G3...),
+# so square i of the 32-square layout sits at bit i + (i + 4) // 8 of a 36-bit board:
+#
+#   row 7: 32 33 34 35     row 3: 14 15 16 17
+#   row 6: 27 28 29 30     row 2:  9 10 11 12
+#   ghost: 31              ghost: 13
+#   row 5: 23 24 25 26     row 1:  5  6  7  8
+#   row 4: 18 19 20 21     ghost:  4
+#   ghost: 22              row 0:  0  1  2  3
+#
+# Every diagonal step is then +4 or +5 (north) and -4 or -5 (south) from any square, and
+# a jump is +8/+10 or -8/-10 with the jumped piece halfway. Stepping off the side of the
+# board lands on a ghost square, which is never empty or occupied, so no per-row masks
+# (MASK_L3, MASK_R5, ...) are needed. Moves use padded square indices throughout.
+#
+# This is an experiment measured by perft (benchmark.compare_padded_layout), not part of
+# the engine: get_fresh_board and load_game_from_sable_file stay on the 32-square layout,
+# which the move format, jump tables, Zobrist keys, heuristics and UI all index.
+
+PADDED_SQUARE = tuple(index + (index + 4) // 8 for index in range(32))
+SQUARE_OF_PADDED = {padded: index for index, padded in enumerate(PADDED_SQUARE)}
+
+PADDED_BOARD = sum(1 << padded for padded in PADDED_SQUARE)  # the 32 real squares
+GHOST_SQUARES = (1 << 36) - 1 ^ PADDED_BOARD  # bits 4, 13, 22, 31
+PADDED_KING_ROW_WHITE = 0b1111  # row 0, where white men are crowned
+PADDED_KING_ROW_BLACK = 0b1111 << 32  # row 7, where black men are crowned
+
+
+def to_padded(bitboard: int) -> int:
+    """
+    Converts a 32-square bitboard to the padded layout.
+    """
+    return (
+        bitboard & 0xF
+        | (bitboard & 0xFF0) << 1
+        | (bitboard & 0xFF000) << 2
+        | (bitboard & 0xFF00000) << 3
+        | (bitboard & 0xF0000000) << 4
+    )
+
+
+def from_padded(bitboard: int) -> int:
+    """
+    Converts a padded bitboard back to the 32-square layout. Ghost bits are dropped.
+    """
+    return (
+        bitboard & 0xF
+        | bitboard >> 1 & 0xFF0
+        | bitboard >> 2 & 0xFF000
+        | bitboard >> 3 & 0xFF00000
+        | bitboard >> 4 & 0xF0000000
+    ) & MASK_32
+
+
+def to_padded_move(move):
+    """
+    Converts a move in 32-square indices (tuple or list form) to padded indices.
+    """
+    squares = [PADDED_SQUARE[square] for square in move]
+    return squares if isinstance(move, list) else tuple(squares)
+
+
+def from_padded_move(move):
+    """
+    Converts a move in padded indices (tuple or list form) back to 32-square indices.
+    """
+    squares = [SQUARE_OF_PADDED[square] for square in move]
+    return squares if isinstance(move, list) else tuple(squares)
+
+
+def get_padded_fresh_board() -> tuple:
+    """
+    Returns the fresh board (see get_fresh_board) in the padded layout.
+    """
+    return tuple(to_padded(bitboard) for bitboard in get_fresh_board())
+
+
+def get_padded_movers(WP, BP, K, player) -> int:
+    """
+    Returns the player's pieces that can make a simple move, one shift per direction.
+    """
+    empty = PADDED_BOARD & ~(WP | BP)
+    if player == PlayerTurn.WHITE:
+        own, kings, forward, backward = WP, WP & K, _south, _north
+    else:
+        own, kings, forward, backward = BP, BP & K, _north, _south
+    movers = forward(empty, 4) | forward(empty, 5)
+    if kings:
+        movers |= (backward(empty, 4) | backward(empty, 5)) & kings
+    return movers & own
+
+
+def get_padded_jumpers(WP, BP, K, player) -> int:
+    """
+    Returns the player's pieces that can make a capture, one shift per direction.
+    """
+    empty = PADDED_BOARD & ~(WP | BP)
+    if player == PlayerTurn.WHITE:
+        own, opponent, kings, forward, backward = WP, BP, WP & K, _south, _north
+    else:
+        own, opponent, kings, forward, backward = BP, WP, BP & K, _north, _south
+    jumpers = forward(forward(empty, 4) & opponent, 4)
+    jumpers |= forward(forward(empty, 5) & opponent, 5)
+    if kings:
+        backward_jumpers = backward(backward(empty, 4) & opponent, 4)
+        backward_jumpers |= backward(backward(empty, 5) & opponent, 5)
+        jumpers |= backward_jumpers & kings
+    return jumpers & own
+
+
+def _north(targets, shift):
+    """
+    Squares that reach one of targets by moving north (up the board) by shift.
+    """
+    return targets >> shift
+
+
+def _south(targets, shift):
+    """
+    Squares that reach one of targets by moving south (down the board) by shift.
+    """
+    return targets << shift
+
+
+def generate_padded_moves(WP, BP, K, player):
+    """
+    Returns the legal moves of the player on a padded board, in padded indices: a list of
+    paths if there is a capture, otherwise (start, end) tuples. None if there are no moves.
+    Lists the same moves as generate_legal_moves, in a different order.
+    """
+    jumpers = get_padded_jumpers(WP, BP, K, player)
+    if jumpers:
+        records = generate_padded_captures(WP, BP, K, jumpers, player)
+        return [path for path, _, _ in records]
+
+    movers = get_padded_movers(WP, BP, K, player)
+    if not movers:
+        return None
+    empty = PADDED_BOARD & ~(WP | BP)
+    if player == PlayerTurn.WHITE:
+        kings, forward, backward, sign = movers & K, _south, _north, -1
+    else:
+        kings, forward, backward, sign = movers & K, _north, _south, 1
+    simple_moves = []
+    for shift in (4, 5):
+        add_padded_simple_moves(
+            simple_moves, forward(empty, shift) & movers, sign * shift
+        )
+        if kings:
+            add_padded_simple_moves(
+                simple_moves, backward(empty, shift) & kings, -sign * shift
+            )
+    return simple_moves
+
+
+def add_padded_simple_moves(simple_moves, movers, step):
+    """
+    Appends (pos, pos + step) to simple_moves for every set bit of movers, lowest bit first.
+    """
+    while movers:
+        lowest = movers & -movers
+        pos = lowest.bit_length() - 1
+        simple_moves.append((pos, pos + step))
+        movers ^= lowest
+
+
+def generate_padded_captures(WP, BP, K, jumpers, player):
+    """
+    Returns a (path, captured mask, promoted) record for every complete capture sequence of
+    the given jumpers, following the same rules as generate_capture_records.
+    """
+    if player == PlayerTurn.WHITE:
+        opponent_pieces, men_steps, king_row = BP, (-4, -5), PADDED_KING_ROW_WHITE
+    else:
+        opponent_pieces, men_steps, king_row = WP, (4, 5), PADDED_KING_ROW_BLACK
+    king_steps = (4, 5, -4, -5)
+
+    empty = PADDED_BOARD & ~(WP | BP)
+    records = []
+    while jumpers:
+        pos_mask = jumpers & -jumpers
+        jumpers ^= pos_mask
+        if K & pos_mask:  # kings are never crowned again, so no king row for them
+            steps, crown_row = king_steps, 0
+        else:
+            steps, crown_row = men_steps, king_row
+        path = [pos_mask.bit_length() - 1]
+        extend_padded_captures(
+            steps, crown_row, path, empty | pos_mask, opponent_pieces, 0, records
+        )
+    return records
+
+
+def extend_padded_captures(
+    steps, king_row, path, empty, opponent_pieces, captured, records
+):
+    """
+    Padded counterpart of checkers.extend_captures: the jumped square is one step from the
+    last square of path and the landing square two steps.
+    """
+    pos = path[-1]
+    extended = False
+    for step in steps:
+        jumped, landing = pos + step, pos + 2 * step
+        if landing < 0:  # off the bottom edge; the top edge only has zero bits past it
+            continue
+        if opponent_pieces >> jumped & 1 and empty >> landing & 1:
+            extended = True
+            jumped_mask = 1 << jumped
+            path.append(landing)
+            if king_row >> landing & 1:  # crowned: the move ends here
+                records.append((path[:], captured | jumped_mask, True))
+            else:
+                extend_padded_captures(
+                    steps,
+                    king_row,
+                    path,
+                    empty | jumped_mask,
+                    opponent_pieces ^ jumped_mask,
+                    captured | jumped_mask,
+                    records,
+                )
+            path.pop()
+
+    if not extended and captured:
+        records.append((path[:], captured, False))
+
+
+def do_padded_move(WP, BP, K, move, player):
+    """
+    Plays a move in padded indices (tuple or list form) on a padded board.
+        Output: WP, BP, K
+    """
+    start_pos, end_pos = move[0], move[-1]
+    moved = 1 << start_pos ^ 1 << end_pos
+    captured = 0
+    if isinstance(move, list):
+        for pos, landing in zip(move, move[1:]):
+            captured |= 1 << (pos + landing >> 1)  # the jumped square is halfway
+
+    if K & 1 << start_pos:
+        K ^= moved
+    elif 1 << end_pos & (
+        PADDED_KING_ROW_WHITE if player == PlayerTurn.WHITE else PADDED_KING_ROW_BLACK
+    ):
+        K |= 1 << end_pos
+    K &= ~captured
+
+    if player == PlayerTurn.WHITE:
+        return WP ^ moved, BP & ~captured, K
+    return WP & ~captured, BP ^ moved, K
+
+
+def padded_perft(WP, BP, K, player, depth) -> int:
+    """
+    Counts the leaf nodes depth plies below a padded position, like perft.perft.
+    """
+    legal_moves = generate_padded_moves(WP, BP, K, player)
+    if not legal_moves:
+        return 0
+    if depth == 1:
+        return len(legal_moves)
+    next_player = switch_player(player)
+    return sum(
+        padded_perft(*do_padded_move(WP, BP, K, move, player), next_player, depth - 1)
+        for move in legal_moves
+    )